@@ -1,16 +1,18 @@
+import hashlib
+import json
 import os
-import threading
 import time
-import json
-from pathlib import Path
+from io import BytesIO
 import uvicorn
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Form, HTTPException, Response
+from fastapi import FastAPI, Form, HTTPException, Request, Response
 from starlette.responses import JSONResponse
+from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
 from docling.datamodel.base_models import InputFormat
+from docling.datamodel.document import InputDocument
 from docling.datamodel.pipeline_options import (
     PdfPipelineOptions,
     EasyOcrOptions,
@@ -18,6 +20,12 @@ from docling.datamodel.pipeline_options import (
 )
 from typing import Optional, Tuple, Literal
 from docling.document_converter import DocumentConverter, PdfFormatOption
+from docling.exceptions import ConversionCancelled
+from docling.utils.cancellation import CancellationGroup, CancellationToken
+from docling.utils.job_scheduler import JobScheduler, estimate_cost
+from docling.utils.object_storage import DownloadedObject, ObjectLocation, ObjectStore
+from docling.utils.serialization import write_document_json
+from docling.utils.singleflight import KeyedLocks, ResultCache, SingleFlight
 import logging
 import boto3
 import codecs
@@ -36,165 +44,240 @@ s3_oss_client = boto3.client(
     's3',
     aws_access_key_id=access_key_id,
     aws_secret_access_key=secret_access_key,
-    endpoint_url="https://oss-cn-hongkong.aliyuncs.com",
+    endpoint_url=endpoint or "https://oss-cn-hongkong.aliyuncs.com",
     config=Config(s3={"addressing_style": "virtual"},
                   signature_version='s3'))
 
 
-BASE_DIR = Path(__file__).resolve().parent
-INPUT_DIR = BASE_DIR / "input"
-OUTPUT_DIR = BASE_DIR / "output"
-
-os.makedirs(OUTPUT_DIR, exist_ok=True)
-os.makedirs(INPUT_DIR, exist_ok=True)
+object_store = ObjectStore({"s3": s3_client, "oss": s3_oss_client})
 
-
-GLOBAL_LOCK_MANAGER = threading.Lock() 
-PROCESSING_INPUT_LOCKS = {} 
-PROCESSING_OUTPUT_LOCKS = {} 
+# Concurrent requests for the same (input, output, ETag, options) share a single
+# conversion; finished results are cached by the same key so that retried
+# requests return immediately.
+INFLIGHT_JOBS = SingleFlight()
+OUTPUT_LOCKS = KeyedLocks()
+RESULT_CACHE: ResultCache[str] = ResultCache(
+    max_entries=int(os.getenv("RESULT_CACHE_SIZE", "1024")),
+    ttl=float(os.getenv("RESULT_CACHE_TTL", "3600")),
+)
+# A conversion stops once every client waiting for it has disconnected, or
+# after OCR_REQUEST_TIMEOUT seconds (0: no limit).
+JOB_CANCELLATION = CancellationGroup()
+REQUEST_TIMEOUT = float(os.getenv("OCR_REQUEST_TIMEOUT", "0")) or None
+DISCONNECT_POLL_INTERVAL = 1.0
+
+# OCR_WORKERS conversions run at the same time, the waiting one with the
+# smallest size-aware fair-share tag goes next (see utils.job_scheduler). Jobs
+# of at least OCR_PREEMPT_MIN_PAGES pages give their worker back between page
+# batches when a shorter job waits. The executor threads beyond OCR_WORKERS
+# download inputs and wait for a worker.
+SCHEDULER = JobScheduler(
+    max_running=int(os.getenv("OCR_WORKERS", "4")),
+    preempt_min_cost=float(os.getenv("OCR_PREEMPT_MIN_PAGES", "100")) or None,
+)
 
 docling_converter: Optional[DocumentConverter] = None
-executor = ThreadPoolExecutor(max_workers=4) 
-
-def perform_ocr(input_s3_path: str, output_s3_path: str):
+converter_options_hash: Optional[str] = None
+executor = ThreadPoolExecutor(max_workers=int(os.getenv("OCR_MAX_REQUESTS", "64")))
+
+def perform_ocr(
+    input_s3_path: str,
+    output_s3_path: str,
+    cancel_token: Optional[CancellationToken] = None,
+    tenant: str = "default",
+    priority: int = 0,
+):
     if docling_converter is None:
         raise RuntimeError("DocumentConverter has not been initialized.")
 
     logging.info(f"start to deal with: {input_s3_path}")
 
-    is_s3 = False
-    if input_s3_path.startswith("s3://") and output_s3_path.startswith("s3://"):
-        is_s3 = True
-    elif input_s3_path.startswith("oss://") and input_s3_path.startswith("oss://"):
-        is_s3 = False
-    else:
+    try:
+        source = ObjectLocation.parse(input_s3_path)
+        target = ObjectLocation.parse(output_s3_path)
+    except ValueError as e:
         raise RuntimeError(f"must use s3 or oss. {str(e)}") from e
-    
-    def parse_s3_path(s3_path: str):
-        if is_s3:
-            s3_path = s3_path.replace("s3://", "")
-        else:
-            s3_path = s3_path.replace("oss://", "")
-        bucket, *key_parts = s3_path.split("/")
-        return bucket, "/".join(key_parts)
+    if source.scheme not in ("s3", "oss") or source.scheme != target.scheme:
+        raise RuntimeError(
+            f"must use s3 or oss for both input and output: {input_s3_path}, {output_s3_path}"
+        )
 
-    file_bucket, file_key = parse_s3_path(input_s3_path)
-    input_file_path = INPUT_DIR / file_bucket / file_key
-    input_file_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        etag = object_store.head(source).get("ETag")
+    except Exception as e:
+        raise RuntimeError(f"Failed to download file from S3/oss: {str(e)}") from e
 
+    job_key = (input_s3_path, output_s3_path, etag, converter_options_hash)
+    cached = RESULT_CACHE.get(job_key)
+    if cached is not None:
+        logging.info(f"return cached result: {input_s3_path} (ETag {etag})")
+        return cached
 
-    
-    with GLOBAL_LOCK_MANAGER:
-        if input_s3_path not in PROCESSING_INPUT_LOCKS:
-            PROCESSING_INPUT_LOCKS[input_s3_path] = threading.Lock()
-        if output_s3_path not in PROCESSING_OUTPUT_LOCKS:
-            PROCESSING_OUTPUT_LOCKS[output_s3_path] = threading.Lock()
-    input_lock = PROCESSING_INPUT_LOCKS[input_s3_path]
-    output_lock = PROCESSING_OUTPUT_LOCKS[output_s3_path]
-    
-    with input_lock:
-        with output_lock:
-
-        # download file from S3
-            try:
-                if is_s3:
-                    s3_client.download_file(
-                        Bucket=file_bucket,
-                        Key=file_key,
-                        Filename=str(input_file_path)
-                    )
-                else:
-                    s3_oss_client.download_file(
-                        Bucket=file_bucket,
-                        Key=file_key,
-                        Filename=str(input_file_path)
-                    )
-                logging.info(f"download from s3/oss successfully: {input_s3_path}")
-            except Exception as e:
-                raise RuntimeError(f"Failed to download file from S3/oss: {str(e)}") from e
-
-
-            output_bucket, output_key = parse_s3_path(output_s3_path)
-            output_key = output_key + "/" + output_s3_path.rstrip("/").split("/")[-1]
-            output_file_path = OUTPUT_DIR / output_bucket / output_key
-            output_md_path = output_file_path.with_suffix(".md")
-            output_json_path = output_file_path.with_suffix(".json")
-            output_json_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # convert the file
-            try:
-                doc = docling_converter.convert(str(input_file_path)).document
-                md_content = doc.export_to_markdown()
-                with open(output_md_path, "w", encoding="utf-8") as f:
-                    f.write(md_content)
-                with open(output_json_path, "w", encoding="utf-8") as f:
-                    json.dump(doc.export_to_dict(), f, ensure_ascii=False, indent=4)
-
-                logging.info(f"task finish: {input_s3_path}")
-
-            except Exception as e:
-                raise RuntimeError(f"An error occurred when processing the file {input_s3_path}: {e}") from e
-            
-            # upload the file to S3
+    caller_token = cancel_token or CancellationToken()
+    with JOB_CANCELLATION.join(job_key, caller_token) as job_token:
+        while True:
             try:
-                if is_s3:
-                    s3_client.upload_file(
-                        Bucket=output_bucket,
-                        Key=f"{output_key}.md",
-                        Filename=str(output_md_path)
-                    )
-                    s3_client.upload_file(
-                        Bucket=output_bucket,
-                        Key=f"{output_key}.json",
-                        Filename=str(output_json_path)
-                    )
-                else:
-                    s3_oss_client.upload_file(
-                        Bucket=output_bucket,
-                        Key=f"{output_key}.md",
-                        Filename=str(output_md_path)
-                    )
-                    s3_oss_client.upload_file(
-                        Bucket=output_bucket,
-                        Key=f"{output_key}.json",
-                        Filename=str(output_json_path)
-                    )
-                logging.info(f"upload from s3/oss successfully: {output_file_path}")
-            except Exception as e:
-                raise RuntimeError(f"Failed to upload file from S3/oss: {str(e)}") from e
-        
-            # finally:
-            #     try:
-            #         os.remove(input_file_path)
-            #         if 'output_md_path' in locals() and os.path.exists(output_md_path):
-            #             os.remove(output_md_path)
-            #         if 'output_json_path' in locals() and os.path.exists(output_json_path):
-            #             os.remove(output_json_path)
-            #     except OSError as e:
-            #         logging.warning(f"Failed to clear the temporary files: {e}")
+                md_content, shared = INFLIGHT_JOBS.do(
+                    job_key,
+                    lambda: _run_ocr_job(
+                        input_s3_path,
+                        output_s3_path,
+                        source,
+                        target,
+                        job_token,
+                        tenant,
+                        priority,
+                    ),
+                )
+                break
+            except ConversionCancelled:
+                # The flight joined was cancelled by its own callers, who all
+                # left before this one came: run the job again for this caller.
+                if job_token.cancelled or caller_token.cancelled:
+                    raise
+                logging.info(f"in-flight task was cancelled, restarting: {input_s3_path}")
+    if shared:
+        logging.info(f"attached to the in-flight task: {input_s3_path}")
     return md_content
 
 
+def _run_ocr_job(
+    input_s3_path: str,
+    output_s3_path: str,
+    source: ObjectLocation,
+    target: ObjectLocation,
+    cancel_token: CancellationToken,
+    tenant: str,
+    priority: int,
+):
+    # Different inputs may target the same output, serialize their uploads.
+    with OUTPUT_LOCKS.lock(output_s3_path):
+
+        # download file from S3 straight into memory
+        try:
+            downloaded = object_store.download(source)
+            logging.info(
+                f"download from s3/oss successfully: {input_s3_path} "
+                f"({downloaded.size} bytes, sha256 {downloaded.sha256})"
+            )
+        except Exception as e:
+            raise RuntimeError(f"Failed to download file from S3/oss: {str(e)}") from e
+
+        etag = downloaded.etag
+        output_key = target.key + "/" + output_s3_path.rstrip("/").split("/")[-1]
+
+        cost = estimate_cost(count_pages(downloaded), downloaded.size)
+
+        # convert the file
+        try:
+            with SCHEDULER.run(
+                cost, tenant=tenant, priority=priority, cancel_token=cancel_token
+            ) as job:
+                logging.info(
+                    f"start converting: {input_s3_path} (cost {cost:.1f}, tenant {tenant})"
+                )
+                doc = docling_converter.convert(
+                    downloaded.as_document_stream(),
+                    cancel_token=cancel_token,
+                    preemption_point=job.preemption_point,
+                ).document
+            del downloaded
+            # Partial results of a cancelled job are neither uploaded nor cached
+            cancel_token.raise_if_cancelled()
+            md_content = doc.export_to_markdown()
+            md_buf = BytesIO(md_content.encode("utf-8"))
+            # Streamed item by item, without building the export dict.
+            json_buf = BytesIO()
+            write_document_json(doc, json_buf)
+
+            logging.info(f"task finish: {input_s3_path}")
+
+        except ConversionCancelled:
+            raise
+        except Exception as e:
+            raise RuntimeError(f"An error occurred when processing the file {input_s3_path}: {e}") from e
+
+        # upload both outputs concurrently from memory
+        try:
+            object_store.upload_many(
+                [
+                    (
+                        target.with_key(f"{output_key}.md"),
+                        md_buf,
+                        "text/markdown; charset=utf-8",
+                    ),
+                    (
+                        target.with_key(f"{output_key}.json"),
+                        json_buf,
+                        "application/json",
+                    ),
+                ]
+            )
+            logging.info(f"upload from s3/oss successfully: {target.with_key(output_key)}")
+        except Exception as e:
+            raise RuntimeError(f"Failed to upload file from S3/oss: {str(e)}") from e
+
+    if etag is not None:
+        RESULT_CACHE.put(
+            (input_s3_path, output_s3_path, etag, converter_options_hash), md_content
+        )
+    return md_content
+
+
+def count_pages(downloaded: DownloadedObject) -> int:
+    """Page count of a PDF input, 0 if it is not one."""
+    stream = downloaded.as_document_stream()
+    if stream.stream.read(5) != b"%PDF-":
+        return 0
+    stream.stream.seek(0)
+    try:
+        in_doc = InputDocument(
+            path_or_stream=stream.stream,
+            format=InputFormat.PDF,
+            backend=PyPdfiumDocumentBackend,
+            filename=stream.name,
+        )
+    except Exception:
+        return 0
+    page_count = in_doc.page_count if in_doc.valid else 0
+    if in_doc.valid:
+        in_doc._backend.unload()
+    return page_count
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    global docling_converter
+    global docling_converter, converter_options_hash
     logging.info("Initializing DocumentConverter...")
     loop = asyncio.get_event_loop()
     docling_converter = await loop.run_in_executor(executor, initialize_converter)
+    converter_options_hash = options_hash(docling_converter)
     logging.info("DocumentConverter Initialized.")
-    logging.info(f"The service is ready. The number of working threads is {executor._max_workers}")
+    logging.info(
+        f"The service is ready. {SCHEDULER.max_running} conversion workers, "
+        f"{executor._max_workers} request threads"
+    )
     
     yield
 
     executor.shutdown(wait=True)
+    object_store.shutdown()
     logging.info("service has been shutdown.")
 
+def options_hash(converter: DocumentConverter) -> str:
+    options = {}
+    for fmt, opt in converter.format_to_options.items():
+        pipeline_options = opt.pipeline_options
+        options[fmt.value] = [
+            opt.pipeline_cls.__name__,
+            pipeline_options.model_dump_json() if pipeline_options else None,
+        ]
+    return hashlib.md5(
+        json.dumps(options, sort_keys=True).encode("utf-8"), usedforsecurity=False
+    ).hexdigest()
+
+
 def initialize_converter():
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
-    os.makedirs(INPUT_DIR, exist_ok=True)
-    
     pipeline_options = PdfPipelineOptions()
     # ocr_options = EasyOcrOptions(force_full_page_ocr=True)
     ocr_options = MyOcrOptions(force_full_page_ocr=True)
@@ -211,21 +294,47 @@ def initialize_converter():
 app = FastAPI(title="Docling OCR Service", lifespan=lifespan)
 
 
+async def cancel_on_disconnect(request: Request, cancel_token: CancellationToken):
+    while not cancel_token.cancelled:
+        if await request.is_disconnected():
+            logging.info(f"client disconnected, cancelling: {request.url}")
+            cancel_token.cancel("client disconnected")
+            return
+        remaining = cancel_token.remaining()
+        if remaining is not None and remaining <= DISCONNECT_POLL_INTERVAL:
+            await asyncio.sleep(remaining)
+            logging.info(f"request timed out, cancelling: {request.url}")
+            cancel_token.cancel("deadline exceeded")
+            return
+        await asyncio.sleep(DISCONNECT_POLL_INTERVAL)
+
+
 @app.post("/ocr")
 async def create_ocr_task(
+    request: Request,
     input_s3_path: str = Form(...),
-    output_s3_path: Optional[str] = Form(None)
+    output_s3_path: Optional[str] = Form(None),
+    tenant: str = Form("default"),
+    priority: int = Form(0),
 ):
     if not input_s3_path:
         raise HTTPException(status_code=400, detail="input_s3_path is empty")
 
         
     loop = asyncio.get_event_loop()
+    cancel_token = CancellationToken(timeout=REQUEST_TIMEOUT)
+    watcher = asyncio.create_task(cancel_on_disconnect(request, cancel_token))
     
     try:
         logging.info(f"The task has been submitted to the thread pool: {input_s3_path}")
         result = await loop.run_in_executor(
-            executor, perform_ocr, input_s3_path, output_s3_path
+            executor,
+            perform_ocr,
+            input_s3_path,
+            output_s3_path,
+            cancel_token,
+            tenant,
+            priority,
         )
         return JSONResponse(
             status_code=200,
@@ -238,6 +347,9 @@ async def create_ocr_task(
     except Exception as e:
         logging.error(f"Task processing failed {input_s3_path}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        watcher.cancel()
+        cancel_token.cancel("request finished")  # stops its deadline timer
 
 
 TARGET_URL = "http://olmocr-7b:6008/health"
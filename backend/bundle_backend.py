@@ -0,0 +1,62 @@
+import logging
+from io import BytesIO
+from pathlib import PurePath
+from typing import List, Sequence, Set, Tuple
+
+from docling.backend.pdf_backend import PdfDocumentBackend, PdfPageBackend
+from docling.datamodel.base_models import InputFormat
+from docling.datamodel.document import InputDocument
+
+_log = logging.getLogger(__name__)
+
+
+class DocumentBundleBackend(PdfDocumentBackend):
+    """Serve the selected pages of several input documents as one document.
+
+    Page ``i`` of the bundle is a page of one of the members, loaded through
+    the member's own backend. The members keep ownership of their backends, the
+    bundle only maps page numbers.
+    """
+
+    def __init__(self, in_doc: InputDocument, members: Sequence[InputDocument]):
+        super().__init__(in_doc, path_or_stream=BytesIO())
+
+        self.members = list(members)
+        # (member index, page number in the member) of every page of the bundle
+        self.page_map: List[Tuple[int, int]] = []
+        for member_idx, member in enumerate(self.members):
+            assert isinstance(member._backend, PdfDocumentBackend)
+            start_page, end_page = member.limits.page_range
+            for page_no in range(member.page_count):
+                if (start_page - 1) <= page_no <= (end_page - 1):
+                    self.page_map.append((member_idx, page_no))
+
+    @classmethod
+    def create(cls, members: Sequence[InputDocument]) -> InputDocument:
+        """Build the virtual ``InputDocument`` of a bundle of members."""
+        bundle = InputDocument.model_construct(
+            file=PurePath(f"bundle-of-{len(members)}-{members[0].file.name}"),
+            document_hash="+".join(m.document_hash for m in members),
+            format=members[0].format,
+            filesize=sum(m.filesize or 0 for m in members),
+        )
+        backend = cls(bundle, members)
+        bundle._backend = backend
+        bundle.page_count = backend.page_count()
+        return bundle
+
+    def page_count(self) -> int:
+        return len(self.page_map)
+
+    def load_page(self, page_no: int) -> PdfPageBackend:
+        member_idx, member_page_no = self.page_map[page_no]
+        backend = self.members[member_idx]._backend
+        assert isinstance(backend, PdfDocumentBackend)
+        return backend.load_page(member_page_no)
+
+    def is_valid(self) -> bool:
+        return len(self.page_map) > 0
+
+    @classmethod
+    def supported_formats(cls) -> Set[InputFormat]:
+        return {InputFormat.PDF, InputFormat.IMAGE}
@@ -2,17 +2,18 @@ import logging
 from collections.abc import Iterable
 from io import BytesIO
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Callable, List, Optional, Union
 
 import pypdfium2 as pdfium
 from docling_core.types.doc import BoundingBox, CoordOrigin
-from docling_core.types.doc.page import SegmentedPdfPage, TextCell
+from docling_core.types.doc.page import SegmentedPdfPage, TextCell, TextCellUnit
 from docling_parse.pdf_parser import DoclingPdfParser, PdfDocument
 from PIL import Image
 from pypdfium2 import PdfPage
 
 from docling.backend.pdf_backend import PdfDocumentBackend, PdfPageBackend
 from docling.datamodel.base_models import Size
+from docling.utils.cell_store import CellStore
 from docling.utils.locks import pypdfium2_lock
 
 if TYPE_CHECKING:
@@ -22,45 +23,84 @@ _log = logging.getLogger(__name__)
 
 
 class DoclingParseV4PageBackend(PdfPageBackend):
-    def __init__(self, parsed_page: SegmentedPdfPage, page_obj: PdfPage):
+    def __init__(
+        self,
+        parsed_page: SegmentedPdfPage,
+        page_obj: PdfPage,
+        char_cells: Optional[List[TextCell]] = None,
+        create_word_cells: Optional[Callable[[SegmentedPdfPage], None]] = None,
+    ):
         self._ppage = page_obj
         self._dpage = parsed_page
         self.valid = parsed_page is not None
+        self._cell_store: Optional[CellStore] = None
+
+        # Char cells as produced by docling-parse (bottom-left origin), from which
+        # the char and word cells of _dpage are computed when first requested.
+        self._char_cells = char_cells
+        self._create_word_cells = create_word_cells
 
     def is_valid(self) -> bool:
         return self.valid
 
-    def get_text_in_rect(self, bbox: BoundingBox) -> str:
-        # Find intersecting cells on the page
-        text_piece = ""
-        page_size = self.get_size()
+    def _textline_store(self) -> CellStore:
+        if self._cell_store is None or not self._cell_store.is_view_of(
+            self._dpage.textline_cells
+        ):
+            self._cell_store = CellStore(self._dpage.textline_cells)
+        return self._cell_store
 
-        scale = (
-            1  # FIX - Replace with param in get_text_in_rect across backends (optional)
+    def get_text_in_rect(self, bbox: BoundingBox) -> str:
+        # Text of the cells overlapping the rectangle by more than half
+        return self._textline_store().text_in_bbox(
+            bbox, min_overlap=0.5, page_height=self.get_size().height
         )
 
-        for i, cell in enumerate(self._dpage.textline_cells):
-            cell_bbox = (
-                cell.rect.to_bounding_box()
-                .to_top_left_origin(page_height=page_size.height)
-                .scaled(scale)
-            )
-
-            overlap_frac = cell_bbox.intersection_over_self(bbox)
-
-            if overlap_frac > 0.5:
-                if len(text_piece) > 0:
-                    text_piece += " "
-                text_piece += cell.text
-
-        return text_piece
-
     def get_segmented_page(self) -> Optional[SegmentedPdfPage]:
         return self._dpage
 
     def get_text_cells(self) -> Iterable[TextCell]:
         return self._dpage.textline_cells
 
+    def get_cells(self, cell_unit: TextCellUnit) -> List[TextCell]:
+        if cell_unit == TextCellUnit.CHAR:
+            self._load_char_cells()
+            return self._dpage.char_cells
+        elif cell_unit == TextCellUnit.WORD:
+            self._load_word_cells()
+            return self._dpage.word_cells
+        return self._dpage.textline_cells
+
+    def _load_char_cells(self) -> None:
+        if self._dpage.has_chars or not self._char_cells:
+            return
+
+        self._dpage.char_cells = _to_top_left_origin(
+            self._char_cells, self._dpage.dimension.height
+        )
+        self._dpage.has_chars = len(self._dpage.char_cells) > 0
+
+    def _load_word_cells(self) -> None:
+        if (
+            self._dpage.has_words
+            or not self._char_cells
+            or self._create_word_cells is None
+        ):
+            return
+
+        # docling-parse merges the chars in their original, bottom-left origin.
+        words_page = self._dpage.model_copy(
+            update={"char_cells": self._char_cells, "word_cells": []}
+        )
+        with pypdfium2_lock:
+            self._create_word_cells(words_page)
+
+        page_height = self._dpage.dimension.height
+        for tc in words_page.word_cells:
+            tc.to_top_left_origin(page_height)
+        self._dpage.word_cells = words_page.word_cells
+        self._dpage.has_words = len(self._dpage.word_cells) > 0
+
     def get_bitmap_rects(self, scale: float = 1) -> Iterable[BoundingBox]:
         AREA_THRESHOLD = 0  # 32 * 32
 
@@ -125,6 +165,15 @@ class DoclingParseV4PageBackend(PdfPageBackend):
     def unload(self):
         self._ppage = None
         self._dpage = None
+        self._char_cells = None
+        self._cell_store = None
+
+
+def _to_top_left_origin(cells: List[TextCell], page_height: float) -> List[TextCell]:
+    return [
+        tc.model_copy(update={"rect": tc.rect.to_top_left_origin(page_height)})
+        for tc in cells
+    ]
 
 
 class DoclingParseV4DocumentBackend(PdfDocumentBackend):
@@ -132,7 +181,7 @@ class DoclingParseV4DocumentBackend(PdfDocumentBackend):
         super().__init__(in_doc, path_or_stream)
 
         with pypdfium2_lock:
-            self._pdoc = pdfium.PdfDocument(self.path_or_stream)
+            self._pdoc = pdfium.PdfDocument(self._pdfium_input())
         self.parser = DoclingPdfParser(loglevel="fatal")
         self.dp_doc: PdfDocument = self.parser.load(path_or_stream=self.path_or_stream)
         success = self.dp_doc is not None
@@ -154,8 +203,22 @@ class DoclingParseV4DocumentBackend(PdfDocumentBackend):
         return len_2
 
     def load_page(
-        self, page_no: int, create_words: bool = True, create_textlines: bool = True
+        self, page_no: int, create_words: bool = False, create_textlines: bool = True
     ) -> DoclingParseV4PageBackend:
+        """Load a page with its text lines.
+
+        Word and char cells are only computed when requested through
+        ``get_cells``, unless ``create_words`` asks for the words upfront.
+        Merging chars into words on demand relies on a private helper of
+        docling-parse; without it the words are created with the page.
+        """
+        create_word_cells: Optional[Callable[[SegmentedPdfPage], None]] = getattr(
+            self.dp_doc, "_create_word_cells", None
+        )
+        if not callable(create_word_cells):
+            create_word_cells = None
+            create_words = True
+
         with pypdfium2_lock:
             seg_page = self.dp_doc.get_page(
                 page_no + 1,
@@ -163,30 +226,35 @@ class DoclingParseV4DocumentBackend(PdfDocumentBackend):
                 create_textlines=create_textlines,
             )
 
-            # In Docling, all TextCell instances are expected with top-left origin.
-            [
-                tc.to_top_left_origin(seg_page.dimension.height)
-                for tc in seg_page.textline_cells
-            ]
-            [
-                tc.to_top_left_origin(seg_page.dimension.height)
-                for tc in seg_page.char_cells
-            ]
-            [
-                tc.to_top_left_origin(seg_page.dimension.height)
-                for tc in seg_page.word_cells
-            ]
-
-            return DoclingParseV4PageBackend(
-                seg_page,
-                self._pdoc[page_no],
-            )
+        # The parsed page is cached by docling-parse, it is left as it is. In
+        # Docling, all TextCell instances are expected with top-left origin, the
+        # page backend gets converted copies of the text lines and words, and
+        # the chars to convert on demand.
+        page_height = seg_page.dimension.height
+        page_view = seg_page.model_copy(
+            update={
+                "textline_cells": _to_top_left_origin(
+                    seg_page.textline_cells, page_height
+                ),
+                "word_cells": _to_top_left_origin(seg_page.word_cells, page_height),
+                "char_cells": [],
+                "has_chars": False,
+            }
+        )
+
+        with pypdfium2_lock:
+            page_obj = self._pdoc[page_no]
+        return DoclingParseV4PageBackend(
+            page_view,
+            page_obj,
+            char_cells=seg_page.char_cells,
+            create_word_cells=create_word_cells,
+        )
 
     def is_valid(self) -> bool:
         return self.page_count() > 0
 
     def unload(self):
-        super().unload()
         # Unload docling-parse document first
         if self.dp_doc is not None:
             self.dp_doc.unload()
@@ -201,3 +269,6 @@ class DoclingParseV4DocumentBackend(PdfDocumentBackend):
                     # Ignore cleanup errors
                     pass
             self._pdoc = None
+
+        # Finally release the input buffer shared with pypdfium2
+        super().unload()
@@ -0,0 +1,156 @@
+import logging
+import threading
+from collections.abc import Iterable
+from io import BytesIO
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Set, Union
+
+from docling_core.types.doc import BoundingBox, CoordOrigin
+from docling_core.types.doc.page import (
+    BoundingRectangle,
+    PdfPageBoundaryType,
+    PdfPageGeometry,
+    SegmentedPdfPage,
+    TextCell,
+)
+from PIL import Image, UnidentifiedImageError
+
+from docling.backend.pdf_backend import PdfDocumentBackend, PdfPageBackend
+from docling.datamodel.base_models import InputFormat, Size
+
+if TYPE_CHECKING:
+    from docling.datamodel.document import InputDocument
+
+_log = logging.getLogger(__name__)
+
+
+class ImagePageBackend(PdfPageBackend):
+    """A page made of one decoded image frame, one pixel per point (72 dpi)."""
+
+    def __init__(self, image: Optional[Image.Image]):
+        self._image = image
+        self.valid = image is not None
+
+    def is_valid(self) -> bool:
+        return self.valid
+
+    def _page_bbox(self, coord_origin: CoordOrigin) -> BoundingBox:
+        size = self.get_size()
+        if coord_origin == CoordOrigin.TOPLEFT:
+            return BoundingBox(
+                l=0, t=0, r=size.width, b=size.height, coord_origin=coord_origin
+            )
+        return BoundingBox(
+            l=0, b=0, r=size.width, t=size.height, coord_origin=coord_origin
+        )
+
+    def get_text_in_rect(self, bbox: BoundingBox) -> str:
+        return ""
+
+    def get_segmented_page(self) -> Optional[SegmentedPdfPage]:
+        if not self.valid:
+            return None
+
+        bbox = self._page_bbox(CoordOrigin.BOTTOMLEFT)
+        dimension = PdfPageGeometry(
+            angle=0.0,
+            rect=BoundingRectangle.from_bounding_box(bbox),
+            boundary_type=PdfPageBoundaryType.CROP_BOX,
+            art_bbox=bbox,
+            bleed_bbox=bbox,
+            crop_bbox=bbox,
+            media_bbox=bbox,
+            trim_bbox=bbox,
+        )
+        return SegmentedPdfPage(
+            dimension=dimension,
+            textline_cells=[],
+            char_cells=[],
+            word_cells=[],
+            has_textlines=False,
+            has_words=False,
+            has_chars=False,
+        )
+
+    def get_text_cells(self) -> Iterable[TextCell]:
+        return []
+
+    def get_bitmap_rects(self, scale: float = 1) -> Iterable[BoundingBox]:
+        # The whole page is a bitmap
+        yield self._page_bbox(CoordOrigin.TOPLEFT).scaled(scale=scale)
+
+    def get_page_image(
+        self, scale: float = 1, cropbox: Optional[BoundingBox] = None
+    ) -> Image.Image:
+        assert self._image is not None
+        page_size = self.get_size()
+
+        if not cropbox:
+            cropbox = self._page_bbox(CoordOrigin.TOPLEFT)
+            image = self._image
+        else:
+            cropbox = cropbox.to_top_left_origin(page_size.height)
+            image = self._image.crop(cropbox.as_tuple())
+
+        size = (round(cropbox.width * scale), round(cropbox.height * scale))
+        if image.size == size:
+            return image.copy()
+        return image.resize(size, resample=Image.Resampling.BICUBIC)
+
+    def get_size(self) -> Size:
+        assert self._image is not None
+        return Size(width=self._image.width, height=self._image.height)
+
+    def unload(self):
+        self._image = None
+
+
+class ImageDocumentBackend(PdfDocumentBackend):
+    """Serve image inputs as pages without converting them to PDF.
+
+    Frames of multi-page images (e.g. TIFF) are decoded when their page is
+    loaded, so only the pages of the current batch are held in memory.
+    """
+
+    def __init__(self, in_doc: "InputDocument", path_or_stream: Union[BytesIO, Path]):
+        super().__init__(in_doc, path_or_stream)
+
+        self._lock = threading.Lock()  # frames are selected by seeking the image
+        self._image: Optional[Image.Image] = None
+        self._n_frames = 0
+        try:
+            self._image = Image.open(self.path_or_stream)
+            self._n_frames = getattr(self._image, "n_frames", 1)
+        except (UnidentifiedImageError, OSError) as e:
+            _log.warning(f"Could not open image {self.file.name}: {e}")
+
+    def page_count(self) -> int:
+        return self._n_frames
+
+    def load_page(self, page_no: int) -> ImagePageBackend:
+        frame: Optional[Image.Image] = None
+        with self._lock:
+            if self._image is not None:
+                try:
+                    self._image.seek(page_no)
+                    frame = self._image.convert("RGB")
+                except (EOFError, OSError) as e:
+                    _log.warning(
+                        f"Could not decode frame {page_no} of {self.file.name}: {e}"
+                    )
+        return ImagePageBackend(frame)
+
+    def is_valid(self) -> bool:
+        return self._image is not None and self._n_frames > 0
+
+    @classmethod
+    def supported_formats(cls) -> Set[InputFormat]:
+        return {InputFormat.IMAGE}
+
+    def unload(self):
+        with self._lock:
+            if self._image is not None:
+                self._image.close()
+                self._image = None
+
+        super().unload()
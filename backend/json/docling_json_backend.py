@@ -8,6 +8,7 @@ from typing_extensions import override
 from docling.backend.abstract_backend import DeclarativeDocumentBackend
 from docling.datamodel.base_models import InputFormat
 from docling.datamodel.document import InputDocument
+from docling.utils import binary_codec
 
 
 class DoclingJSONBackend(DeclarativeDocumentBackend):
@@ -38,15 +39,16 @@ class DoclingJSONBackend(DeclarativeDocumentBackend):
 
     def _get_doc_or_err(self) -> Union[DoclingDocument, Exception]:
         try:
-            json_data: Union[str, bytes]
+            data: bytes
             if isinstance(self.path_or_stream, Path):
-                with open(self.path_or_stream, encoding="utf-8") as f:
-                    json_data = f.read()
+                data = self.path_or_stream.read_bytes()
             elif isinstance(self.path_or_stream, BytesIO):
-                json_data = self.path_or_stream.getvalue()
+                data = self.path_or_stream.getvalue()
             else:
                 raise RuntimeError(f"Unexpected: {type(self.path_or_stream)=}")
-            return DoclingDocument.model_validate_json(json_data=json_data)
+            if binary_codec.is_encoded(data):
+                return binary_codec.decode(data, DoclingDocument)
+            return DoclingDocument.model_validate_json(json_data=data)
         except Exception as e:
             return e
 
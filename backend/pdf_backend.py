@@ -1,16 +1,18 @@
+import ctypes
 from abc import ABC, abstractmethod
 from collections.abc import Iterable
 from io import BytesIO
 from pathlib import Path
-from typing import Optional, Set, Union
+from typing import List, Optional, Set, Union
 
 from docling_core.types.doc import BoundingBox, Size
-from docling_core.types.doc.page import SegmentedPdfPage, TextCell
+from docling_core.types.doc.page import SegmentedPdfPage, TextCell, TextCellUnit
 from PIL import Image
 
 from docling.backend.abstract_backend import PaginatedDocumentBackend
 from docling.datamodel.base_models import InputFormat
 from docling.datamodel.document import InputDocument
+from docling.utils.input_buffer import InputBuffer
 
 
 class PdfPageBackend(ABC):
@@ -26,6 +28,16 @@ class PdfPageBackend(ABC):
     def get_text_cells(self) -> Iterable[TextCell]:
         pass
 
+    def get_cells(self, cell_unit: TextCellUnit) -> List[TextCell]:
+        """Text cells of the given granularity, empty if the page does not have them.
+
+        Backends which can compute the finer granularities on demand override this.
+        """
+        segmented_page = self.get_segmented_page()
+        if segmented_page is None:
+            return []
+        return list(segmented_page.iterate_cells(cell_unit))
+
     @abstractmethod
     def get_bitmap_rects(self, float: int = 1) -> Iterable[BoundingBox]:
         pass
@@ -53,7 +65,11 @@ class PdfDocumentBackend(PaginatedDocumentBackend):
     def __init__(self, in_doc: InputDocument, path_or_stream: Union[BytesIO, Path]):
         super().__init__(in_doc, path_or_stream)
 
-        if self.input_format is not InputFormat.PDF:
+        # Memory-mapped file or stream buffer which was hashed by the InputDocument.
+        self._input_buffer: Optional[InputBuffer] = in_doc._input_buffer
+        in_doc._input_buffer = None
+
+        if self.input_format not in self.supported_formats():
             if self.input_format is InputFormat.IMAGE:
                 buf = BytesIO()
                 img = Image.open(self.path_or_stream)
@@ -89,6 +105,21 @@ class PdfDocumentBackend(PaginatedDocumentBackend):
                     f"Incompatible file format {self.input_format} was passed to a PdfDocumentBackend."
                 )
 
+    def _pdfium_input(self) -> Union[BytesIO, Path, ctypes.Array]:
+        """Input for pypdfium2, sharing the input buffer without copying it."""
+        if self._input_buffer is not None:
+            data = self._input_buffer.ctypes_array()
+            if data is not None:
+                return data
+        return self.path_or_stream
+
+    def unload(self):
+        # Subclasses close their parsers first, which release the buffer exports.
+        if self._input_buffer is not None:
+            self._input_buffer.close()
+            self._input_buffer = None
+        super().unload()
+
     @abstractmethod
     def load_page(self, page_no: int) -> PdfPageBackend:
         pass
@@ -353,7 +353,7 @@ class PyPdfiumDocumentBackend(PdfDocumentBackend):
 
         try:
             with pypdfium2_lock:
-                self._pdoc = pdfium.PdfDocument(self.path_or_stream)
+                self._pdoc = pdfium.PdfDocument(self._pdfium_input())
         except PdfiumError as e:
             raise RuntimeError(
                 f"pypdfium could not load document with hash {self.document_hash}"
@@ -371,7 +371,7 @@ class PyPdfiumDocumentBackend(PdfDocumentBackend):
         return self.page_count() > 0
 
     def unload(self):
-        super().unload()
         with pypdfium2_lock:
             self._pdoc.close()
             self._pdoc = None
+        super().unload()
@@ -0,0 +1,418 @@
+import json
+import logging
+import multiprocessing
+import platform
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Annotated, Dict, List, Optional
+
+import rich.table
+import typer
+from docling_core.types.doc import DoclingDocument
+from pydantic import TypeAdapter
+from rich.console import Console
+
+from docling.datamodel.base_models import FormatToExtensions, InputFormat
+from docling.utils import binary_codec
+from docling.utils.benchmark import (
+    DEFAULT_CONFIGS,
+    BenchmarkConfig,
+    BenchmarkResult,
+    CorpusKind,
+    RegressionThresholds,
+    compare_to_baseline,
+    generate_corpus,
+    run_benchmark,
+    run_codec_benchmark,
+    synthetic_document,
+)
+from docling.utils.openai_stub_server import (
+    LatencyModel,
+    OpenAiStubOptions,
+    OpenAiStubServer,
+    StubMode,
+)
+
+warnings.filterwarnings(action="ignore", category=UserWarning, module="pydantic|torch")
+warnings.filterwarnings(action="ignore", category=FutureWarning, module="easyocr")
+
+_log = logging.getLogger(__name__)
+
+console = Console()
+err_console = Console(stderr=True)
+
+app = typer.Typer(
+    name="Docling benchmark",
+    no_args_is_help=True,
+    add_completion=False,
+    pretty_exceptions_enable=False,
+)
+
+
+def _collect_sources(corpus_dir: Path) -> List[Path]:
+    extensions = {ext for exts in FormatToExtensions.values() for ext in exts}
+    extensions.difference_update(FormatToExtensions[InputFormat.JSON_DOCLING])
+    return sorted(
+        p
+        for p in corpus_dir.rglob("*")
+        if p.is_file() and p.suffix[1:].lower() in extensions
+    )
+
+
+def _load_configs(
+    presets: Optional[List[str]], config_file: Optional[Path]
+) -> List[BenchmarkConfig]:
+    configs: List[BenchmarkConfig] = []
+    if config_file is not None:
+        configs.extend(
+            TypeAdapter(List[BenchmarkConfig]).validate_json(config_file.read_text())
+        )
+    for name in presets or []:
+        if name not in DEFAULT_CONFIGS:
+            raise typer.BadParameter(
+                f"Unknown preset {name!r}. Available: {', '.join(DEFAULT_CONFIGS)}"
+            )
+        configs.append(DEFAULT_CONFIGS[name])
+    return configs or [DEFAULT_CONFIGS["standard"]]
+
+
+def _print_results(results: List[BenchmarkResult]) -> None:
+    summary = rich.table.Table(title="Benchmark summary")
+    for col in (
+        "Config",
+        "Docs",
+        "Failed",
+        "Pages",
+        "Wall [s]",
+        "Pages/s",
+        "Docs/s",
+        "CPU [cores]",
+        "Peak RSS [MB]",
+    ):
+        summary.add_column(col, justify="right")
+    for res in results:
+        summary.add_row(
+            res.name,
+            str(res.num_docs),
+            str(res.num_failed),
+            str(res.num_pages),
+            f"{res.wall_time:.2f}",
+            f"{res.pages_per_second:.2f}",
+            f"{res.docs_per_second:.2f}",
+            f"{res.cpu_utilization:.2f}",
+            f"{res.peak_rss_mb:.0f}",
+        )
+    console.print(summary)
+
+    for res in results:
+        stages = rich.table.Table(title=f"Stage timings: {res.name}")
+        for col in ("Stage", "Count", "Total [s]", "p50 [ms]", "p95 [ms]"):
+            stages.add_column(col, justify="right")
+        for key, st in res.stages.items():
+            stages.add_row(
+                key,
+                str(st.count),
+                f"{st.total:.2f}",
+                f"{st.p50 * 1000:.1f}",
+                f"{st.p95 * 1000:.1f}",
+            )
+        console.print(stages)
+
+
+@app.command("generate")
+def generate(
+    output_dir: Annotated[
+        Path, typer.Option(..., "-o", "--output-dir", help="Corpus directory.")
+    ] = Path("bench_corpus"),
+    kinds: Annotated[
+        Optional[List[CorpusKind]],
+        typer.Option(..., "--kind", help="Document kinds to generate (default: all)."),
+    ] = None,
+    docs_per_kind: Annotated[int, typer.Option(..., help="Documents per kind.")] = 2,
+    pages_per_doc: Annotated[int, typer.Option(..., help="Pages per document.")] = 3,
+    seed: Annotated[int, typer.Option(..., help="Random seed.")] = 42,
+):
+    """Generate the synthetic benchmark corpus."""
+    paths = generate_corpus(
+        output_dir,
+        kinds=kinds,
+        docs_per_kind=docs_per_kind,
+        pages_per_doc=pages_per_doc,
+        seed=seed,
+    )
+    typer.secho(f"Generated {len(paths)} documents in {output_dir}.", fg="green")
+
+
+@app.command("run")
+def run(
+    corpus_dir: Annotated[
+        Path,
+        typer.Option(
+            ..., "-c", "--corpus-dir", help="Directory with the documents to convert."
+        ),
+    ] = Path("bench_corpus"),
+    generate_missing: Annotated[
+        bool,
+        typer.Option(
+            ...,
+            "--generate/--no-generate",
+            help="Generate the synthetic corpus if the corpus directory is empty.",
+        ),
+    ] = True,
+    presets: Annotated[
+        Optional[List[str]],
+        typer.Option(
+            ...,
+            "--preset",
+            help=f"Pipeline presets to run: {', '.join(DEFAULT_CONFIGS)}.",
+        ),
+    ] = None,
+    config_file: Annotated[
+        Optional[Path],
+        typer.Option(
+            ..., "--config", help="JSON file with a list of benchmark configurations."
+        ),
+    ] = None,
+    baseline: Annotated[
+        Optional[Path],
+        typer.Option(..., help="Baseline JSON to compare the results against."),
+    ] = None,
+    save_baseline: Annotated[
+        Optional[Path],
+        typer.Option(..., help="Write the results as a new baseline JSON."),
+    ] = None,
+    report: Annotated[
+        Optional[Path],
+        typer.Option(..., help="Write the full results JSON to this file."),
+    ] = None,
+    max_throughput_drop: Annotated[
+        float, typer.Option(..., help="Tolerated relative throughput drop.")
+    ] = RegressionThresholds().throughput,
+    max_stage_p95_increase: Annotated[
+        float, typer.Option(..., help="Tolerated relative per-stage p95 increase.")
+    ] = RegressionThresholds().stage_p95,
+    max_rss_increase: Annotated[
+        float, typer.Option(..., help="Tolerated relative peak RSS increase.")
+    ] = RegressionThresholds().peak_rss,
+    verbose: Annotated[
+        int,
+        typer.Option(
+            "--verbose",
+            "-v",
+            count=True,
+            help="Set the verbosity level. -v for info logging, -vv for debug logging.",
+        ),
+    ] = 0,
+):
+    """Run the configured pipelines over the corpus and check for regressions."""
+    log_format = "%(asctime)s\t%(levelname)s\t%(name)s: %(message)s"
+    level = [logging.WARNING, logging.INFO, logging.DEBUG][min(verbose, 2)]
+    logging.basicConfig(level=level, format=log_format)
+
+    sources = _collect_sources(corpus_dir) if corpus_dir.is_dir() else []
+    if not sources:
+        if not generate_missing:
+            err_console.print(f"[red]Error: No documents found in {corpus_dir}.[/red]")
+            raise typer.Abort()
+        sources = generate_corpus(corpus_dir)
+
+    configs = _load_configs(presets, config_file)
+
+    # Each configuration runs in a fresh process, so that peak RSS and model
+    # caches of one configuration do not leak into the next.
+    results: List[BenchmarkResult] = []
+    mp_context = multiprocessing.get_context("spawn")
+    for config in configs:
+        console.print(f"Running [bold]{config.name}[/bold] on {len(sources)} documents")
+        with ProcessPoolExecutor(max_workers=1, mp_context=mp_context) as pool:
+            results.append(pool.submit(run_benchmark, config, sources).result())
+
+    _print_results(results)
+
+    payload = {
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "num_sources": len(sources),
+        "results": [res.model_dump() for res in results],
+    }
+    if report is not None:
+        report.write_text(json.dumps(payload, indent=2))
+    if save_baseline is not None:
+        save_baseline.write_text(json.dumps(payload, indent=2))
+        typer.secho(f"Baseline written to {save_baseline}.", fg="green")
+
+    if baseline is not None:
+        thresholds = RegressionThresholds(
+            throughput=max_throughput_drop,
+            stage_p95=max_stage_p95_increase,
+            peak_rss=max_rss_increase,
+        )
+        baseline_results: Dict[str, BenchmarkResult] = {
+            res["name"]: BenchmarkResult.model_validate(res)
+            for res in json.loads(baseline.read_text())["results"]
+        }
+        regressions: List[str] = []
+        for res in results:
+            if res.name not in baseline_results:
+                _log.warning(f"No baseline available for configuration {res.name}")
+                continue
+            regressions.extend(
+                compare_to_baseline(res, baseline_results[res.name], thresholds)
+            )
+
+        if regressions:
+            for msg in regressions:
+                err_console.print(f"[red]Regression: {msg}[/red]")
+            raise typer.Exit(code=1)
+        typer.secho("No regressions against the baseline.", fg="green")
+
+
+@app.command("codec")
+def codec(
+    document: Annotated[
+        Optional[Path],
+        typer.Option(
+            ...,
+            "-d",
+            "--document",
+            help="Docling JSON (or binary) document to round-trip, "
+            "instead of a synthetic one.",
+        ),
+    ] = None,
+    pages: Annotated[
+        int, typer.Option(..., help="Pages of the synthetic document.")
+    ] = 20,
+    pictures_per_page: Annotated[
+        int, typer.Option(..., help="Pictures per page of the synthetic document.")
+    ] = 3,
+    texts_per_page: Annotated[
+        int, typer.Option(..., help="Text items per page of the synthetic document.")
+    ] = 200,
+    repeat: Annotated[int, typer.Option(..., help="Round trips per codec.")] = 3,
+    seed: Annotated[int, typer.Option(..., help="Random seed.")] = 42,
+):
+    """Compare the JSON and binary round trips of a document."""
+    if document is not None:
+        data = document.read_bytes()
+        doc = (
+            binary_codec.decode(data, DoclingDocument)
+            if binary_codec.is_encoded(data)
+            else DoclingDocument.model_validate_json(data)
+        )
+    else:
+        doc = synthetic_document(
+            num_pages=pages,
+            pictures_per_page=pictures_per_page,
+            texts_per_page=texts_per_page,
+            seed=seed,
+        )
+
+    table = rich.table.Table(title="Serialization round trip")
+    for col in ("Codec", "Size [MB]", "Encode [ms]", "Decode [ms]"):
+        table.add_column(col, justify="right")
+    for res in run_codec_benchmark(doc, repeat=repeat):
+        table.add_row(
+            res.codec,
+            f"{res.size_mb:.1f}",
+            f"{res.encode_seconds * 1000:.1f}",
+            f"{res.decode_seconds * 1000:.1f}",
+        )
+    console.print(table)
+
+
+@app.command("stub")
+def stub(
+    host: Annotated[str, typer.Option(..., help="Interface to bind.")] = "127.0.0.1",
+    port: Annotated[int, typer.Option(..., help="Port to listen on.")] = 6008,
+    mode: Annotated[StubMode, typer.Option(..., help="Response mode.")] = (
+        StubMode.CANNED
+    ),
+    responses_file: Annotated[
+        Optional[Path],
+        typer.Option(
+            ..., help="JSON file with a list of canned response contents (canned mode)."
+        ),
+    ] = None,
+    latency: Annotated[
+        float, typer.Option(..., help="Mean simulated latency in seconds.")
+    ] = 0.0,
+    latency_stddev: Annotated[
+        float, typer.Option(..., help="Latency standard deviation in seconds.")
+    ] = 0.0,
+    latency_distribution: Annotated[
+        str,
+        typer.Option(
+            ..., help="One of: fixed, uniform, normal, lognormal, exponential."
+        ),
+    ] = "fixed",
+    latency_per_token: Annotated[
+        float, typer.Option(..., help="Additional latency per completion token.")
+    ] = 0.0,
+    max_concurrency: Annotated[
+        Optional[int], typer.Option(..., help="Requests served in parallel.")
+    ] = None,
+    reject_when_busy: Annotated[
+        bool,
+        typer.Option(..., help="Answer 429 instead of queueing when saturated."),
+    ] = False,
+    error_rate: Annotated[
+        float, typer.Option(..., help="Fraction of requests answered with an error.")
+    ] = 0.0,
+    timeout_rate: Annotated[
+        float, typer.Option(..., help="Fraction of requests that hang and drop.")
+    ] = 0.0,
+    timeout_seconds: Annotated[
+        float, typer.Option(..., help="Hang duration of injected timeouts.")
+    ] = 30.0,
+    upstream_url: Annotated[
+        Optional[str], typer.Option(..., help="Real endpoint used in record mode.")
+    ] = None,
+    recordings: Annotated[
+        Optional[Path],
+        typer.Option(..., help="Recordings JSON file for record and replay mode."),
+    ] = None,
+    seed: Annotated[int, typer.Option(..., help="Random seed.")] = 42,
+):
+    """Serve a local OpenAI-compatible chat-completions stand-in for load tests."""
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s\t%(levelname)s\t%(name)s: %(message)s"
+    )
+    options = OpenAiStubOptions(
+        host=host,
+        port=port,
+        mode=mode,
+        latency=LatencyModel(
+            distribution=latency_distribution,  # type: ignore[arg-type]
+            mean=latency,
+            stddev=latency_stddev,
+            per_token=latency_per_token,
+        ),
+        max_concurrency=max_concurrency,
+        reject_when_busy=reject_when_busy,
+        error_rate=error_rate,
+        timeout_rate=timeout_rate,
+        timeout_seconds=timeout_seconds,
+        upstream_url=upstream_url,
+        recordings_path=recordings,
+        seed=seed,
+    )
+    if responses_file is not None:
+        options.responses = TypeAdapter(List[str]).validate_json(
+            responses_file.read_text()
+        )
+    try:
+        server = OpenAiStubServer(options)
+    except ValueError as err:
+        raise typer.BadParameter(str(err))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    console.print(f"Stub server stats: {server.stats()}")
+
+
+click_app = typer.main.get_command(app)
+
+if __name__ == "__main__":
+    app()
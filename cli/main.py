@@ -1,5 +1,6 @@
 import importlib
 import logging
+import multiprocessing
 import platform
 import re
 import sys
@@ -7,8 +8,14 @@ import tempfile
 import time
 import warnings
 from collections.abc import Iterable
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
 from pathlib import Path
-from typing import Annotated, Dict, List, Optional, Type
+from typing import Annotated, Any, Dict, List, Optional, Set, Tuple, Type
 
 import rich.table
 import typer
@@ -22,6 +29,14 @@ from docling_core.types.doc import ImageRefMode
 from docling_core.utils.file import resolve_source_to_path
 from pydantic import TypeAdapter
 from rich.console import Console
+from rich.progress import (
+    BarColumn,
+    MofNCompleteColumn,
+    Progress,
+    TextColumn,
+    TimeElapsedColumn,
+    TimeRemainingColumn,
+)
 
 from docling.backend.docling_parse_backend import DoclingParseDocumentBackend
 from docling.backend.docling_parse_v2_backend import DoclingParseV2DocumentBackend
@@ -57,7 +72,7 @@ from docling.datamodel.pipeline_options import (
     TableFormerMode,
     VlmPipelineOptions,
 )
-from docling.datamodel.settings import settings
+from docling.datamodel.settings import DebugSettings, settings
 from docling.datamodel.vlm_model_specs import (
     GRANITE_VISION_OLLAMA,
     GRANITE_VISION_TRANSFORMERS,
@@ -69,11 +84,23 @@ from docling.document_converter import (
     AudioFormatOption,
     DocumentConverter,
     FormatOption,
+    ImageFormatOption,
     PdfFormatOption,
 )
 from docling.models.factories import get_ocr_factory
 from docling.pipeline.asr_pipeline import AsrPipeline
 from docling.pipeline.vlm_pipeline import VlmPipeline
+from docling.utils.conversion_manifest import (
+    ConversionManifest,
+    ManifestEntry,
+    settings_fingerprint,
+)
+from docling.utils.serialization import (
+    Compression,
+    write_document_json,
+    write_document_markdown,
+)
+from docling.utils.utils import create_file_hash
 
 warnings.filterwarnings(action="ignore", category=UserWarning, module="pydantic|torch")
 warnings.filterwarnings(action="ignore", category=FutureWarning, module="easyocr")
@@ -185,6 +212,7 @@ def export_documents(
     export_txt: bool,
     export_doctags: bool,
     image_export_mode: ImageRefMode,
+    compression: Compression = Compression.NONE,
 ):
     success_count = 0
     failure_count = 0
@@ -196,11 +224,32 @@ def export_documents(
 
             # Export JSON format:
             if export_json:
-                fname = output_dir / f"{doc_filename}.json"
+                fname = output_dir / f"{doc_filename}.json{compression.suffix}"
                 _log.info(f"writing JSON output to {fname}")
-                conv_res.document.save_as_json(
-                    filename=fname, image_mode=image_export_mode
-                )
+                if image_export_mode == ImageRefMode.EMBEDDED:
+                    # Stream the items instead of building the full export dict.
+                    write_document_json(
+                        conv_res.document, fname, compression=compression
+                    )
+                elif compression != Compression.NONE:
+                    # Place the images as save_as_json does for the uncompressed file
+                    artifacts_dir, reference_path = conv_res.document._get_output_paths(
+                        output_dir / f"{doc_filename}.json"
+                    )
+                    if image_export_mode == ImageRefMode.REFERENCED:
+                        artifacts_dir.mkdir(parents=True, exist_ok=True)
+                    doc = conv_res.document._make_copy_with_refmode(
+                        artifacts_dir,
+                        image_export_mode,
+                        page_no=None,
+                        reference_path=reference_path,
+                        include_page_images=True,
+                    )
+                    write_document_json(doc, fname, compression=compression)
+                else:
+                    conv_res.document.save_as_json(
+                        filename=fname, image_mode=image_export_mode
+                    )
 
             # Export HTML format:
             if export_html:
@@ -248,11 +297,19 @@ def export_documents(
 
             # Export Markdown format:
             if export_md:
-                fname = output_dir / f"{doc_filename}.md"
+                fname = output_dir / f"{doc_filename}.md{compression.suffix}"
                 _log.info(f"writing Markdown output to {fname}")
-                conv_res.document.save_as_markdown(
-                    filename=fname, image_mode=image_export_mode
-                )
+                if compression != Compression.NONE:
+                    write_document_markdown(
+                        conv_res.document,
+                        fname,
+                        compression=compression,
+                        image_mode=image_export_mode,
+                    )
+                else:
+                    conv_res.document.save_as_markdown(
+                        filename=fname, image_mode=image_export_mode
+                    )
 
             # Export Document Tags format:
             if export_doctags:
@@ -275,6 +332,204 @@ def _split_list(raw: Optional[str]) -> Optional[List[str]]:
     return re.split(r"[;,]", raw)
 
 
+_worker_converter: Optional[DocumentConverter] = None
+_worker_export_kwargs: Dict[str, Any] = {}
+_worker_completed: Set[Tuple[str, str]] = set()
+_worker_headers: Optional[Dict[str, str]] = None
+
+
+def _init_convert_worker(
+    allowed_formats: Optional[List[InputFormat]],
+    format_options: Dict[InputFormat, FormatOption],
+    debug_settings: DebugSettings,
+    export_kwargs: Dict[str, Any],
+    completed: Set[Tuple[str, str]],
+    headers: Optional[Dict[str, str]],
+    log_level: int,
+):
+    global _worker_converter, _worker_export_kwargs, _worker_completed
+    global _worker_headers
+
+    logging.basicConfig(
+        level=log_level, format="%(asctime)s\t%(levelname)s\t%(name)s: %(message)s"
+    )
+    settings.debug = debug_settings
+    _worker_converter = DocumentConverter(
+        allowed_formats=allowed_formats, format_options=format_options
+    )
+    _worker_export_kwargs = export_kwargs
+    _worker_completed = completed
+    _worker_headers = headers
+
+
+def _convert_worker(
+    source: Path, fingerprint: str, raises_on_error: bool
+) -> ManifestEntry:
+    assert _worker_converter is not None
+    start_time = time.monotonic()
+
+    stat = source.stat()
+    entry = ManifestEntry(
+        source=str(source),
+        output_stem=source.stem,
+        file_hash=create_file_hash(source),
+        size=stat.st_size,
+        mtime=stat.st_mtime,
+        fingerprint=fingerprint,
+        status=ConversionStatus.SUCCESS,
+    )
+    # Same content already converted into the same outputs, e.g. a file which was
+    # touched or moved within the input tree since the previous run. It is
+    # recorded as converted, with its new size and mtime.
+    if (entry.file_hash, entry.output_stem) in _worker_completed:
+        entry.skipped = True
+        return entry
+
+    conv_res = _worker_converter.convert(
+        source, headers=_worker_headers, raises_on_error=raises_on_error
+    )
+    export_documents([conv_res], **_worker_export_kwargs)
+
+    entry.status = conv_res.status
+    entry.num_pages = conv_res.input.page_count
+    entry.elapsed = time.monotonic() - start_time
+    return entry
+
+
+def _convert_parallel(  # noqa: C901
+    input_doc_paths: List[Path],
+    workers: int,
+    manifest_path: Optional[Path],
+    resume: bool,
+    allowed_formats: Optional[List[InputFormat]],
+    format_options: Dict[InputFormat, FormatOption],
+    fingerprint: str,
+    export_kwargs: Dict[str, Any],
+    abort_on_error: bool,
+    headers: Optional[Dict[str, str]] = None,
+):
+    manifest = ConversionManifest(manifest_path) if manifest_path else None
+
+    completed: Set[Tuple[str, str]] = set()
+    pending = input_doc_paths
+    if manifest is not None and resume:
+        completed = manifest.completed(fingerprint)
+        pending = []
+        for path in input_doc_paths:
+            stat = path.stat()
+            if not manifest.is_unchanged_success(
+                path, stat.st_size, stat.st_mtime, fingerprint
+            ):
+                pending.append(path)
+        if len(pending) < len(input_doc_paths):
+            console.print(
+                f"Resuming: {len(input_doc_paths) - len(pending)} of "
+                f"{len(input_doc_paths)} documents are already converted."
+            )
+
+    counts: Dict[ConversionStatus, int] = {status: 0 for status in ConversionStatus}
+    num_pages = 0
+    start_time = time.monotonic()
+    aborted = False
+
+    pool = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_convert_worker,
+        initargs=(
+            allowed_formats,
+            format_options,
+            settings.debug,
+            export_kwargs,
+            completed,
+            headers,
+            logging.getLogger().getEffectiveLevel(),
+        ),
+    )
+    progress = Progress(
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TimeElapsedColumn(),
+        TimeRemainingColumn(),
+        TextColumn("{task.fields[rate]}"),
+        console=console,
+    )
+    try:
+        with progress:
+            task = progress.add_task("Converting", total=len(pending), rate="")
+            sources = iter(pending)
+            in_flight: Dict[Future, Path] = {}
+
+            def _submit_next() -> None:
+                source = next(sources, None)
+                if source is not None:
+                    fut = pool.submit(
+                        _convert_worker, source, fingerprint, abort_on_error
+                    )
+                    in_flight[fut] = source
+
+            # Keep the workers busy without queueing the whole input list.
+            for _ in range(2 * workers):
+                _submit_next()
+
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    source = in_flight.pop(fut)
+                    try:
+                        entry = fut.result()
+                    except Exception as err:
+                        _log.warning(f"Document {source} failed to convert: {err}")
+                        entry = ManifestEntry(
+                            source=str(source),
+                            output_stem=source.stem,
+                            fingerprint=fingerprint,
+                            status=ConversionStatus.FAILURE,
+                        )
+                        aborted = abort_on_error
+
+                    counts[
+                        ConversionStatus.SKIPPED if entry.skipped else entry.status
+                    ] += 1
+                    num_pages += entry.num_pages
+                    if manifest is not None:
+                        manifest.append(entry)
+
+                    elapsed = max(time.monotonic() - start_time, 1e-6)
+                    converted = sum(counts.values()) - counts[ConversionStatus.SKIPPED]
+                    progress.update(
+                        task,
+                        advance=1,
+                        rate=f"{converted / elapsed:.2f} docs/s, "
+                        f"{num_pages / elapsed:.2f} pages/s",
+                    )
+                    if not aborted:
+                        _submit_next()
+                if aborted:
+                    break
+    except KeyboardInterrupt:
+        aborted = True
+        err_console.print(
+            "[yellow]Interrupted. Run the same command again to resume.[/yellow]"
+            if manifest is not None
+            else "[yellow]Interrupted.[/yellow]"
+        )
+    finally:
+        pool.shutdown(wait=not aborted, cancel_futures=True)
+        if manifest is not None:
+            manifest.close()
+
+    failed = counts[ConversionStatus.FAILURE] + counts[ConversionStatus.PARTIAL_SUCCESS]
+    console.print(
+        f"Converted {counts[ConversionStatus.SUCCESS]} documents ({num_pages} pages), "
+        f"skipped {counts[ConversionStatus.SKIPPED]}, failed {failed} "
+        f"in {time.monotonic() - start_time:.2f} seconds."
+    )
+    if aborted:
+        raise typer.Abort()
+
+
 @app.command(no_args_is_help=True)
 def convert(  # noqa: C901
     input_sources: Annotated[
@@ -417,6 +672,36 @@ def convert(  # noqa: C901
     output: Annotated[
         Path, typer.Option(..., help="Output directory where results are saved.")
     ] = Path("."),
+    workers: Annotated[
+        int,
+        typer.Option(
+            ...,
+            min=1,
+            help="Number of worker processes converting documents in parallel.",
+        ),
+    ] = 1,
+    manifest: Annotated[
+        Optional[Path],
+        typer.Option(
+            ...,
+            help="JSONL file recording each converted document. Running the same command again skips the documents which are already converted.",
+        ),
+    ] = None,
+    resume: Annotated[
+        bool,
+        typer.Option(
+            ...,
+            "--resume/--no-resume",
+            help="Skip the documents which are recorded as converted in the manifest.",
+        ),
+    ] = True,
+    output_compression: Annotated[
+        Compression,
+        typer.Option(
+            ...,
+            help="Compress the JSON and Markdown outputs. zstd requires the zstandard package.",
+        ),
+    ] = Compression.NONE,
     verbose: Annotated[
         int,
         typer.Option(
@@ -600,10 +885,13 @@ def convert(  # noqa: C901
                 pipeline_options=pipeline_options,
                 backend=backend,  # pdf_backend
             )
+            image_format_option = ImageFormatOption(
+                pipeline_options=pipeline_options,
+            )
 
             format_options = {
                 InputFormat.PDF: pdf_format_option,
-                InputFormat.IMAGE: pdf_format_option,
+                InputFormat.IMAGE: image_format_option,
             }
 
         elif pipeline == ProcessingPipeline.VLM:
@@ -674,21 +962,10 @@ def convert(  # noqa: C901
             pipeline_options.artifacts_path = artifacts_path
             # audio_pipeline_options.artifacts_path = artifacts_path
 
-        doc_converter = DocumentConverter(
-            allowed_formats=from_formats,
-            format_options=format_options,
-        )
-
         start_time = time.time()
 
-        _log.info(f"paths: {input_doc_paths}")
-        conv_results = doc_converter.convert_all(
-            input_doc_paths, headers=parsed_headers, raises_on_error=abort_on_error
-        )
-
         output.mkdir(parents=True, exist_ok=True)
-        export_documents(
-            conv_results,
+        export_kwargs: Dict[str, Any] = dict(
             output_dir=output,
             export_json=export_json,
             export_html=export_html,
@@ -698,8 +975,44 @@ def convert(  # noqa: C901
             export_txt=export_txt,
             export_doctags=export_doctags,
             image_export_mode=image_export_mode,
+            compression=output_compression,
         )
 
+        _log.info(f"paths: {input_doc_paths}")
+        if workers > 1 or manifest is not None:
+            fingerprint = settings_fingerprint(
+                *(
+                    f"{fmt.value}:{opt.pipeline_cls.__name__}:{opt.backend.__name__}:"
+                    f"{opt.pipeline_options.model_dump_json() if opt.pipeline_options else ''}"
+                    for fmt, opt in sorted(format_options.items())
+                ),
+                *sorted(fmt.value for fmt in to_formats),
+                image_export_mode.value,
+                output_compression.value,
+                str(output.resolve()),
+            )
+            _convert_parallel(
+                input_doc_paths,
+                workers=workers,
+                manifest_path=manifest,
+                resume=resume,
+                allowed_formats=from_formats,
+                format_options=format_options,
+                fingerprint=fingerprint,
+                export_kwargs=export_kwargs,
+                abort_on_error=abort_on_error,
+                headers=parsed_headers,
+            )
+        else:
+            doc_converter = DocumentConverter(
+                allowed_formats=from_formats,
+                format_options=format_options,
+            )
+            conv_results = doc_converter.convert_all(
+                input_doc_paths, headers=parsed_headers, raises_on_error=abort_on_error
+            )
+            export_documents(conv_results, **export_kwargs)
+
         end_time = time.time() - start_time
 
     _log.info(f"All documents were converted in {end_time:.2f} seconds.")
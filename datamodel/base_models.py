@@ -81,7 +81,7 @@ FormatToExtensions: Dict[InputFormat, List[str]] = {
     InputFormat.CSV: ["csv"],
     InputFormat.XLSX: ["xlsx", "xlsm"],
     InputFormat.XML_USPTO: ["xml", "txt"],
-    InputFormat.JSON_DOCLING: ["json"],
+    InputFormat.JSON_DOCLING: ["json", "dlbin"],
     InputFormat.AUDIO: ["wav", "mp3"],
 }
 
@@ -227,12 +227,24 @@ class EquationPrediction(BaseModel):
     equation_map: Dict[int, TextElement] = {}
 
 
+class OcrRegionRoute(BaseModel):
+    """The OCR engine which read a region of a page, and why."""
+
+    bbox: BoundingBox
+    label: str
+    engine: str
+    reason: str
+    confidence: Optional[float] = None  # of the local engine, if it read the region
+    max_tokens: Optional[int] = None  # completion budget, if sent to the VLM
+
+
 class PagePredictions(BaseModel):
     layout: Optional[LayoutPrediction] = None
     tablestructure: Optional[TableStructurePrediction] = None
     figures_classification: Optional[FigureClassificationPrediction] = None
     equations_prediction: Optional[EquationPrediction] = None
     vlm_response: Optional[VlmPrediction] = None
+    ocr_routes: List[OcrRegionRoute] = []
 
 
 PageElement = Union[TextElement, Table, FigureElement, ContainerElement]
@@ -311,6 +323,22 @@ class Page(BaseModel):
     def image(self) -> Optional[Image]:
         return self.get_image(scale=self._default_image_scale)
 
+    def renumber(self, page_no: int) -> None:
+        """Move the page and the elements predicted on it to ``page_no``."""
+        self.page_no = page_no
+
+        elements: List[BasePageElement] = []
+        if self.predictions.tablestructure is not None:
+            elements.extend(self.predictions.tablestructure.table_map.values())
+        if self.predictions.figures_classification is not None:
+            elements.extend(self.predictions.figures_classification.figure_map.values())
+        if self.predictions.equations_prediction is not None:
+            elements.extend(self.predictions.equations_prediction.equation_map.values())
+        if self.assembled is not None:
+            elements.extend(self.assembled.elements)
+        for element in elements:
+            element.page_no = page_no
+
 
 ## OpenAI API Request / Response Models ##
 
@@ -1,17 +1,22 @@
 import csv
 import logging
 import re
+from collections import deque
 from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import Enum
 from io import BytesIO
 from pathlib import Path, PurePath
 from typing import (
     TYPE_CHECKING,
+    Callable,
+    Deque,
     Dict,
     List,
     Literal,
     Optional,
     Set,
+    Tuple,
     Type,
     Union,
 )
@@ -47,7 +52,7 @@ from docling_core.types.legacy_doc.document import (
 )
 from docling_core.utils.file import resolve_source_to_stream
 from docling_core.utils.legacy import docling_document_to_legacy
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 from typing_extensions import deprecated
 
 from docling.backend.abstract_backend import (
@@ -66,9 +71,10 @@ from docling.datamodel.base_models import (
     MimeTypeToFormat,
     Page,
 )
-from docling.datamodel.settings import DocumentLimits
+from docling.datamodel.settings import DocumentLimits, settings
+from docling.utils.cancellation import CancellationToken
 from docling.utils.profiling import ProfilingItem
-from docling.utils.utils import create_file_hash
+from docling.utils.input_buffer import InputBuffer
 
 if TYPE_CHECKING:
     from docling.document_converter import FormatOption
@@ -110,6 +116,10 @@ class InputDocument(BaseModel):
     page_count: int = 0
 
     _backend: AbstractDocumentBackend  # Internal PDF backend used
+    _input_buffer: Optional[InputBuffer] = None  # Handed over to PDF backends
+    _cancel_token: Optional[CancellationToken] = None  # Of the caller, if any
+    # Called with (pages done, page count) between page batches, may block
+    _preemption_point: Optional[Callable[[int, int], None]] = None
 
     def __init__(
         self,
@@ -133,7 +143,7 @@ class InputDocument(BaseModel):
                 if self.filesize > self.limits.max_file_size:
                     self.valid = False
                 else:
-                    self.document_hash = create_file_hash(path_or_stream)
+                    self._hash_input(path_or_stream)
                     self._init_doc(backend, path_or_stream)
 
             elif isinstance(path_or_stream, BytesIO):
@@ -146,7 +156,7 @@ class InputDocument(BaseModel):
                 if self.filesize > self.limits.max_file_size:
                     self.valid = False
                 else:
-                    self.document_hash = create_file_hash(path_or_stream)
+                    self._hash_input(path_or_stream)
                     self._init_doc(backend, path_or_stream)
             else:
                 raise RuntimeError(
@@ -178,6 +188,20 @@ class InputDocument(BaseModel):
             )
             # raise
 
+    def _hash_input(self, path_or_stream: Union[BytesIO, Path]) -> None:
+        # One pass over the memory-mapped file or the stream buffer. PDF inputs
+        # keep the buffer, so that the backend parses the same memory.
+        buffer = InputBuffer(path_or_stream)
+        try:
+            self.document_hash = buffer.hexdigest(settings.perf.input_hash)
+        except BaseException:
+            buffer.close()
+            raise
+        if self.format == InputFormat.PDF:
+            self._input_buffer = buffer
+        else:
+            buffer.close()
+
     def _init_doc(
         self,
         backend: Type[AbstractDocumentBackend],
@@ -206,6 +230,13 @@ class ConversionResult(BaseModel):
 
     document: DoclingDocument = _EMPTY_DOCLING_DOC
 
+    # Position of the source in the sequence passed to convert_all().
+    input_index: Optional[int] = None
+
+    # Deadline (document_timeout) and cancellation of the conversion, checked
+    # by the pipeline stages
+    _cancel_token: CancellationToken = PrivateAttr(default_factory=CancellationToken)
+
     @property
     @deprecated("Use document instead.")
     def legacy_document(self):
@@ -231,48 +262,141 @@ class _DummyBackend(AbstractDocumentBackend):
         return super().unload()
 
 
+def _input_size(item: Union[Path, str, DocumentStream]) -> int:
+    """Size of an input before it is read, 0 when unknown (e.g. URLs)."""
+    try:
+        if isinstance(item, DocumentStream):
+            return item.stream.getbuffer().nbytes
+        return Path(item).stat().st_size
+    except (OSError, ValueError):
+        return 0
+
+
 class _DocumentConversionInput(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     path_or_stream_iterator: Iterable[Union[Path, str, DocumentStream]]
     headers: Optional[Dict[str, str]] = None
     limits: Optional[DocumentLimits] = DocumentLimits()
+    cancel_token: Optional[CancellationToken] = None
+    preemption_point: Optional[Callable[[int, int], None]] = None
 
     def docs(
         self, format_options: Dict[InputFormat, "FormatOption"]
     ) -> Iterable[InputDocument]:
+        if settings.perf.doc_prefetch > 0:
+            yield from self._prefetched_docs(
+                format_options,
+                prefetch=settings.perf.doc_prefetch,
+                max_bytes=settings.perf.doc_prefetch_max_bytes,
+            )
+            return
+
         for item in self.path_or_stream_iterator:
-            obj = (
-                resolve_source_to_stream(item, self.headers)
-                if isinstance(item, str)
-                else item
+            yield self._create_input_document(item, format_options)
+
+    def _prefetched_docs(
+        self,
+        format_options: Dict[InputFormat, "FormatOption"],
+        prefetch: int,
+        max_bytes: int,
+    ) -> Iterable[InputDocument]:
+        """Prepare the next input documents on background threads, in input order.
+
+        Up to ``prefetch`` documents are prepared ahead of the consumer, as long
+        as the submitted but not yet consumed ones stay below ``max_bytes``.
+        """
+        items = iter(self.path_or_stream_iterator)
+        # futures with the input size known when they were submitted
+        queue: Deque[Tuple[Future, int]] = deque()
+        exhausted = False
+
+        def _buffered_bytes() -> int:
+            total = 0
+            for fut, submitted_size in queue:
+                if fut.done() and fut.exception() is None:
+                    total += fut.result().filesize or submitted_size
+                else:
+                    total += submitted_size
+            return total
+
+        with ThreadPoolExecutor(
+            max_workers=prefetch, thread_name_prefix="docling-prefetch"
+        ) as pool:
+            try:
+                while True:
+                    while (
+                        not exhausted
+                        and len(queue) < prefetch
+                        and (not queue or _buffered_bytes() < max_bytes)
+                    ):
+                        item = next(items, None)
+                        if item is None:
+                            exhausted = True
+                            break
+                        queue.append(
+                            (
+                                pool.submit(
+                                    self._create_input_document, item, format_options
+                                ),
+                                _input_size(item),
+                            )
+                        )
+                    if not queue:
+                        break
+                    yield queue.popleft()[0].result()
+            finally:
+                # Reached on errors and when the consumer stops early.
+                for fut, _ in queue:
+                    fut.cancel()
+                pool.shutdown(wait=True)
+                for fut, _ in queue:
+                    if not fut.cancelled() and fut.exception() is None:
+                        backend = getattr(fut.result(), "_backend", None)
+                        if backend is not None:
+                            backend.unload()
+
+    def _create_input_document(
+        self,
+        item: Union[Path, str, DocumentStream],
+        format_options: Dict[InputFormat, "FormatOption"],
+    ) -> InputDocument:
+        obj = (
+            resolve_source_to_stream(item, self.headers)
+            if isinstance(item, str)
+            else item
+        )
+        format = self._guess_format(obj)
+        backend: Type[AbstractDocumentBackend]
+        if format not in format_options.keys():
+            _log.error(
+                f"Input document {obj.name} with format {format} does not match any allowed format: ({format_options.keys()})"
             )
-            format = self._guess_format(obj)
-            backend: Type[AbstractDocumentBackend]
-            if format not in format_options.keys():
-                _log.error(
-                    f"Input document {obj.name} with format {format} does not match any allowed format: ({format_options.keys()})"
-                )
-                backend = _DummyBackend
-            else:
-                backend = format_options[format].backend
-
-            if isinstance(obj, Path):
-                yield InputDocument(
-                    path_or_stream=obj,
-                    format=format,  # type: ignore[arg-type]
-                    filename=obj.name,
-                    limits=self.limits,
-                    backend=backend,
-                )
-            elif isinstance(obj, DocumentStream):
-                yield InputDocument(
-                    path_or_stream=obj.stream,
-                    format=format,  # type: ignore[arg-type]
-                    filename=obj.name,
-                    limits=self.limits,
-                    backend=backend,
-                )
-            else:
-                raise RuntimeError(f"Unexpected obj type in iterator: {type(obj)}")
+            backend = _DummyBackend
+        else:
+            backend = format_options[format].backend
+
+        if isinstance(obj, Path):
+            in_doc = InputDocument(
+                path_or_stream=obj,
+                format=format,  # type: ignore[arg-type]
+                filename=obj.name,
+                limits=self.limits,
+                backend=backend,
+            )
+        elif isinstance(obj, DocumentStream):
+            in_doc = InputDocument(
+                path_or_stream=obj.stream,
+                format=format,  # type: ignore[arg-type]
+                filename=obj.name,
+                limits=self.limits,
+                backend=backend,
+            )
+        else:
+            raise RuntimeError(f"Unexpected obj type in iterator: {type(obj)}")
+        in_doc._cancel_token = self.cancel_token
+        in_doc._preemption_point = self.preemption_point
+        return in_doc
 
     def _guess_format(self, obj: Union[Path, DocumentStream]) -> Optional[InputFormat]:
         content = b""  # empty binary blob
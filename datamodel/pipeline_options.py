@@ -111,6 +111,7 @@ class RapidOcrOptions(OcrOptions):
     cls_model_path: Optional[str] = None  # same default as rapidocr
     rec_model_path: Optional[str] = None  # same default as rapidocr
     rec_keys_path: Optional[str] = None  # same default as rapidocr
+    rec_batch_num: Optional[int] = None  # same default as rapidocr
 
     model_config = ConfigDict(
         extra="forbid",
@@ -131,6 +132,9 @@ class EasyOcrOptions(OcrOptions):
     recog_network: Optional[str] = "standard"
     download_enabled: bool = True
 
+    # Text lines recognized per model call, across all regions of the page batch
+    recognition_batch_size: int = 32
+
     model_config = ConfigDict(
         extra="forbid",
         protected_namespaces=(),
@@ -142,6 +146,11 @@ class MyOcrOptions(OcrOptions):
     kind: ClassVar[Literal["myocr"]] = "myocr"
     lang: List[str] = ["fr", "de", "es", "en"]
 
+    # OpenAI-compatible chat-completions endpoint serving the olmOCR model
+    url: AnyUrl = AnyUrl("http://olmocr-7b:6008/v1/chat/completions")
+    # Seconds allowed for one request, less if the document deadline is closer
+    timeout: float = 300.0
+
     use_gpu: Optional[bool] = None
 
     confidence_threshold: float = 0.5
@@ -150,6 +159,28 @@ class MyOcrOptions(OcrOptions):
     recog_network: Optional[str] = "standard"
     download_enabled: bool = True
 
+    # Local engine reading the regions before the VLM. Regions it reads with a mean
+    # confidence of at least cascade_confidence_threshold are not sent to the VLM.
+    # None sends every region to the VLM.
+    cascade_ocr_options: Optional[Union[EasyOcrOptions, RapidOcrOptions]] = None
+    cascade_confidence_threshold: float = 0.8
+    # Layout classes always sent to the VLM
+    vlm_labels: List[str] = ["table", "formula", "chart", "image", "algorithm", "seal"]
+    # Completion budget of a region: its area in square points times
+    # vlm_tokens_per_area, within [vlm_min_tokens, vlm_max_tokens].
+    # None always allows vlm_max_tokens.
+    vlm_tokens_per_area: Optional[float] = 0.02
+    vlm_min_tokens: int = 256
+    vlm_max_tokens: int = 4096
+    # VLM requests: consecutive regions of at most merge_max_region_area square
+    # points, in one column and at most merge_max_gap points apart, are stacked
+    # into one image of at most merge_max_pixels, and text regions rendered
+    # larger than split_max_pixels are cut at blank rows
+    merge_max_region_area: float = 6000.0
+    merge_max_pixels: int = 1_000_000
+    merge_max_gap: float = 20.0
+    split_max_pixels: int = 4_000_000
+
     model_config = ConfigDict(
         extra="forbid",
         protected_namespaces=(),
@@ -163,6 +194,9 @@ class TesseractCliOcrOptions(OcrOptions):
     lang: List[str] = ["fra", "deu", "spa", "eng"]
     tesseract_cmd: str = "tesseract"
     path: Optional[str] = None
+    # Tesseract processes run at the same time, each on a share of the OCR regions
+    # of a page batch
+    num_processes: int = 1
 
     model_config = ConfigDict(
         extra="forbid",
@@ -282,6 +316,19 @@ class PaginatedPipelineOptions(PipelineOptions):
     generate_page_images: bool = False
     generate_picture_images: bool = False
 
+    # Directory of the page-level cache. When set, pages whose content was already
+    # converted with the same options reuse the cached outputs instead of running
+    # the models again.
+    page_cache_dir: Optional[Union[Path, str]] = None
+    # Size bound of the page cache, the least recently used pages are removed
+    # beyond it. None: unbounded.
+    page_cache_max_bytes: Optional[int] = 2 << 30
+
+    # Directory of the checkpoints of conversions. When set, the outputs of every
+    # page are saved as soon as it is done, and converting the same document with
+    # the same options again resumes after the pages already done.
+    checkpoint_dir: Optional[Union[Path, str]] = None
+
 
 class VlmPipelineOptions(PaginatedPipelineOptions):
     generate_page_images: bool = True
@@ -347,6 +394,46 @@ class PdfPipelineOptions(PaginatedPipelineOptions):
     )
 
 
+class ThreadedPdfPipelineOptions(PdfPipelineOptions):
+    """Pipeline options for the threaded PDF pipeline with batching and backpressure control"""
+
+    # Batch sizes for different stages
+    ocr_batch_size: int = 4
+    layout_batch_size: int = 4
+    table_batch_size: int = 4
+
+    # Worker threads per stage, sharing the stage input queue. Useful for
+    # network-bound stages or models releasing the GIL. Every replica loads its
+    # own model instance, so memory grows with the number of replicas.
+    ocr_replicas: int = 1
+    layout_replicas: int = 1
+    table_replicas: int = 1
+
+    # Timing control
+    batch_timeout_seconds: float = 2.0
+
+    # Backpressure and queue control
+    queue_max_size: int = 100
+
+
+class DistributedPdfPipelineOptions(PdfPipelineOptions):
+    """Pipeline options for the distributed PDF pipeline, whose page stages run on workers"""
+
+    # Broker shared by the coordinator and the workers,
+    # e.g. sqlite:////shared/docling/broker.db
+    broker_url: Optional[str] = None
+
+    # Pages sent to a worker in one task
+    shard_size: int = 16
+
+    # Seconds a worker has for a shard before it is handed to another worker
+    shard_lease: float = 600.0
+    shard_max_attempts: int = 3
+
+    # Seconds between two checks for finished shards
+    poll_interval: float = 0.2
+
+
 class ProcessingPipeline(str, Enum):
     STANDARD = "standard"
     VLM = "vlm"
@@ -1,6 +1,6 @@
 import sys
 from pathlib import Path
-from typing import Annotated, Optional, Tuple
+from typing import Annotated, Literal, Optional, Tuple
 
 from pydantic import BaseModel, PlainValidator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -28,6 +28,11 @@ class DocumentLimits(BaseModel):
 class BatchConcurrencySettings(BaseModel):
     doc_batch_size: int = 1  # Number of documents processed in one batch. Should be >= doc_batch_concurrency
     doc_batch_concurrency: int = 1  # Number of parallel threads processing documents. Warning: Experimental! No benefit expected without free-threaded python.
+    doc_unordered: bool = False  # Yield documents as they finish instead of in input order, using one pool for all documents with at most max(doc_batch_size, doc_batch_concurrency) in flight. Requires doc_batch_concurrency > 1.
+    doc_prefetch: int = 0  # Number of input documents prepared ahead on background threads (download, hashing, backend initialization).
+    doc_prefetch_max_bytes: int = 512 * 1024 * 1024  # Stop prefetching while the prepared documents waiting for conversion exceed this size.
+    doc_bundle_size: int = 0  # Convert up to this many consecutive single-page inputs (images, 1-page PDFs) sharing a pipeline as one bundle, so that page batches span several inputs. 0 or 1 disables bundling. Bundles are converted one after another.
+    input_hash: Literal["sha256", "blake2b", "xxh3_128"] = "sha256"  # Hash of the input documents. xxh3_128 is the fastest and requires the xxhash package.
     page_batch_size: int = 4  # Number of pages processed in one batch.
     page_batch_concurrency: int = 1  # Currently unused.
     elements_batch_size: int = (
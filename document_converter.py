@@ -4,10 +4,10 @@ import sys
 import threading
 import time
 from collections.abc import Iterable, Iterator
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Type, Union
+from typing import Callable, Dict, List, Optional, Set, Tuple, Type, Union
 
 from pydantic import BaseModel, ConfigDict, model_validator, validate_call
 
@@ -16,12 +16,14 @@ from docling.backend.asciidoc_backend import AsciiDocBackend
 from docling.backend.csv_backend import CsvDocumentBackend
 from docling.backend.docling_parse_v4_backend import DoclingParseV4DocumentBackend
 from docling.backend.html_backend import HTMLDocumentBackend
+from docling.backend.image_backend import ImageDocumentBackend
 from docling.backend.json.docling_json_backend import DoclingJSONBackend
 from docling.backend.md_backend import MarkdownDocumentBackend
 from docling.backend.msexcel_backend import MsExcelDocumentBackend
 from docling.backend.mspowerpoint_backend import MsPowerpointDocumentBackend
 from docling.backend.msword_backend import MsWordDocumentBackend
 from docling.backend.noop_backend import NoOpBackend
+from docling.backend.pdf_backend import PdfDocumentBackend
 from docling.backend.xml.jats_backend import JatsDocumentBackend
 from docling.backend.xml.uspto_backend import PatentUsptoDocumentBackend
 from docling.datamodel.base_models import (
@@ -48,6 +50,7 @@ from docling.pipeline.asr_pipeline import AsrPipeline
 from docling.pipeline.base_pipeline import BasePipeline
 from docling.pipeline.simple_pipeline import SimplePipeline
 from docling.pipeline.standard_pdf_pipeline import StandardPdfPipeline
+from docling.utils.cancellation import CancellationToken
 from docling.utils.utils import chunkify
 
 _log = logging.getLogger(__name__)
@@ -115,7 +118,7 @@ class XMLJatsFormatOption(FormatOption):
 
 class ImageFormatOption(FormatOption):
     pipeline_cls: Type = StandardPdfPipeline
-    backend: Type[AbstractDocumentBackend] = DoclingParseV4DocumentBackend
+    backend: Type[AbstractDocumentBackend] = ImageDocumentBackend
 
 
 class PdfFormatOption(FormatOption):
@@ -158,7 +161,7 @@ def _get_default_option(format: InputFormat) -> FormatOption:
             pipeline_cls=SimplePipeline, backend=JatsDocumentBackend
         ),
         InputFormat.IMAGE: FormatOption(
-            pipeline_cls=StandardPdfPipeline, backend=DoclingParseV4DocumentBackend
+            pipeline_cls=StandardPdfPipeline, backend=ImageDocumentBackend
         ),
         InputFormat.PDF: FormatOption(
             pipeline_cls=StandardPdfPipeline, backend=DoclingParseV4DocumentBackend
@@ -217,7 +220,7 @@ class DocumentConverter:
                 f"No pipeline could be initialized for format {format}"
             )
 
-    @validate_call(config=ConfigDict(strict=True))
+    @validate_call(config=ConfigDict(strict=True, arbitrary_types_allowed=True))
     def convert(
         self,
         source: Union[Path, str, DocumentStream],  # TODO review naming
@@ -226,6 +229,8 @@ class DocumentConverter:
         max_num_pages: int = sys.maxsize,
         max_file_size: int = sys.maxsize,
         page_range: PageRange = DEFAULT_PAGE_RANGE,
+        cancel_token: Optional[CancellationToken] = None,
+        preemption_point: Optional[Callable[[int, int], None]] = None,
     ) -> ConversionResult:
         all_res = self.convert_all(
             source=[source],
@@ -234,10 +239,12 @@ class DocumentConverter:
             max_file_size=max_file_size,
             headers=headers,
             page_range=page_range,
+            cancel_token=cancel_token,
+            preemption_point=preemption_point,
         )
         return next(all_res)
 
-    @validate_call(config=ConfigDict(strict=True))
+    @validate_call(config=ConfigDict(strict=True, arbitrary_types_allowed=True))
     def convert_all(
         self,
         source: Iterable[Union[Path, str, DocumentStream]],  # TODO review naming
@@ -246,6 +253,10 @@ class DocumentConverter:
         max_num_pages: int = sys.maxsize,
         max_file_size: int = sys.maxsize,
         page_range: PageRange = DEFAULT_PAGE_RANGE,
+        cancel_token: Optional[CancellationToken] = None,  # stops the conversions when cancelled
+        # called with (pages done, page count) between page batches, may block
+        # to let other jobs run, see utils.job_scheduler
+        preemption_point: Optional[Callable[[int, int], None]] = None,
     ) -> Iterator[ConversionResult]:
         limits = DocumentLimits(
             max_num_pages=max_num_pages,
@@ -253,7 +264,11 @@ class DocumentConverter:
             page_range=page_range,
         )
         conv_input = _DocumentConversionInput(
-            path_or_stream_iterator=source, limits=limits, headers=headers
+            path_or_stream_iterator=source,
+            limits=limits,
+            headers=headers,
+            cancel_token=cancel_token,
+            preemption_point=preemption_point,
         )
         conv_res_iter = self._convert(conv_input, raises_on_error=raises_on_error)
 
@@ -280,14 +295,22 @@ class DocumentConverter:
     ) -> Iterator[ConversionResult]:
         start_time = time.monotonic()
 
+        process_func = partial(self._process_indexed, raises_on_error=raises_on_error)
+        indexed_docs = enumerate(conv_input.docs(self.format_to_options))
+
+        if settings.perf.doc_bundle_size > 1:
+            yield from self._convert_bundled(indexed_docs, raises_on_error)
+            return
+
+        if settings.perf.doc_unordered and settings.perf.doc_batch_concurrency > 1:
+            yield from self._convert_unordered(indexed_docs, process_func)
+            return
+
         for input_batch in chunkify(
-            conv_input.docs(self.format_to_options),
+            indexed_docs,
             settings.perf.doc_batch_size,  # pass format_options
         ):
             _log.info("Going to convert document batch...")
-            process_func = partial(
-                self._process_document, raises_on_error=raises_on_error
-            )
 
             if (
                 settings.perf.doc_batch_concurrency > 1
@@ -313,6 +336,115 @@ class DocumentConverter:
                     )
                     yield item
 
+    def _convert_unordered(
+        self,
+        indexed_docs: Iterator[Tuple[int, InputDocument]],
+        process_func: Callable[[Tuple[int, InputDocument]], ConversionResult],
+    ) -> Iterator[ConversionResult]:
+        """Convert on a persistent pool, yielding results in completion order.
+
+        At most doc_batch_size documents (and at least one per thread) are in
+        flight, so a long document does not hold back the results behind it and
+        the pool does not drain at batch boundaries. Use
+        ConversionResult.input_index to map results back to their sources.
+        """
+        max_workers = settings.perf.doc_batch_concurrency
+        max_in_flight = max(settings.perf.doc_batch_size, max_workers)
+
+        in_flight: Set[Future] = set()
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            try:
+                for item in indexed_docs:
+                    if len(in_flight) >= max_in_flight:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for fut in done:
+                            yield fut.result()
+                    in_flight.add(pool.submit(process_func, item))
+
+                while in_flight:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for fut in done:
+                        yield fut.result()
+            finally:
+                # Reached on errors and when the consumer stops early.
+                for fut in in_flight:
+                    fut.cancel()
+
+    def _convert_bundled(
+        self,
+        indexed_docs: Iterator[Tuple[int, InputDocument]],
+        raises_on_error: bool,
+    ) -> Iterator[ConversionResult]:
+        """Convert in input order, bundling runs of single-page documents.
+
+        Consecutive single-page documents which share a pipeline are collected,
+        up to doc_bundle_size, and their pages are built together by
+        BasePipeline.execute_bundle. Other documents are converted on their own.
+        """
+        bundle: List[Tuple[int, InputDocument]] = []
+        bundle_pipeline: Optional[BasePipeline] = None
+        for index, in_doc in indexed_docs:
+            pipeline = self._get_bundle_pipeline(in_doc)
+            if bundle and (
+                pipeline is not bundle_pipeline
+                or len(bundle) >= settings.perf.doc_bundle_size
+            ):
+                assert bundle_pipeline is not None
+                yield from self._process_bundle(
+                    bundle, bundle_pipeline, raises_on_error
+                )
+                bundle = []
+
+            if pipeline is None:
+                yield self._process_indexed((index, in_doc), raises_on_error)
+            else:
+                bundle.append((index, in_doc))
+                bundle_pipeline = pipeline
+
+        if bundle:
+            assert bundle_pipeline is not None
+            yield from self._process_bundle(bundle, bundle_pipeline, raises_on_error)
+
+    def _get_bundle_pipeline(self, in_doc: InputDocument) -> Optional[BasePipeline]:
+        """The pipeline of ``in_doc`` if it can be converted in a bundle, else None."""
+        if (
+            not in_doc.valid
+            or in_doc.format not in self.allowed_formats
+            or in_doc.page_count != 1
+            or not isinstance(in_doc._backend, PdfDocumentBackend)
+        ):
+            return None
+        return self._get_pipeline(in_doc.format)
+
+    def _process_bundle(
+        self,
+        bundle: List[Tuple[int, InputDocument]],
+        pipeline: BasePipeline,
+        raises_on_error: bool,
+    ) -> List[ConversionResult]:
+        if len(bundle) == 1:
+            return [self._process_indexed(bundle[0], raises_on_error)]
+
+        start_time = time.monotonic()
+        results = pipeline.execute_bundle(
+            [in_doc for _, in_doc in bundle], raises_on_error=raises_on_error
+        )
+        for (index, _), conv_res in zip(bundle, results):
+            conv_res.input_index = index
+        _log.info(
+            f"Finished converting bundle of {len(bundle)} documents in "
+            f"{time.monotonic() - start_time:.2f} sec."
+        )
+        return results
+
+    def _process_indexed(
+        self, item: Tuple[int, InputDocument], raises_on_error: bool
+    ) -> ConversionResult:
+        index, in_doc = item
+        conv_res = self._process_document(in_doc, raises_on_error=raises_on_error)
+        conv_res.input_index = index
+        return conv_res
+
     def _get_pipeline(self, doc_format: InputFormat) -> Optional[BasePipeline]:
         """Retrieve or initialize a pipeline, reusing instances based on class and options."""
         fopt = self.format_to_options.get(doc_format)
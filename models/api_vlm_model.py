@@ -1,14 +1,17 @@
+import logging
 from collections.abc import Iterable
 from concurrent.futures import ThreadPoolExecutor
 
 from docling.datamodel.base_models import Page, VlmPrediction
 from docling.datamodel.document import ConversionResult
 from docling.datamodel.pipeline_options_vlm_model import ApiVlmOptions
-from docling.exceptions import OperationNotAllowed
+from docling.exceptions import ConversionCancelled, OperationNotAllowed
 from docling.models.base_model import BasePageModel
 from docling.utils.api_image_request import api_image_request
 from docling.utils.profiling import TimeRecorder
 
+_log = logging.getLogger(__name__)
+
 
 class ApiVlmModel(BasePageModel):
     def __init__(
@@ -39,7 +42,7 @@ class ApiVlmModel(BasePageModel):
     ) -> Iterable[Page]:
         def _vlm_request(page):
             assert page._backend is not None
-            if not page._backend.is_valid():
+            if not page._backend.is_valid() or conv_res._cancel_token.cancelled:
                 return page
             else:
                 with TimeRecorder(conv_res, "vlm"):
@@ -58,14 +61,18 @@ class ApiVlmModel(BasePageModel):
                     else:
                         prompt = self.vlm_options.prompt
 
-                    page_tags = api_image_request(
-                        image=hi_res_image,
-                        prompt=prompt,
-                        url=self.vlm_options.url,
-                        timeout=self.timeout,
-                        headers=self.vlm_options.headers,
-                        **self.params,
-                    )
+                    try:
+                        page_tags = api_image_request(
+                            image=hi_res_image,
+                            prompt=prompt,
+                            url=self.vlm_options.url,
+                            timeout=conv_res._cancel_token.timeout(self.timeout),
+                            headers=self.vlm_options.headers,
+                            **self.params,
+                        )
+                    except ConversionCancelled as e:
+                        _log.warning(f"Skipped VLM request of page {page.page_no}: {e}")
+                        return page
 
                     page.predictions.vlm_response = VlmPrediction(text=page_tags)
 
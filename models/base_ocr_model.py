@@ -9,7 +9,6 @@ import numpy as np
 from docling_core.types.doc import BoundingBox, CoordOrigin
 from docling_core.types.doc.page import TextCell
 from PIL import Image, ImageDraw
-from rtree import index
 
 from docling.datamodel.accelerator_options import AcceleratorOptions
 from docling.datamodel.base_models import Page
@@ -17,6 +16,7 @@ from docling.datamodel.document import ConversionResult
 from docling.datamodel.pipeline_options import OcrOptions
 from docling.datamodel.settings import settings
 from docling.models.base_model import BaseModelWithOptions, BasePageModel
+from docling.utils.cell_store import CellStore
 
 _log = logging.getLogger(__name__)
 
@@ -115,27 +115,12 @@ class BaseOcrModel(BasePageModel, BaseModelWithOptions):
     def _filter_ocr_cells(
         self, ocr_cells: List[TextCell], programmatic_cells: List[TextCell]
     ) -> List[TextCell]:
-        # Create R-tree index for programmatic cells
-        p = index.Property()
-        p.dimension = 2
-        idx = index.Index(properties=p)
-        for i, cell in enumerate(programmatic_cells):
-            idx.insert(i, cell.rect.to_bounding_box().as_tuple())
-
-        def is_overlapping_with_existing_cells(ocr_cell):
-            # Query the R-tree to get overlapping rectangles
-            possible_matches_index = list(
-                idx.intersection(ocr_cell.rect.to_bounding_box().as_tuple())
-            )
-
-            return (
-                len(possible_matches_index) > 0
-            )  # this is a weak criterion but it works.
-
-        filtered_ocr_cells = [
-            rect for rect in ocr_cells if not is_overlapping_with_existing_cells(rect)
-        ]
-        return filtered_ocr_cells
+        # Drop the OCR cells which intersect or touch any programmatic cell.
+        # This is a weak criterion but it works.
+        programmatic = CellStore(programmatic_cells)
+        ocr = CellStore(ocr_cells)
+        overlapping = programmatic.touched_by(ocr)
+        return [cell for cell, drop in zip(ocr.cells, overlapping) if not drop]
 
     def post_process_cells(self, ocr_cells: List[TextCell], page: Page) -> None:
         r"""
@@ -1,9 +1,10 @@
 import logging
+import math
 import warnings
 import zipfile
 from collections.abc import Iterable
 from pathlib import Path
-from typing import List, Optional, Type
+from typing import Any, List, Optional, Tuple, Type
 
 import numpy
 from docling_core.types.doc import BoundingBox, CoordOrigin
@@ -130,60 +131,133 @@ class EasyOcrModel(BaseOcrModel):
             yield from page_batch
             return
 
-        for page in page_batch:
-            assert page._backend is not None
-            if not page._backend.is_valid():
-                yield page
-            else:
-                with TimeRecorder(conv_res, "ocr"):
-                    ocr_rects = self.get_ocr_rects(page)
-
-                    all_ocr_cells = []
-                    for ocr_rect in ocr_rects:
-                        # Skip zero area boxes
-                        if ocr_rect.area() == 0:
-                            continue
-                        high_res_image = page._backend.get_page_image(
-                            scale=self.scale, cropbox=ocr_rect
-                        )
-                        im = numpy.array(high_res_image)
-                        result = self.reader.readtext(im)
-
-                        del high_res_image
-                        del im
-
-                        cells = [
-                            TextCell(
-                                index=ix,
-                                text=line[1],
-                                orig=line[1],
-                                from_ocr=True,
-                                confidence=line[2],
-                                rect=BoundingRectangle.from_bounding_box(
-                                    BoundingBox.from_tuple(
-                                        coord=(
-                                            (line[0][0][0] / self.scale) + ocr_rect.l,
-                                            (line[0][0][1] / self.scale) + ocr_rect.t,
-                                            (line[0][2][0] / self.scale) + ocr_rect.l,
-                                            (line[0][2][1] / self.scale) + ocr_rect.t,
-                                        ),
-                                        origin=CoordOrigin.TOPLEFT,
-                                    )
+        pages = list(page_batch)
+        valid = [p._backend is not None and p._backend.is_valid() for p in pages]
+        page_rects: List[List[BoundingBox]] = []
+        with TimeRecorder(conv_res, "ocr"):
+            regions: List[Tuple[int, BoundingBox]] = []
+            for page_ix, page in enumerate(pages):
+                ocr_rects = self.get_ocr_rects(page) if valid[page_ix] else []
+                page_rects.append(ocr_rects)
+                # Skip zero area boxes
+                regions.extend(
+                    (page_ix, ocr_rect) for ocr_rect in ocr_rects if ocr_rect.area() > 0
+                )
+
+            region_images = (
+                numpy.array(
+                    pages[page_ix]._backend.get_page_image(  # type: ignore[union-attr]
+                        scale=self.scale, cropbox=ocr_rect
+                    )
+                )
+                for page_ix, ocr_rect in regions
+            )
+            results = self._read_regions(region_images)
+
+            page_cells: List[List[TextCell]] = [[] for _ in pages]
+            for (page_ix, ocr_rect), result in zip(regions, results):
+                page_cells[page_ix].extend(
+                    TextCell(
+                        index=ix,
+                        text=line[1],
+                        orig=line[1],
+                        from_ocr=True,
+                        confidence=line[2],
+                        rect=BoundingRectangle.from_bounding_box(
+                            BoundingBox.from_tuple(
+                                coord=(
+                                    (line[0][0][0] / self.scale) + ocr_rect.l,
+                                    (line[0][0][1] / self.scale) + ocr_rect.t,
+                                    (line[0][2][0] / self.scale) + ocr_rect.l,
+                                    (line[0][2][1] / self.scale) + ocr_rect.t,
                                 ),
+                                origin=CoordOrigin.TOPLEFT,
                             )
-                            for ix, line in enumerate(result)
-                            if line[2] >= self.options.confidence_threshold
-                        ]
-                        all_ocr_cells.extend(cells)
+                        ),
+                    )
+                    for ix, line in enumerate(result)
+                    if line[2] >= self.options.confidence_threshold
+                )
+
+            # Post-process the cells
+            for page_ix, page in enumerate(pages):
+                if valid[page_ix]:
+                    self.post_process_cells(page_cells[page_ix], page)
+
+        for page_ix, page in enumerate(pages):
+            # DEBUG code:
+            if settings.debug.visualize_ocr and valid[page_ix]:
+                self.draw_ocr_rects_and_cells(conv_res, page, page_rects[page_ix])
 
-                    # Post-process the cells
-                    self.post_process_cells(all_ocr_cells, page)
+            yield page
 
-                # DEBUG code:
-                if settings.debug.visualize_ocr:
-                    self.draw_ocr_rects_and_cells(conv_res, page, ocr_rects)
+    def _read_regions(self, images: Iterable[numpy.ndarray]) -> List[List[Any]]:
+        """``reader.readtext`` of every image, recognizing their text lines in batches.
+
+        The text lines are detected image by image, as the images are rendered.
+        The line crops of all images are then sorted by width, so that little
+        padding is needed, and recognized ``options.recognition_batch_size`` at
+        a time instead of one line per model call.
+        """
+        if self.reader.model_lang == "arabic":
+            # Lines are reordered for display, keep the reader's own path
+            return [self.reader.readtext(im) for im in images]
+
+        from easyocr import easyocr as easyocr_module
+        from easyocr.recognition import get_text
+        from easyocr.utils import get_image_list, reformat_input
+
+        model_height = easyocr_module.imgH  # replaced by custom recognition networks
+
+        # (image index, line index, box, crop) of every detected text line
+        lines: List[Tuple[int, int, Any, numpy.ndarray]] = []
+        num_images = 0
+        for image_ix, im in enumerate(images):
+            num_images += 1
+            img, img_cv_grey = reformat_input(im)
+            horizontal_list, free_list = self.reader.detect(img, reformat=False)
+            # Same order as reader.recognize(): horizontal boxes, then free ones
+            for h_list, f_list in ((horizontal_list[0], []), ([], free_list[0])):
+                crops, _ = get_image_list(
+                    h_list, f_list, img_cv_grey, model_height=model_height, sort_output=False
+                )
+                lines.extend(
+                    (image_ix, len(lines), box, crop) for box, crop in crops
+                )
+
+        ignore_char = "".join(set(self.reader.character) - set(self.reader.lang_char))
+        batch_size = max(1, self.options.recognition_batch_size)
+        recognized: List[Tuple[int, int, Any]] = []
+        lines.sort(key=lambda line: line[3].shape[1])
+        for start in range(0, len(lines), batch_size):
+            batch = lines[start : start + batch_size]
+            max_ratio = max(1.0, max(line[3].shape[1] / model_height for line in batch))
+            batch_result = get_text(
+                self.reader.character,
+                model_height,
+                math.ceil(max_ratio) * model_height,
+                self.reader.recognizer,
+                self.reader.converter,
+                [(box, crop) for _, _, box, crop in batch],
+                ignore_char,
+                "greedy",
+                5,
+                batch_size,
+                0.1,  # contrast_ths
+                0.5,  # adjust_contrast
+                0.003,  # filter_ths
+                0,  # workers
+                self.reader.device,
+            )
+            recognized.extend(
+                (image_ix, line_ix, result)
+                for (image_ix, line_ix, _, _), result in zip(batch, batch_result)
+            )
 
-                yield page
+        results: List[List[Any]] = [[] for _ in range(num_images)]
+        for image_ix, _, result in sorted(recognized, key=lambda item: item[1]):
+            results[image_ix].append(result)
+        return results
 
     @classmethod
     def get_options_type(cls) -> Type[OcrOptions]:
@@ -148,6 +148,18 @@ class LayoutModel(BasePageModel):
     def __call__(
         self, conv_res: ConversionResult, page_batch: Iterable[Page]
     ) -> Iterable[Page]:
+        yield from self.postprocess_layout(
+            conv_res, self.predict_layout(conv_res, page_batch)
+        )
+
+    def predict_layout(
+        self, conv_res: ConversionResult, page_batch: Iterable[Page]
+    ) -> Iterable[Page]:
+        """Run the layout predictor and store the raw clusters in the page predictions.
+
+        Only the page images are used, so this can run while the OCR model adds
+        its cells to the same pages.
+        """
         # Convert to list to allow multiple iterations
         pages = list(page_batch)
 
@@ -205,9 +217,23 @@ class LayoutModel(BasePageModel):
                     conv_res, page, clusters, mode_prefix="raw"
                 )
 
+            page.predictions.layout = LayoutPrediction(clusters=clusters)
+
+            yield page
+
+    def postprocess_layout(
+        self, conv_res: ConversionResult, page_batch: Iterable[Page]
+    ) -> Iterable[Page]:
+        """Match the raw clusters of ``predict_layout`` with the page cells, OCR cells included."""
+        for page in page_batch:
+            assert page._backend is not None
+            if not page._backend.is_valid() or page.predictions.layout is None:
+                yield page
+                continue
+
             # Apply postprocessing
             processed_clusters, processed_cells = LayoutPostprocessor(
-                page, clusters, self.options
+                page, page.predictions.layout.clusters, self.options
             ).postprocess()
             # Note: LayoutPostprocessor updates page.cells and page.parsed_page internally
 
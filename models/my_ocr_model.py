@@ -3,22 +3,30 @@ import warnings
 import zipfile
 from collections.abc import Iterable
 from pathlib import Path
-from typing import List, Optional, Type
+from typing import TYPE_CHECKING, List, Optional, Tuple, Type, Union
 
 import numpy as np
 from docling_core.types.doc import BoundingBox, CoordOrigin
 from docling_core.types.doc.page import BoundingRectangle, TextCell
 
 from docling.datamodel.accelerator_options import AcceleratorDevice, AcceleratorOptions
-from docling.datamodel.base_models import Page
+from docling.datamodel.base_models import OcrRegionRoute, Page
 from docling.datamodel.document import ConversionResult
 from docling.datamodel.pipeline_options import (
+    EasyOcrOptions,
     MyOcrOptions,
     OcrOptions,
 )
 from docling.datamodel.settings import settings
+from docling.exceptions import ConversionCancelled
 from docling.models.base_ocr_model import BaseOcrModel
 from docling.utils.accelerator_utils import decide_device
+from docling.utils.ocr_region_planner import (
+    VlmRegion,
+    VlmRequest,
+    assign_texts,
+    plan_vlm_requests,
+)
 from docling.utils.profiling import TimeRecorder
 from docling.utils.utils import download_url_with_progress
 
@@ -32,8 +40,13 @@ import json
 import concurrent.futures
 import uuid
 import datetime
+import math
 import os
 
+if TYPE_CHECKING:
+    from docling.models.easyocr_model import EasyOcrModel
+    from docling.models.rapid_ocr_model import RapidOcrModel
+
 _log = logging.getLogger(__name__)
 SAVE_FAILED_IMAGE_DIR = "/tmp/failed_images"
 
@@ -103,6 +116,29 @@ class MyOcrModel(BaseOcrModel):
                 verbose=False,
             )
 
+        # Cheap local engine of the cascade, reading regions before the VLM
+        self.local_model: Optional[Union["EasyOcrModel", "RapidOcrModel"]] = None
+        if self.enabled and self.options.cascade_ocr_options is not None:
+            local_options = self.options.cascade_ocr_options
+            if isinstance(local_options, EasyOcrOptions):
+                from docling.models.easyocr_model import EasyOcrModel
+
+                self.local_model = EasyOcrModel(
+                    enabled=True,
+                    artifacts_path=artifacts_path,
+                    options=local_options,
+                    accelerator_options=accelerator_options,
+                )
+            else:
+                from docling.models.rapid_ocr_model import RapidOcrModel
+
+                self.local_model = RapidOcrModel(
+                    enabled=True,
+                    artifacts_path=artifacts_path,
+                    options=local_options,
+                    accelerator_options=accelerator_options,
+                )
+
     @staticmethod
     def download_models(
         detection_models: List[str] = ["craft"],
@@ -148,7 +184,8 @@ class MyOcrModel(BaseOcrModel):
 
         for page in page_batch:
             assert page._backend is not None
-            if not page._backend.is_valid():
+            # No OCR once the conversion is cancelled or out of time
+            if not page._backend.is_valid() or conv_res._cancel_token.cancelled:
                 yield page
             else:
                 with TimeRecorder(conv_res, "ocr"):
@@ -156,23 +193,28 @@ class MyOcrModel(BaseOcrModel):
                     # print(len(ocr_rects))
                     # exit(0)
                     # print(ocr_rects)
-                    ocr_rects = self.get_ocr_rects2(page)
+                    ocr_regions = self.get_ocr_regions(page)
+                    ocr_rects = [ocr_rect for ocr_rect, _ in ocr_regions]
                     # print(ocr_rects)
                     # exit(0)
 
-                    def handle_one_ocr_rect(ocr_rect: BoundingBox) -> List[TextCell]:
-                        if ocr_rect.area() == 0:
-                            return None
+                    local_cells, routes = self._read_regions_locally(
+                        conv_res, page, ocr_regions
+                    )
+                    page.predictions.ocr_routes = routes
 
+                    def render_region(ocr_rect: BoundingBox) -> Image.Image:
                         if ocr_rect.b - ocr_rect.t < 31 or ocr_rect.r - ocr_rect.l < 31:
-                            high_res_image = page._backend.get_page_image(
+                            return page._backend.get_page_image(
                                 scale=6, cropbox=ocr_rect
                             )
-                        else:
-                            high_res_image = page._backend.get_page_image(
-                                scale=self.scale, cropbox=ocr_rect
-                            )
-                        print(high_res_image)
+                        return page._backend.get_page_image(
+                            scale=self.scale, cropbox=ocr_rect
+                        )
+
+                    def handle_one_request(request: VlmRequest) -> str:
+                        if conv_res._cancel_token.cancelled:
+                            return ""
 
                         # try:
                         #     # 尝试创建一个详细的文件名
@@ -227,12 +269,10 @@ class MyOcrModel(BaseOcrModel):
                                         ]
                                     }
                                 ],
-                                "max_tokens": 4096,
+                                "max_tokens": request.max_tokens,
                                 "temperature": 0.0
                             }
 
-                            response = requests.post("http://olmocr-7b:6008/v1/chat/completions", json=payload, headers=headers)
-
                             def _save_failed_image(image: Image.Image, prefix="failed"):
                                 ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
                                 fname = f"{prefix}_{ts}_{uuid.uuid4().hex[:8]}.png"
@@ -242,6 +282,18 @@ class MyOcrModel(BaseOcrModel):
                                     _log.info(f"Saved failed image to {fpath}")
                                 except Exception as e:
                                     _log.error(f"Failed to save failed image: {e}")
+
+                            try:
+                                # Bounded by the deadline of the conversion
+                                timeout = conv_res._cancel_token.timeout(self.options.timeout)
+                                response = requests.post(str(self.options.url), json=payload, headers=headers, timeout=timeout)
+                            except ConversionCancelled as e:
+                                _log.warning(f"Skipped olmocr request: {e}")
+                                return  {"choices": [{"message": {"content": ""}}]}
+                            except requests.RequestException as e:
+                                _save_failed_image(image, prefix="request_error")
+                                _log.error(f"Failed to get response from olmocr: {e}")
+                                return  {"choices": [{"message": {"content": ""}}]}
                             if response.status_code != 200:
                                 _save_failed_image(image, prefix="http_error")
                                 _log.error(f"Failed to get response from olmocr: {response.status_code} {response.text}")
@@ -254,10 +306,13 @@ class MyOcrModel(BaseOcrModel):
                                 return  {"choices": [{"message": {"content": ""}}]}
 
 
-                        response = send_reqeust_to_olmocr(high_res_image)
+                        response = send_reqeust_to_olmocr(request.image)
                         content = response.get("choices", [{}])[0].get("message", {}).get("content", "")
                         try:
                             parsed = json.loads(content)
+                            if not isinstance(parsed, dict):
+                                # e.g. a page number, which is valid JSON
+                                return content
                             content_text = parsed.get("text", "")
                             if content_text == "":
                                 content_text = parsed.get("content", "")
@@ -270,17 +325,7 @@ class MyOcrModel(BaseOcrModel):
                             
                         # print(content_text)
                         # exit(0)
-                        if content_text == None or content_text == "":
-                            return None
-                        cells = TextCell(
-                                index=0,
-                                text=content_text,
-                                orig=content_text,
-                                from_ocr=True,
-                                confidence=1,
-                                rect=BoundingRectangle.from_bounding_box(ocr_rect)
-                            )
-                        return cells
+                        return content_text or ""
                     
                     # all_ocr_cells = []
                     # for ocr_rect in ocr_rects:
@@ -289,10 +334,37 @@ class MyOcrModel(BaseOcrModel):
                     #     if cells is not None:
                     #         all_ocr_cells.extend(cells)
 
+                    # Few requests: small regions are stacked, large ones split
+                    vlm_routes = [route for route in routes if route.engine == "vlm"]
+                    vlm_requests = plan_vlm_requests(
+                        [VlmRegion(bbox=route.bbox, label=route.label) for route in vlm_routes],
+                        render=render_region,
+                        token_budget=self._vlm_max_tokens,
+                        whole_labels=self.options.vlm_labels,
+                        merge_max_region_area=self.options.merge_max_region_area,
+                        merge_max_pixels=self.options.merge_max_pixels,
+                        merge_max_gap=self.options.merge_max_gap,
+                        split_max_pixels=self.options.split_max_pixels,
+                    )
                     MAX_WORKERS = 1
-                    with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-                        results_iterator = executor.map(handle_one_ocr_rect, ocr_rects)
-                    all_ocr_cells = [result for result in results_iterator if result is not None]
+                    with TimeRecorder(conv_res, "ocr_vlm"), concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                        texts = list(executor.map(handle_one_request, vlm_requests))
+
+                    vlm_cells = []
+                    for region_ix, content_text in assign_texts(vlm_requests, texts):
+                        vlm_cells.append(
+                            TextCell(
+                                index=len(vlm_cells),
+                                text=content_text,
+                                orig=content_text,
+                                from_ocr=True,
+                                confidence=1,
+                                rect=BoundingRectangle.from_bounding_box(
+                                    vlm_routes[region_ix].bbox
+                                ),
+                            )
+                        )
+                    all_ocr_cells = local_cells + vlm_cells
                     
                     self.post_process_cells(all_ocr_cells, page)
 
@@ -308,22 +380,151 @@ class MyOcrModel(BaseOcrModel):
 
 
     def get_ocr_rects2(self, page: Page) -> List[BoundingBox]: # use paddleocr to detect text boxes
+        return [ocr_rect for ocr_rect, _ in self.get_ocr_regions(page)]
+
+    def get_ocr_regions(self, page: Page) -> List[Tuple[BoundingBox, str]]:
+        """Regions detected by the paddleocr layout model, with their class label."""
         assert page.size is not None
         img_np = np.array(page.get_image())
         results = self.layout_model.predict(img_np, batch_size=1, layout_nms=True)
 
-        ocr_boxes = []
+        ocr_regions = []
         for res in results:
             for box in res['boxes']:
                 xmin, ymin, xmax, ymax = map(float, box['coordinate'])
-                ocr_boxes.append(
-                    BoundingBox(
-                        l=xmin,
-                        t=ymin,
-                        r=xmax,
-                        b=ymax,
-                        coord_origin=CoordOrigin.TOPLEFT
+                ocr_regions.append(
+                    (
+                        BoundingBox(
+                            l=xmin,
+                            t=ymin,
+                            r=xmax,
+                            b=ymax,
+                            coord_origin=CoordOrigin.TOPLEFT
+                        ),
+                        str(box.get('label', '')),
                     )
                 )
 
-        return ocr_boxes
+        return ocr_regions
+
+    def _vlm_max_tokens(self, area: float) -> int:
+        """Completion budget of a VLM request, from the area it covers."""
+        if self.options.vlm_tokens_per_area is None:
+            return self.options.vlm_max_tokens
+        max_tokens = math.ceil(area * self.options.vlm_tokens_per_area)
+        return min(self.options.vlm_max_tokens, max(self.options.vlm_min_tokens, max_tokens))
+
+    def _read_regions_locally(
+        self,
+        conv_res: ConversionResult,
+        page: Page,
+        ocr_regions: List[Tuple[BoundingBox, str]],
+    ) -> Tuple[List[TextCell], List[OcrRegionRoute]]:
+        """Read the regions with the local engine, and route the others to the VLM.
+
+        A region goes to the VLM if its class is one of ``vlm_labels``, or if the
+        local engine finds no text in it or reads it with a mean confidence, by
+        character, below ``cascade_confidence_threshold``.
+        """
+        routes: List[Optional[OcrRegionRoute]] = []
+        local_ixs = []
+        for ix, (ocr_rect, label) in enumerate(ocr_regions):
+            # Skip zero area boxes
+            if ocr_rect.area() == 0:
+                routes.append(None)
+                continue
+            if self.local_model is None:
+                reason = "no_cascade"
+            elif label in self.options.vlm_labels:
+                reason = "label"
+            else:
+                routes.append(None)
+                local_ixs.append(ix)
+                continue
+            routes.append(
+                OcrRegionRoute(
+                    bbox=ocr_rect,
+                    label=label,
+                    engine="vlm",
+                    reason=reason,
+                    max_tokens=self._vlm_max_tokens(ocr_rect.area()),
+                )
+            )
+
+        local_cells: List[TextCell] = []
+        if self.local_model is not None and local_ixs:
+            assert self.options.cascade_ocr_options is not None
+            engine = self.options.cascade_ocr_options.kind
+            images = (
+                np.array(
+                    page._backend.get_page_image(  # type: ignore[union-attr]
+                        scale=self.local_model.scale, cropbox=ocr_regions[ix][0]
+                    )
+                )
+                for ix in local_ixs
+            )
+            with TimeRecorder(conv_res, "ocr_local"):
+                results = self.local_model._read_regions(images)
+
+            for ix, result in zip(local_ixs, results):
+                ocr_rect, label = ocr_regions[ix]
+                lines = [line for line in (result or []) if line[1].strip()]
+                n_chars = sum(len(line[1]) for line in lines)
+                confidence = (
+                    sum(len(line[1]) * float(line[2]) for line in lines) / n_chars
+                    if n_chars > 0
+                    else None
+                )
+                if confidence is None:
+                    reason = "no_text"
+                elif confidence < self.options.cascade_confidence_threshold:
+                    reason = "low_confidence"
+                else:
+                    routes[ix] = OcrRegionRoute(
+                        bbox=ocr_rect,
+                        label=label,
+                        engine=engine,
+                        reason="confident",
+                        confidence=confidence,
+                    )
+                    local_cells.extend(
+                        self._lines_to_cells(lines, ocr_rect, self.local_model.scale)
+                    )
+                    continue
+                routes[ix] = OcrRegionRoute(
+                    bbox=ocr_rect,
+                    label=label,
+                    engine="vlm",
+                    reason=reason,
+                    confidence=confidence,
+                    max_tokens=self._vlm_max_tokens(ocr_rect.area()),
+                )
+
+        return local_cells, [route for route in routes if route is not None]
+
+    @staticmethod
+    def _lines_to_cells(
+        lines: List, ocr_rect: BoundingBox, scale: float
+    ) -> List[TextCell]:
+        """Cells of the ``[box, text, confidence]`` lines read in a region image."""
+        return [
+            TextCell(
+                index=ix,
+                text=line[1],
+                orig=line[1],
+                from_ocr=True,
+                confidence=float(line[2]),
+                rect=BoundingRectangle.from_bounding_box(
+                    BoundingBox.from_tuple(
+                        coord=(
+                            (line[0][0][0] / scale) + ocr_rect.l,
+                            (line[0][0][1] / scale) + ocr_rect.t,
+                            (line[0][2][0] / scale) + ocr_rect.l,
+                            (line[0][2][1] / scale) + ocr_rect.t,
+                        ),
+                        origin=CoordOrigin.TOPLEFT,
+                    )
+                ),
+            )
+            for ix, line in enumerate(lines)
+        ]
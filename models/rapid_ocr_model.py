@@ -1,7 +1,7 @@
 import logging
 from collections.abc import Iterable
 from pathlib import Path
-from typing import Optional, Type
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 import numpy
 from docling_core.types.doc import BoundingBox, CoordOrigin
@@ -55,6 +55,11 @@ class RapidOcrModel(BaseOcrModel):
             use_dml = accelerator_options.device == AcceleratorDevice.AUTO
             intra_op_num_threads = accelerator_options.num_threads
 
+            # Only passed when set, so that the rapidocr config default applies
+            extra_params = {}
+            if self.options.rec_batch_num is not None:
+                extra_params["rec_batch_num"] = self.options.rec_batch_num
+
             self.reader = RapidOCR(
                 text_score=self.options.text_score,
                 cls_use_cuda=use_cuda,
@@ -69,6 +74,23 @@ class RapidOcrModel(BaseOcrModel):
                 cls_model_path=self.options.cls_model_path,
                 rec_model_path=self.options.rec_model_path,
                 rec_keys_path=self.options.rec_keys_path,
+                **extra_params,
+            )
+
+            # The steps of RapidOCR.__call__, run separately to batch recognition
+            self._batched_recognition = all(
+                hasattr(self.reader, name)
+                for name in (
+                    "load_img",
+                    "preprocess",
+                    "maybe_add_letterbox",
+                    "auto_text_det",
+                    "get_crop_img_list",
+                    "text_cls",
+                    "text_rec",
+                    "_get_origin_points",
+                    "text_score",
+                )
             )
 
     def __call__(
@@ -78,69 +100,127 @@ class RapidOcrModel(BaseOcrModel):
             yield from page_batch
             return
 
-        for page in page_batch:
-            assert page._backend is not None
-            if not page._backend.is_valid():
-                yield page
-            else:
-                with TimeRecorder(conv_res, "ocr"):
-                    ocr_rects = self.get_ocr_rects(page)
-
-                    all_ocr_cells = []
-                    for ocr_rect in ocr_rects:
-                        # Skip zero area boxes
-                        if ocr_rect.area() == 0:
-                            continue
-                        high_res_image = page._backend.get_page_image(
-                            scale=self.scale, cropbox=ocr_rect
-                        )
-                        im = numpy.array(high_res_image)
-                        result, _ = self.reader(
-                            im,
-                            use_det=self.options.use_det,
-                            use_cls=self.options.use_cls,
-                            use_rec=self.options.use_rec,
-                        )
-
-                        del high_res_image
-                        del im
-
-                        if result is not None:
-                            cells = [
-                                TextCell(
-                                    index=ix,
-                                    text=line[1],
-                                    orig=line[1],
-                                    confidence=line[2],
-                                    from_ocr=True,
-                                    rect=BoundingRectangle.from_bounding_box(
-                                        BoundingBox.from_tuple(
-                                            coord=(
-                                                (line[0][0][0] / self.scale)
-                                                + ocr_rect.l,
-                                                (line[0][0][1] / self.scale)
-                                                + ocr_rect.t,
-                                                (line[0][2][0] / self.scale)
-                                                + ocr_rect.l,
-                                                (line[0][2][1] / self.scale)
-                                                + ocr_rect.t,
-                                            ),
-                                            origin=CoordOrigin.TOPLEFT,
-                                        )
-                                    ),
-                                )
-                                for ix, line in enumerate(result)
-                            ]
-                            all_ocr_cells.extend(cells)
-
-                    # Post-process the cells
-                    self.post_process_cells(all_ocr_cells, page)
-
-                # DEBUG code:
-                if settings.debug.visualize_ocr:
-                    self.draw_ocr_rects_and_cells(conv_res, page, ocr_rects)
-
-                yield page
+        pages = list(page_batch)
+        valid = [p._backend is not None and p._backend.is_valid() for p in pages]
+        page_rects: List[List[BoundingBox]] = []
+        with TimeRecorder(conv_res, "ocr"):
+            regions: List[Tuple[int, BoundingBox]] = []
+            for page_ix, page in enumerate(pages):
+                ocr_rects = self.get_ocr_rects(page) if valid[page_ix] else []
+                page_rects.append(ocr_rects)
+                # Skip zero area boxes
+                regions.extend(
+                    (page_ix, ocr_rect) for ocr_rect in ocr_rects if ocr_rect.area() > 0
+                )
+
+            region_images = (
+                numpy.array(
+                    pages[page_ix]._backend.get_page_image(  # type: ignore[union-attr]
+                        scale=self.scale, cropbox=ocr_rect
+                    )
+                )
+                for page_ix, ocr_rect in regions
+            )
+            results = self._read_regions(region_images)
+
+            page_cells: List[List[TextCell]] = [[] for _ in pages]
+            for (page_ix, ocr_rect), result in zip(regions, results):
+                if result is None:
+                    continue
+                page_cells[page_ix].extend(
+                    TextCell(
+                        index=ix,
+                        text=line[1],
+                        orig=line[1],
+                        confidence=line[2],
+                        from_ocr=True,
+                        rect=BoundingRectangle.from_bounding_box(
+                            BoundingBox.from_tuple(
+                                coord=(
+                                    (line[0][0][0] / self.scale) + ocr_rect.l,
+                                    (line[0][0][1] / self.scale) + ocr_rect.t,
+                                    (line[0][2][0] / self.scale) + ocr_rect.l,
+                                    (line[0][2][1] / self.scale) + ocr_rect.t,
+                                ),
+                                origin=CoordOrigin.TOPLEFT,
+                            )
+                        ),
+                    )
+                    for ix, line in enumerate(result)
+                )
+
+            # Post-process the cells
+            for page_ix, page in enumerate(pages):
+                if valid[page_ix]:
+                    self.post_process_cells(page_cells[page_ix], page)
+
+        for page_ix, page in enumerate(pages):
+            # DEBUG code:
+            if settings.debug.visualize_ocr and valid[page_ix]:
+                self.draw_ocr_rects_and_cells(conv_res, page, page_rects[page_ix])
+
+            yield page
+
+    def _read_regions(self, images: Iterable[numpy.ndarray]) -> List[Optional[List[Any]]]:
+        """The lines ``reader(image)`` finds in every image, recognized in batches.
+
+        Text lines are detected image by image, as the images are rendered. The
+        line crops of all images are then classified and recognized together,
+        so the recognizer batches (``rec_batch_num``, sorted by width) are full
+        instead of being cut at every region.
+        """
+        use_det = self.reader.use_det if self.options.use_det is None else self.options.use_det
+        use_cls = self.reader.use_cls if self.options.use_cls is None else self.options.use_cls
+        use_rec = self.reader.use_rec if self.options.use_rec is None else self.options.use_rec
+        if not (self._batched_recognition and use_det and use_rec):
+            return [
+                self.reader(
+                    im,
+                    use_det=self.options.use_det,
+                    use_cls=self.options.use_cls,
+                    use_rec=self.options.use_rec,
+                )[0]
+                for im in images
+            ]
+
+        # (boxes, preprocessing record, raw height, raw width, first crop) per image
+        detections: List[Optional[Tuple[Any, Dict[str, Any], int, int, int]]] = []
+        crops: List[numpy.ndarray] = []
+        for im in images:
+            img = self.reader.load_img(im)
+            raw_h, raw_w = img.shape[:2]
+            img, ratio_h, ratio_w = self.reader.preprocess(img)
+            op_record: Dict[str, Any] = {
+                "preprocess": {"ratio_h": ratio_h, "ratio_w": ratio_w}
+            }
+            img, op_record = self.reader.maybe_add_letterbox(img, op_record)
+            dt_boxes, _ = self.reader.auto_text_det(img)
+            if dt_boxes is None:
+                detections.append(None)
+                continue
+            detections.append((dt_boxes, op_record, raw_h, raw_w, len(crops)))
+            crops.extend(self.reader.get_crop_img_list(img, dt_boxes))
+
+        rec_res: List[Any] = []
+        if crops:
+            if use_cls:
+                crops, _, _ = self.reader.text_cls(crops)
+            rec_res, _ = self.reader.text_rec(crops)
+
+        results: List[Optional[List[Any]]] = []
+        for detection in detections:
+            if detection is None:
+                results.append(None)
+                continue
+            dt_boxes, op_record, raw_h, raw_w, start = detection
+            boxes = self.reader._get_origin_points(dt_boxes, op_record, raw_h, raw_w)
+            lines = [
+                [box.tolist(), *res]
+                for box, res in zip(boxes, rec_res[start : start + len(dt_boxes)])
+                if float(res[1]) >= self.reader.text_score
+            ]
+            results.append(lines or None)
+        return results
 
     @classmethod
     def get_options_type(cls) -> Type[OcrOptions]:
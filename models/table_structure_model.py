@@ -1,15 +1,11 @@
-import copy
 import warnings
 from collections.abc import Iterable
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 import numpy
-from docling_core.types.doc import BoundingBox, DocItemLabel, TableCell
-from docling_core.types.doc.page import (
-    BoundingRectangle,
-    TextCellUnit,
-)
+from docling_core.types.doc import BoundingBox, CoordOrigin, DocItemLabel, TableCell
+from docling_core.types.doc.page import TextCellUnit
 from PIL import ImageDraw
 
 from docling.datamodel.accelerator_options import AcceleratorDevice, AcceleratorOptions
@@ -23,6 +19,7 @@ from docling.datamodel.settings import settings
 from docling.models.base_model import BasePageModel
 from docling.models.utils.hf_model_download import download_hf_model
 from docling.utils.accelerator_utils import decide_device
+from docling.utils.cell_store import CellStore
 from docling.utils.profiling import TimeRecorder
 
 
@@ -167,6 +164,40 @@ class TableStructureModel(BasePageModel):
             out_file = out_path / f"table_struct_page_{page.page_no:05}.png"
             image.save(str(out_file), format="png")
 
+    def _table_tokens(
+        self,
+        store: CellStore,
+        selected: numpy.ndarray,
+        coord_origin: Optional[CoordOrigin] = None,
+        page_height: Optional[float] = None,
+    ) -> List[dict]:
+        """TableFormer tokens of the selected non-empty cells, scaled to the image."""
+        coord_origin = coord_origin or store.coord_origin
+        rows = numpy.flatnonzero(selected & store.has_text)
+        spans = store.spans(coord_origin, page_height)[rows] * self.scale
+        if coord_origin == CoordOrigin.TOPLEFT:
+            ltrb = spans
+        else:
+            ltrb = spans[:, [0, 3, 2, 1]]
+
+        tokens = []
+        for row, (l, t, r, b) in zip(rows, ltrb.tolist()):
+            cell = store.cells[row]
+            tokens.append(
+                {
+                    "id": cell.index,
+                    "text": cell.text,
+                    "bbox": {
+                        "l": l,
+                        "t": t,
+                        "r": r,
+                        "b": b,
+                        "coord_origin": coord_origin,
+                    },
+                }
+            )
+        return tokens
+
     def __call__(
         self, conv_res: ConversionResult, page_batch: Iterable[Page]
     ) -> Iterable[Page]:
@@ -214,37 +245,39 @@ class TableStructureModel(BasePageModel):
                     table_clusters, table_bboxes = zip(*in_tables)
 
                     if len(table_bboxes):
+                        # Check if word-level cells are available from backend:
+                        sp = page._backend.get_segmented_page()
+                        word_store = (
+                            CellStore(page._backend.get_cells(TextCellUnit.WORD))
+                            if sp is not None
+                            else None
+                        )
+
                         for table_cluster, tbl_box in in_tables:
-                            # Check if word-level cells are available from backend:
-                            sp = page._backend.get_segmented_page()
-                            if sp is not None:
-                                tcells = sp.get_cells_in_bbox(
-                                    cell_unit=TextCellUnit.WORD,
-                                    bbox=table_cluster.bbox,
+                            tokens = None
+                            if sp is not None and word_store is not None:
+                                in_table = (
+                                    word_store.intersection_over_self(
+                                        [table_cluster.bbox],
+                                        page_height=sp.dimension.height,
+                                    )[:, 0]
+                                    > 0.8
                                 )
-                                if len(tcells) == 0:
-                                    # In case word-level cells yield empty
-                                    tcells = table_cluster.cells
-                            else:
-                                # Otherwise - we use normal (line/phrase) cells
-                                tcells = table_cluster.cells
-                            tokens = []
-                            for c in tcells:
-                                # Only allow non empty strings (spaces) into the cells of a table
-                                if len(c.text.strip()) > 0:
-                                    new_cell = copy.deepcopy(c)
-                                    new_cell.rect = BoundingRectangle.from_bounding_box(
-                                        new_cell.rect.to_bounding_box().scaled(
-                                            scale=self.scale
-                                        )
-                                    )
-                                    tokens.append(
-                                        {
-                                            "id": new_cell.index,
-                                            "text": new_cell.text,
-                                            "bbox": new_cell.rect.to_bounding_box().model_dump(),
-                                        }
+                                if in_table.any():
+                                    tokens = self._table_tokens(
+                                        word_store,
+                                        in_table,
+                                        coord_origin=table_cluster.bbox.coord_origin,
+                                        page_height=sp.dimension.height,
                                     )
+                            if tokens is None:
+                                # In case word-level cells yield empty, or are not
+                                # available, we use normal (line/phrase) cells
+                                cluster_store = CellStore(table_cluster.cells)
+                                tokens = self._table_tokens(
+                                    cluster_store,
+                                    numpy.ones(len(cluster_store), dtype=bool),
+                                )
                             page_input["tokens"] = tokens
 
                             tf_output = self.tf_predictor.multi_table_predict(
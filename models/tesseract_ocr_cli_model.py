@@ -1,17 +1,19 @@
-import csv
-import io
 import logging
+import math
 import os
 import subprocess
 import tempfile
+from collections import defaultdict
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from subprocess import DEVNULL, PIPE, Popen
-from typing import List, Optional, Tuple, Type
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Type, TypeVar
 
-import pandas as pd
 from docling_core.types.doc import BoundingBox, CoordOrigin
 from docling_core.types.doc.page import TextCell
+from PIL import Image
 
 from docling.datamodel.accelerator_options import AcceleratorOptions
 from docling.datamodel.base_models import Page
@@ -25,12 +27,26 @@ from docling.models.base_ocr_model import BaseOcrModel
 from docling.utils.ocr_utils import (
     map_tesseract_script,
     parse_tesseract_orientation,
+    parse_tesseract_osd,
+    parse_tesseract_tsv,
     tesseract_box_to_bounding_rectangle,
 )
 from docling.utils.profiling import TimeRecorder
 
 _log = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+
+@dataclass
+class _OcrRegion:
+    page_ix: int
+    rect_ix: int
+    rect: BoundingBox
+    fname: str
+    im_size: Tuple[int, int]
+    orientation: int = 0
+
 
 class TesseractOcrCliModel(BaseOcrModel):
     def __init__(
@@ -99,73 +115,116 @@ class TesseractOcrCliModel(BaseOcrModel):
 
         return name, version
 
-    def _run_tesseract(self, ifilename: str, osd: Optional[pd.DataFrame]):
+    def _run_tesseract_list(
+        self,
+        args: List[str],
+        fnames: Sequence[str],
+        split: Callable[[str], List[_T]],
+        configs: Sequence[str] = (),
+    ) -> List[Optional[_T]]:
         r"""
-        Run tesseract CLI
-        """
-        cmd = [self.options.tesseract_cmd]
-        if self._is_auto and osd is not None:
-            lang = self._parse_language(osd)
-            if lang is not None:
-                cmd.append("-l")
-                cmd.append(lang)
-        elif self.options.lang is not None and len(self.options.lang) > 0:
-            cmd.append("-l")
-            cmd.append("+".join(self.options.lang))
-
-        if self.options.path is not None:
-            cmd.append("--tessdata-dir")
-            cmd.append(self.options.path)
-
-        cmd += [ifilename, "stdout", "tsv"]
-        _log.info("command: {}".format(" ".join(cmd)))
-
-        output = subprocess.run(cmd, stdout=PIPE, stderr=DEVNULL, check=True)
-
-        # _log.info(output)
-
-        # Decode the byte string to a regular string
-        decoded_data = output.stdout.decode("utf-8")
-        # _log.info(decoded_data)
-
-        # Read the TSV file generated by Tesseract
-        df_result = pd.read_csv(
-            io.StringIO(decoded_data), quoting=csv.QUOTE_NONE, sep="\t"
-        )
-
-        # Display the dataframe (optional)
-        # _log.info("df: ", df.head())
+        Run one tesseract process on a list of image files
 
-        # Filter rows that contain actual text (ignore header or empty rows)
-        df_filtered = df_result[
-            df_result["text"].notna() & (df_result["text"].apply(str).str.strip() != "")
+        ``split`` cuts the output into the result of every image. Tesseract stops
+        at the first image it fails on, which gets None, and the images after it
+        are run again in a new process.
+        """
+        results: List[Optional[_T]] = []
+        while len(results) < len(fnames):
+            pending = fnames[len(results) :]
+            with tempfile.NamedTemporaryFile(
+                suffix=".txt", mode="w", delete=False
+            ) as list_file:
+                list_file.write("\n".join(pending) + "\n")
+            try:
+                cmd = [self.options.tesseract_cmd, *args]
+                cmd += [list_file.name, "stdout", *configs]
+                _log.debug("command: {}".format(" ".join(cmd)))
+                output = subprocess.run(cmd, stdout=PIPE, stderr=PIPE)
+            finally:
+                os.remove(list_file.name)
+
+            outputs = split(output.stdout.decode("utf-8"))[: len(pending)]
+            results.extend(outputs)
+            if output.returncode == 0 or len(outputs) == len(pending):
+                break
+            _log.error(
+                "tesseract failed on %s:\n %s",
+                pending[len(outputs)],
+                output.stderr.decode("utf-8", errors="replace"),
+            )
+            results.append(None)
+
+        return results + [None] * (len(fnames) - len(results))
+
+    def _run_tesseract_pool(
+        self,
+        args: List[str],
+        fnames: Sequence[str],
+        split: Callable[[str], List[_T]],
+        configs: Sequence[str] = (),
+    ) -> List[Optional[_T]]:
+        r"""
+        Share the image files between up to ``num_processes`` tesseract processes
+        """
+        n_chunks = max(1, min(self.options.num_processes, len(fnames)))
+        if n_chunks == 1:
+            return self._run_tesseract_list(args, fnames, split, configs)
+
+        chunk_size = math.ceil(len(fnames) / n_chunks)
+        chunks = [
+            fnames[start : start + chunk_size]
+            for start in range(0, len(fnames), chunk_size)
         ]
+        with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+            outputs = executor.map(
+                lambda chunk: self._run_tesseract_list(args, chunk, split, configs),
+                chunks,
+            )
+            return [result for output in outputs for result in output]
+
+    def _perform_osd(self, fnames: Sequence[str]) -> List[Optional[Dict[str, str]]]:
+        r"""
+        Run tesseract in PSM 0 mode to detect the orientation and script
+        """
+        return self._run_tesseract_pool(
+            ["--psm", "0", "-l", "osd"], fnames, parse_tesseract_osd
+        )
 
-        return df_filtered
-
-    def _perform_osd(self, ifilename: str) -> pd.DataFrame:
+    def _run_tesseract(
+        self, fnames: Sequence[str], lang: Optional[str]
+    ) -> List[Optional[List[Dict[str, str]]]]:
         r"""
-        Run tesseract in PSM 0 mode to detect the language
+        Run tesseract CLI, returning the TSV rows with text of every image
         """
+        args = []
+        if lang is not None:
+            args += ["-l", lang]
+        if self.options.path is not None:
+            args += ["--tessdata-dir", self.options.path]
 
-        cmd = [self.options.tesseract_cmd]
-        cmd.extend(["--psm", "0", "-l", "osd", ifilename, "stdout"])
-        _log.info("command: {}".format(" ".join(cmd)))
-        output = subprocess.run(cmd, capture_output=True, check=True)
-        decoded_data = output.stdout.decode("utf-8")
-        df_detected = pd.read_csv(
-            io.StringIO(decoded_data), sep=":", header=None, names=["key", "value"]
+        results = self._run_tesseract_pool(
+            args, fnames, parse_tesseract_tsv, configs=["tsv"]
         )
-        return df_detected
+        # Number the rows within their image and keep those with actual text
+        return [
+            None
+            if rows is None
+            else [
+                dict(row, index=str(ix))
+                for ix, row in enumerate(rows)
+                if row.get("text", "").strip() != ""
+            ]
+            for rows in results
+        ]
 
-    def _parse_language(self, df_osd: pd.DataFrame) -> Optional[str]:
+    def _parse_language(self, osd: Dict[str, str]) -> Optional[str]:
         assert self._tesseract_languages is not None
-        scripts = df_osd.loc[df_osd["key"] == "Script"].value.tolist()
-        if len(scripts) == 0:
+        if "Script" not in osd:
             _log.warning("Tesseract cannot detect the script of the page")
             return None
 
-        script = map_tesseract_script(scripts[0].strip())
+        script = map_tesseract_script(osd["Script"])
         lang = f"{self._script_prefix}{script}"
 
         # Check if the detected language has been installed
@@ -190,8 +249,8 @@ class TesseractOcrCliModel(BaseOcrModel):
         _log.info("command: {}".format(" ".join(cmd)))
         output = subprocess.run(cmd, stdout=PIPE, stderr=DEVNULL, check=True)
         decoded_data = output.stdout.decode("utf-8")
-        df_list = pd.read_csv(io.StringIO(decoded_data), header=None)
-        self._tesseract_languages = df_list[0].tolist()[1:]
+        lines = [line.strip() for line in decoded_data.splitlines() if line.strip()]
+        self._tesseract_languages = lines[1:]
 
         # Decide the script prefix
         if any(lang.startswith("script/") for lang in self._tesseract_languages):
@@ -208,118 +267,130 @@ class TesseractOcrCliModel(BaseOcrModel):
             yield from page_batch
             return
 
-        for page_i, page in enumerate(page_batch):
-            assert page._backend is not None
-            if not page._backend.is_valid():
-                yield page
-            else:
-                with TimeRecorder(conv_res, "ocr"):
-                    ocr_rects = self.get_ocr_rects(page)
-
-                    all_ocr_cells = []
-                    for ocr_rect_i, ocr_rect in enumerate(ocr_rects):
-                        # Skip zero area boxes
-                        if ocr_rect.area() == 0:
-                            continue
-                        high_res_image = page._backend.get_page_image(
-                            scale=self.scale, cropbox=ocr_rect
+        pages = list(page_batch)
+        valid = [p._backend is not None and p._backend.is_valid() for p in pages]
+        page_rects: List[List[BoundingBox]] = []
+        page_cells: List[List[TextCell]] = [[] for _ in pages]
+
+        with TimeRecorder(conv_res, "ocr"), tempfile.TemporaryDirectory() as tmpdir:
+            # All OCR regions of the batch go through the same tesseract processes
+            regions: List[_OcrRegion] = []
+            for page_ix, page in enumerate(pages):
+                ocr_rects = self.get_ocr_rects(page) if valid[page_ix] else []
+                page_rects.append(ocr_rects)
+                for rect_ix, ocr_rect in enumerate(ocr_rects):
+                    # Skip zero area boxes
+                    if ocr_rect.area() == 0:
+                        continue
+                    high_res_image = page._backend.get_page_image(  # type: ignore[union-attr]
+                        scale=self.scale, cropbox=ocr_rect
+                    )
+                    fname = os.path.join(tmpdir, f"{page_ix}-{rect_ix}.png")
+                    # Fast to write, the files are only read once
+                    high_res_image.save(fname, compress_level=1)
+                    regions.append(
+                        _OcrRegion(
+                            page_ix, rect_ix, ocr_rect, fname, high_res_image.size
+                        )
+                    )
+
+            regions_by_lang: Dict[Optional[str], List[_OcrRegion]] = defaultdict(list)
+            osd_results = self._perform_osd([region.fname for region in regions])
+            for region, osd in zip(regions, osd_results):
+                if osd is None:
+                    _log.error(
+                        "OSD failed (doc %s, page: %s, OCR rectangle: %s)",
+                        conv_res.input.file,
+                        pages[region.page_ix].page_no,
+                        region.rect_ix,
+                    )
+                    # Skipping if OSD fail when in auto mode, otherwise proceed
+                    # to OCR in the hope OCR will succeed while OSD failed
+                    if self._is_auto:
+                        continue
+                else:
+                    region.orientation = _parse_orientation(osd)
+                    if region.orientation != 0:
+                        with Image.open(region.fname) as image:
+                            rotated = image.rotate(-region.orientation, expand=True)
+                        rotated.save(region.fname, compress_level=1)
+                        region.im_size = rotated.size
+
+                lang: Optional[str] = None
+                if self._is_auto and osd is not None:
+                    lang = self._parse_language(osd)
+                elif self.options.lang is not None and len(self.options.lang) > 0:
+                    lang = "+".join(self.options.lang)
+                regions_by_lang[lang].append(region)
+
+            for lang, lang_regions in regions_by_lang.items():
+                tsv_results = self._run_tesseract(
+                    [region.fname for region in lang_regions], lang
+                )
+                for region, rows in zip(lang_regions, tsv_results):
+                    if rows is None:
+                        _log.error(
+                            "tesseract OCR failed (doc %s, page: %s, OCR rectangle: %s)",
+                            conv_res.input.file,
+                            pages[region.page_ix].page_no,
+                            region.rect_ix,
                         )
-                        try:
-                            with tempfile.NamedTemporaryFile(
-                                suffix=".png", mode="w+b", delete=False
-                            ) as image_file:
-                                fname = image_file.name
-                                high_res_image.save(image_file)
-                            doc_orientation = 0
-                            df_osd: Optional[pd.DataFrame] = None
-                            try:
-                                df_osd = self._perform_osd(fname)
-                                doc_orientation = _parse_orientation(df_osd)
-                            except subprocess.CalledProcessError as exc:
-                                _log.error(
-                                    "OSD failed (doc %s, page: %s, "
-                                    "OCR rectangle: %s, processed image file %s):\n %s",
-                                    conv_res.input.file,
-                                    page_i,
-                                    ocr_rect_i,
-                                    image_file,
-                                    exc.stderr,
-                                )
-                                # Skipping if OSD fail when in auto mode, otherwise proceed
-                                # to OCR in the hope OCR will succeed while OSD failed
-                                if self._is_auto:
-                                    continue
-                            if doc_orientation != 0:
-                                high_res_image = high_res_image.rotate(
-                                    -doc_orientation, expand=True
-                                )
-                                high_res_image.save(fname)
-                            try:
-                                df_result = self._run_tesseract(fname, df_osd)
-                            except subprocess.CalledProcessError as exc:
-                                _log.error(
-                                    "tesseract OCR failed (doc %s, page: %s, "
-                                    "OCR rectangle: %s, processed image file %s):\n %s",
-                                    conv_res.input.file,
-                                    page_i,
-                                    ocr_rect_i,
-                                    image_file,
-                                    exc.stderr,
-                                )
-                                continue
-                        finally:
-                            if os.path.exists(fname):
-                                os.remove(fname)
-
-                        # _log.info(df_result)
-
-                        # Print relevant columns (bounding box and text)
-                        for ix, row in df_result.iterrows():
-                            text = row["text"]
-                            conf = row["conf"]
-
-                            left, top = float(row["left"]), float(row["top"])
-                            right = left + float(row["width"])
-                            bottom = top + row["height"]
-                            bbox = BoundingBox(
-                                l=left,
-                                t=top,
-                                r=right,
-                                b=bottom,
-                                coord_origin=CoordOrigin.TOPLEFT,
-                            )
-                            rect = tesseract_box_to_bounding_rectangle(
-                                bbox,
-                                original_offset=ocr_rect,
-                                scale=self.scale,
-                                orientation=doc_orientation,
-                                im_size=high_res_image.size,
-                            )
-                            cell = TextCell(
-                                index=ix,
-                                text=str(text),
-                                orig=str(text),
-                                from_ocr=True,
-                                confidence=conf / 100.0,
-                                rect=rect,
-                            )
-                            all_ocr_cells.append(cell)
-
-                    # Post-process the cells
-                    self.post_process_cells(all_ocr_cells, page)
-
-                # DEBUG code:
-                if settings.debug.visualize_ocr:
-                    self.draw_ocr_rects_and_cells(conv_res, page, ocr_rects)
-
-                yield page
+                        continue
+                    page_cells[region.page_ix].extend(
+                        self._rows_to_cells(rows, region)
+                    )
+
+            # Post-process the cells
+            for page_ix, page in enumerate(pages):
+                if valid[page_ix]:
+                    self.post_process_cells(page_cells[page_ix], page)
+
+        for page_ix, page in enumerate(pages):
+            # DEBUG code:
+            if settings.debug.visualize_ocr and valid[page_ix]:
+                self.draw_ocr_rects_and_cells(conv_res, page, page_rects[page_ix])
+
+            yield page
+
+    def _rows_to_cells(
+        self, rows: List[Dict[str, str]], region: _OcrRegion
+    ) -> List[TextCell]:
+        cells = []
+        for row in rows:
+            text = row["text"]
+            left, top = float(row["left"]), float(row["top"])
+            right = left + float(row["width"])
+            bottom = top + float(row["height"])
+            bbox = BoundingBox(
+                l=left,
+                t=top,
+                r=right,
+                b=bottom,
+                coord_origin=CoordOrigin.TOPLEFT,
+            )
+            rect = tesseract_box_to_bounding_rectangle(
+                bbox,
+                original_offset=region.rect,
+                scale=self.scale,
+                orientation=region.orientation,
+                im_size=region.im_size,
+            )
+            cells.append(
+                TextCell(
+                    index=int(row["index"]),
+                    text=text,
+                    orig=text,
+                    from_ocr=True,
+                    confidence=float(row["conf"]) / 100.0,
+                    rect=rect,
+                )
+            )
+        return cells
 
     @classmethod
     def get_options_type(cls) -> Type[OcrOptions]:
         return TesseractCliOcrOptions
 
 
-def _parse_orientation(df_osd: pd.DataFrame) -> int:
-    orientations = df_osd.loc[df_osd["key"] == "Orientation in degrees"].value.tolist()
-    orientation = parse_tesseract_orientation(orientations[0].strip())
-    return orientation
+def _parse_orientation(osd: Dict[str, str]) -> int:
+    return parse_tesseract_orientation(osd["Orientation in degrees"])
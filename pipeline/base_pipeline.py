@@ -1,14 +1,17 @@
 import functools
+import itertools
 import logging
 import time
 import traceback
 from abc import ABC, abstractmethod
 from collections.abc import Iterable
-from typing import Any, Callable, List
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from docling_core.types.doc import NodeItem
 
 from docling.backend.abstract_backend import AbstractDocumentBackend
+from docling.backend.bundle_backend import DocumentBundleBackend
 from docling.backend.pdf_backend import PdfDocumentBackend
 from docling.datamodel.base_models import (
     ConversionStatus,
@@ -17,9 +20,20 @@ from docling.datamodel.base_models import (
     Page,
 )
 from docling.datamodel.document import ConversionResult, InputDocument
-from docling.datamodel.pipeline_options import PipelineOptions
+from docling.datamodel.pipeline_options import (
+    PaginatedPipelineOptions,
+    PipelineOptions,
+)
 from docling.datamodel.settings import settings
 from docling.models.base_model import GenericEnrichmentModel
+from docling.utils.cancellation import CancellationToken
+from docling.utils.checkpoint import DocumentCheckpoint
+from docling.utils.page_cache import (
+    PageCache,
+    PageCacheEntry,
+    page_fingerprint,
+    pipeline_options_hash,
+)
 from docling.utils.profiling import ProfilingScope, TimeRecorder
 from docling.utils.utils import chunkify
 
@@ -35,6 +49,7 @@ class BasePipeline(ABC):
 
     def execute(self, in_doc: InputDocument, raises_on_error: bool) -> ConversionResult:
         conv_res = ConversionResult(input=in_doc)
+        conv_res._cancel_token = self._create_cancel_token(in_doc)
 
         _log.info(f"Processing document {in_doc.file.name}")
         try:
@@ -48,6 +63,7 @@ class BasePipeline(ABC):
                 # From this stage, all operations should rely only on conv_res.output
                 conv_res = self._enrich_document(conv_res)
                 conv_res.status = self._determine_status(conv_res)
+            self._clear_checkpoint(conv_res)
         except Exception as e:
             conv_res.status = ConversionStatus.FAILURE
             if raises_on_error:
@@ -57,6 +73,131 @@ class BasePipeline(ABC):
 
         return conv_res
 
+    def execute_bundle(
+        self, in_docs: List[InputDocument], raises_on_error: bool
+    ) -> List[ConversionResult]:
+        """Convert several small paginated documents with one run of the page models.
+
+        The pages of all documents are built as one virtual document, so page
+        batches span several inputs. The pages are then split back and every
+        document is assembled, enriched and unloaded on its own. If the shared
+        build fails and errors are not raised, the documents are converted one
+        by one instead.
+        """
+        bundle_doc = DocumentBundleBackend.create(in_docs)
+        bundle_doc._preemption_point = in_docs[0]._preemption_point
+        bundle_backend = bundle_doc._backend
+        assert isinstance(bundle_backend, DocumentBundleBackend)
+        bundle_res = ConversionResult(input=bundle_doc)
+        # The members of a bundle come from the same convert call
+        bundle_res._cancel_token = self._create_cancel_token(in_docs[0])
+
+        _log.info(f"Processing {len(in_docs)} documents as bundle {bundle_doc.file}")
+        try:
+            with TimeRecorder(
+                bundle_res, "pipeline_bundle_build", scope=ProfilingScope.DOCUMENT
+            ):
+                bundle_res = self._build_document(bundle_res)
+        except Exception as e:
+            for page in bundle_res.pages:
+                if page._backend is not None:
+                    page._backend.unload()
+            if raises_on_error:
+                for in_doc in in_docs:
+                    self._unload(ConversionResult(input=in_doc))
+                raise e
+            _log.warning(
+                f"Bundle {bundle_doc.file} failed, converting its documents one by one"
+            )
+            return [self.execute(in_doc, raises_on_error) for in_doc in in_docs]
+        finally:
+            bundle_backend.unload()
+
+        results = [
+            ConversionResult(
+                input=in_doc,
+                timings={
+                    key: item.model_copy(deep=True)
+                    for key, item in bundle_res.timings.items()
+                },
+            )
+            for in_doc in in_docs
+        ]
+        for conv_res in results:
+            conv_res._cancel_token = bundle_res._cancel_token
+        expected_pages = [0] * len(in_docs)
+        for member_idx, _ in bundle_backend.page_map:
+            expected_pages[member_idx] += 1
+        for page in bundle_res.pages:
+            member_idx, page_no = bundle_backend.page_map[page.page_no]
+            conv_res = results[member_idx]
+            conv_res.confidence.pages[page_no] = bundle_res.confidence.pages[
+                page.page_no
+            ]
+            page.renumber(page_no)
+            conv_res.pages.append(page)
+
+        for i, (conv_res, num_expected) in enumerate(zip(results, expected_pages)):
+            if len(conv_res.pages) == num_expected:
+                conv_res.status = ConversionStatus.SUCCESS
+            elif bundle_res.status == ConversionStatus.FAILURE:
+                conv_res.status = ConversionStatus.FAILURE
+            else:
+                conv_res.status = ConversionStatus.PARTIAL_SUCCESS
+
+            try:
+                with TimeRecorder(
+                    conv_res, "pipeline_total", scope=ProfilingScope.DOCUMENT
+                ):
+                    conv_res = self._assemble_document(conv_res)
+                    conv_res = self._enrich_document(conv_res)
+                    conv_res.status = self._determine_status(conv_res)
+            except Exception as e:
+                conv_res.status = ConversionStatus.FAILURE
+                if raises_on_error:
+                    for pending_res in results[i + 1 :]:
+                        self._unload(pending_res)
+                    raise e
+            finally:
+                self._unload(conv_res)
+
+        return results
+
+    def _create_cancel_token(self, in_doc: InputDocument) -> CancellationToken:
+        """Token of a conversion: ``document_timeout``, within the caller's token."""
+        return CancellationToken(
+            timeout=self.pipeline_options.document_timeout,
+            parent=in_doc._cancel_token,
+        )
+
+    def _open_checkpoint(
+        self, conv_res: ConversionResult
+    ) -> Optional[DocumentCheckpoint]:
+        """Checkpoint of the conversion, None if disabled or for a bundle."""
+        checkpoint_dir = getattr(self.pipeline_options, "checkpoint_dir", None)
+        if checkpoint_dir is None or isinstance(
+            conv_res.input._backend, DocumentBundleBackend
+        ):
+            return None
+        return DocumentCheckpoint(
+            checkpoint_dir=Path(checkpoint_dir),
+            document_hash=conv_res.input.document_hash,
+            options_hash=pipeline_options_hash(
+                type(self).__name__, self.pipeline_options
+            ),
+        )
+
+    def _clear_checkpoint(self, conv_res: ConversionResult) -> None:
+        # Kept after a failure or cancellation, the next run resumes from it
+        if conv_res._cancel_token.cancelled or conv_res.status not in (
+            ConversionStatus.SUCCESS,
+            ConversionStatus.PARTIAL_SUCCESS,
+        ):
+            return
+        checkpoint = self._open_checkpoint(conv_res)
+        if checkpoint is not None:
+            checkpoint.clear()
+
     @abstractmethod
     def _build_document(self, conv_res: ConversionResult) -> ConversionResult:
         pass
@@ -117,6 +258,19 @@ class PaginatedPipeline(BasePipeline):  # TODO this is a bad name.
         super().__init__(pipeline_options)
         self.keep_backend = False
 
+        self.page_cache: Optional[PageCache] = None
+        if (
+            isinstance(pipeline_options, PaginatedPipelineOptions)
+            and pipeline_options.page_cache_dir is not None
+        ):
+            self.page_cache = PageCache(
+                cache_dir=Path(pipeline_options.page_cache_dir),
+                options_hash=pipeline_options_hash(
+                    type(self).__name__, pipeline_options
+                ),
+                max_bytes=pipeline_options.page_cache_max_bytes,
+            )
+
     def _apply_on_pages(
         self, conv_res: ConversionResult, page_batch: Iterable[Page]
     ) -> Iterable[Page]:
@@ -125,6 +279,67 @@ class PaginatedPipeline(BasePipeline):  # TODO this is a bad name.
 
         yield from page_batch
 
+    def _restore_checkpointed_pages(
+        self,
+        conv_res: ConversionResult,
+        checkpoint: DocumentCheckpoint,
+        page_batch: Iterable[Page],
+        completed: Set[int],
+    ) -> Tuple[List[Page], List[Page]]:
+        """Split a batch in pages to convert and pages restored from the checkpoint."""
+        to_convert: List[Page] = []
+        restored: List[Page] = []
+        for page in page_batch:
+            entry = checkpoint.load(page.page_no) if page.page_no in completed else None
+            if entry is None:
+                completed.discard(page.page_no)
+                to_convert.append(page)
+                continue
+            entry.restore(page, conv_res.confidence.pages[page.page_no])
+            if self.keep_images:
+                images_scale = getattr(self.pipeline_options, "images_scale", 1.0)
+                page._default_image_scale = images_scale
+                page.get_image(scale=images_scale)
+            restored.append(page)
+
+        return to_convert, restored
+
+    def _restore_cached_pages(
+        self,
+        conv_res: ConversionResult,
+        page_batch: Iterable[Page],
+        fingerprints: Dict[int, str],
+    ) -> Tuple[List[Page], List[Page]]:
+        """Split a batch in pages to convert and pages restored from the cache.
+
+        The fingerprints of the pages to convert are added to ``fingerprints``.
+        """
+        assert self.page_cache is not None
+
+        to_convert: List[Page] = []
+        restored: List[Page] = []
+        for page in page_batch:
+            if page._backend is None or not page._backend.is_valid():
+                to_convert.append(page)
+                continue
+
+            with TimeRecorder(conv_res, "page_fingerprint"):
+                fingerprint = page_fingerprint(page._backend)
+            entry = self.page_cache.get(fingerprint)
+            if entry is None:
+                fingerprints[page.page_no] = fingerprint
+                to_convert.append(page)
+                continue
+
+            entry.restore(page, conv_res.confidence.pages[page.page_no])
+            if self.keep_images:
+                images_scale = getattr(self.pipeline_options, "images_scale", 1.0)
+                page._default_image_scale = images_scale
+                page.get_image(scale=images_scale)
+            restored.append(page)
+
+        return to_convert, restored
+
     def _build_document(self, conv_res: ConversionResult) -> ConversionResult:
         if not isinstance(conv_res.input._backend, PdfDocumentBackend):
             raise RuntimeError(
@@ -136,6 +351,16 @@ class PaginatedPipeline(BasePipeline):  # TODO this is a bad name.
             # return conv_res
 
         total_elapsed_time = 0.0
+        num_restored = 0
+        num_done = 0
+        skipped_pages: Set[int] = set()
+        preemption_point = conv_res.input._preemption_point
+        checkpoint = self._open_checkpoint(conv_res)
+        completed = checkpoint.completed_pages() if checkpoint is not None else set()
+        if completed:
+            _log.info(
+                f"Resuming {conv_res.input.file.name} from a checkpoint of {len(completed)} pages"
+            )
         with TimeRecorder(conv_res, "doc_build", scope=ProfilingScope.DOCUMENT):
             for i in range(conv_res.input.page_count):
                 start_page, end_page = conv_res.input.limits.page_range
@@ -149,15 +374,59 @@ class PaginatedPipeline(BasePipeline):  # TODO this is a bad name.
                 ):
                     start_batch_time = time.monotonic()
 
-                    # 1. Initialise the page resources
+                    # 1. Initialise the page resources, no more pages once cancelled
                     init_pages = map(
-                        functools.partial(self.initialize_page, conv_res), page_batch
+                        functools.partial(self.initialize_page, conv_res),
+                        itertools.takewhile(
+                            lambda _: not conv_res._cancel_token.cancelled, page_batch
+                        ),
                     )
 
-                    # 2. Run pipeline stages
+                    # 2. Reuse the outputs of the pages done by an interrupted
+                    #    run, then of unchanged pages
+                    checkpointed_pages: List[Page] = []
+                    if checkpoint is not None:
+                        init_pages, checkpointed_pages = (
+                            self._restore_checkpointed_pages(
+                                conv_res, checkpoint, init_pages, completed
+                            )
+                        )
+                    fingerprints: Dict[int, str] = {}
+                    restored_pages: List[Page] = []
+                    if self.page_cache is not None:
+                        init_pages, restored_pages = self._restore_cached_pages(
+                            conv_res, init_pages, fingerprints
+                        )
+                        num_restored += len(restored_pages)
+
+                    # 3. Run pipeline stages
                     pipeline_pages = self._apply_on_pages(conv_res, init_pages)
 
-                    for p in pipeline_pages:  # Must exhaust!
+                    for p in itertools.chain(
+                        pipeline_pages, restored_pages, checkpointed_pages
+                    ):  # Must exhaust!
+                        # Models skip work once cancelled, such pages are not kept
+                        keep = p.size is not None and not conv_res._cancel_token.cancelled
+                        if not keep:
+                            skipped_pages.add(p.page_no)
+                        if (
+                            keep
+                            and checkpoint is not None
+                            and p.page_no not in completed
+                        ):
+                            checkpoint.save(p, conv_res.confidence.pages[p.page_no])
+                        if (
+                            keep
+                            and self.page_cache is not None
+                            and p.page_no in fingerprints
+                        ):
+                            self.page_cache.put(
+                                fingerprints[p.page_no],
+                                PageCacheEntry.from_page(
+                                    p, conv_res.confidence.pages[p.page_no]
+                                ),
+                            )
+
                         # Cleanup cached images
                         if not self.keep_images:
                             p._image_cache = {}
@@ -168,12 +437,10 @@ class PaginatedPipeline(BasePipeline):  # TODO this is a bad name.
 
                     end_batch_time = time.monotonic()
                     total_elapsed_time += end_batch_time - start_batch_time
-                    if (
-                        self.pipeline_options.document_timeout is not None
-                        and total_elapsed_time > self.pipeline_options.document_timeout
-                    ):
+                    if conv_res._cancel_token.cancelled:
                         _log.warning(
-                            f"Document processing time ({total_elapsed_time:.3f} seconds) exceeded the specified timeout of {self.pipeline_options.document_timeout:.3f} seconds"
+                            f"Document processing stopped after {total_elapsed_time:.3f} seconds: {conv_res._cancel_token.reason} "
+                            f"(document_timeout={self.pipeline_options.document_timeout})"
                         )
                         conv_res.status = ConversionStatus.PARTIAL_SUCCESS
                         break
@@ -182,6 +449,13 @@ class PaginatedPipeline(BasePipeline):  # TODO this is a bad name.
                         f"Finished converting page batch time={end_batch_time:.3f}"
                     )
 
+                    # 4. Let the scheduler run other jobs before the next batch
+                    num_done += len(page_batch)
+                    if preemption_point is not None and num_done < len(
+                        conv_res.pages
+                    ):
+                        preemption_point(num_done, len(conv_res.pages))
+
             except Exception as e:
                 conv_res.status = ConversionStatus.FAILURE
                 trace = "\n".join(
@@ -193,10 +467,20 @@ class PaginatedPipeline(BasePipeline):  # TODO this is a bad name.
                 )
                 raise e
 
+            if self.page_cache is not None:
+                _log.info(
+                    f"Page cache: reused {num_restored} of {len(conv_res.pages)} pages"
+                )
+
             # Filter out uninitialized pages (those with size=None) that may remain
-            # after timeout or processing failures to prevent assertion errors downstream
+            # after timeout or processing failures to prevent assertion errors downstream,
+            # and the pages whose models were skipped after a cancellation
             initial_page_count = len(conv_res.pages)
-            conv_res.pages = [page for page in conv_res.pages if page.size is not None]
+            conv_res.pages = [
+                page
+                for page in conv_res.pages
+                if page.size is not None and page.page_no not in skipped_pages
+            ]
 
             if len(conv_res.pages) < initial_page_count:
                 _log.info(
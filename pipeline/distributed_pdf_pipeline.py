@@ -0,0 +1,292 @@
+"""PDF pipeline running the page stages of a document on several nodes.
+
+The coordinator (``DistributedPdfPipeline``) splits the pages of a document
+into shards of ``shard_size`` consecutive pages and queues them on a broker
+(see ``docling.utils.work_broker``). Workers (``DistributedPageWorker``), on
+the same or other nodes, run the page stages of the standard PDF pipeline on
+each shard, within ``page_range`` limits, and return the outputs of its pages.
+The coordinator restores them on its pages, then runs the reading order and
+the enrichment as the standard pipeline does.
+
+The workers must run with the same pipeline options as the coordinator, they
+only claim the shards of their configuration::
+
+    options = DistributedPdfPipelineOptions(broker_url="sqlite:////shared/broker.db")
+
+    # on the workers
+    DistributedPageWorker(options).run()
+
+    # on the coordinator
+    converter = DocumentConverter(
+        format_options={
+            InputFormat.PDF: PdfFormatOption(
+                pipeline_cls=DistributedPdfPipeline, pipeline_options=options
+            )
+        }
+    )
+"""
+
+import gzip
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from io import BytesIO
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+from docling.backend.docling_parse_v4_backend import DoclingParseV4DocumentBackend
+from docling.backend.pdf_backend import PdfDocumentBackend
+from docling.datamodel.base_models import (
+    ConversionStatus,
+    DoclingComponentType,
+    ErrorItem,
+    InputFormat,
+    Page,
+)
+from docling.datamodel.document import ConversionResult, InputDocument
+from docling.datamodel.pipeline_options import DistributedPdfPipelineOptions
+from docling.datamodel.settings import DocumentLimits
+from docling.pipeline.standard_pdf_pipeline import StandardPdfPipeline
+from docling.utils.page_cache import PageCacheEntry, pipeline_options_hash
+from docling.utils.profiling import ProfilingScope, TimeRecorder
+from docling.utils.utils import chunkify
+from docling.utils.work_broker import PageShard, WorkBroker, create_broker
+
+_log = logging.getLogger(__name__)
+
+
+class PageShardResult(BaseModel):
+    """Outputs of the pages of a shard, by page_no."""
+
+    pages: Dict[int, PageCacheEntry] = {}
+
+    def to_bytes(self) -> bytes:
+        return gzip.compress(self.model_dump_json().encode("utf-8"), compresslevel=3)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "PageShardResult":
+        return cls.model_validate_json(gzip.decompress(data))
+
+
+def _shard_options_hash(pipeline_options: DistributedPdfPipelineOptions) -> str:
+    return pipeline_options_hash(DistributedPdfPipeline.__name__, pipeline_options)
+
+
+def _create_broker(pipeline_options: DistributedPdfPipelineOptions) -> WorkBroker:
+    if pipeline_options.broker_url is None:
+        raise ValueError("DistributedPdfPipelineOptions.broker_url is not set.")
+    return create_broker(
+        pipeline_options.broker_url,
+        lease=pipeline_options.shard_lease,
+        max_attempts=pipeline_options.shard_max_attempts,
+    )
+
+
+class DistributedPdfPipeline(StandardPdfPipeline):
+    def __init__(self, pipeline_options: DistributedPdfPipelineOptions):
+        super().__init__(pipeline_options)
+        self.pipeline_options: DistributedPdfPipelineOptions
+        self.broker = _create_broker(pipeline_options)
+        self.options_hash = _shard_options_hash(pipeline_options)
+
+    def _create_build_pipe(self, artifacts_path: Optional[Path]) -> List[Callable]:
+        # The page stages run on the workers
+        return []
+
+    def _build_document(self, conv_res: ConversionResult) -> ConversionResult:
+        backend = conv_res.input._backend
+        if not isinstance(backend, PdfDocumentBackend):
+            raise RuntimeError(
+                f"The selected backend {type(backend).__name__} for {conv_res.input.file} is not a PDF backend. "
+                f"Can not convert this with a PDF pipeline. "
+                f"Please check your format configuration on DocumentConverter."
+            )
+
+        start_page, end_page = conv_res.input.limits.page_range
+        for i in range(conv_res.input.page_count):
+            if (start_page - 1) <= i <= (end_page - 1):
+                conv_res.pages.append(Page(page_no=i))
+        pages = {page.page_no: page for page in conv_res.pages}
+
+        job_id = uuid.uuid4().hex
+        shards = [
+            PageShard(
+                job_id=job_id,
+                document_hash=conv_res.input.document_hash,
+                options_hash=self.options_hash,
+                start=shard_pages[0].page_no,
+                end=shard_pages[-1].page_no + 1,
+            )
+            for shard_pages in chunkify(conv_res.pages, self.pipeline_options.shard_size)
+        ]
+
+        pending = len(shards)
+        failed: List[Tuple[PageShard, str]] = []
+        cancel_token = conv_res._cancel_token
+        with TimeRecorder(conv_res, "doc_build", scope=ProfilingScope.DOCUMENT):
+            if shards:
+                self.broker.submit(_document_bytes(backend), shards)
+            _log.info(
+                f"Queued {len(conv_res.pages)} pages of {conv_res.input.file.name} as {len(shards)} shards"
+            )
+            try:
+                while pending and not cancel_token.cancelled:
+                    outcomes = self.broker.collect(job_id)
+                    for outcome in outcomes:
+                        pending -= 1
+                        if outcome.result is None:
+                            failed.append((outcome.shard, outcome.error or "unknown error"))
+                            continue
+                        self._restore_shard(conv_res, pages, outcome.result)
+                    if pending and not outcomes:
+                        time.sleep(self.pipeline_options.poll_interval)
+            finally:
+                self.broker.close_job(job_id)
+
+        if pending:
+            _log.warning(
+                f"Document processing stopped with {pending} shards left: {cancel_token.reason} "
+                f"(document_timeout={self.pipeline_options.document_timeout})"
+            )
+            conv_res.status = ConversionStatus.PARTIAL_SUCCESS
+        for shard, error in failed:
+            _log.warning(f"Pages {shard.start}-{shard.end - 1} failed: {error}")
+            conv_res.errors.append(
+                ErrorItem(
+                    component_type=DoclingComponentType.MODEL,
+                    module_name=DistributedPageWorker.__name__,
+                    error_message=f"Pages {shard.start}-{shard.end - 1} failed: {error}",
+                )
+            )
+            conv_res.status = ConversionStatus.PARTIAL_SUCCESS
+
+        # Pages of failed or unfinished shards are left out
+        conv_res.pages = [page for page in conv_res.pages if page.size is not None]
+        return conv_res
+
+    def _restore_shard(
+        self, conv_res: ConversionResult, pages: Dict[int, Page], result: bytes
+    ) -> None:
+        for page_no, entry in PageShardResult.from_bytes(result).pages.items():
+            page = pages.get(page_no)
+            if page is None:
+                continue
+            entry.restore(page, conv_res.confidence.pages[page_no])
+            # The page was parsed on a worker, its backend is only loaded to
+            # render the images kept or cropped for the enrichment
+            if not (self.keep_images or self.keep_backend):
+                continue
+            with TimeRecorder(conv_res, "page_init"):
+                page._backend = conv_res.input._backend.load_page(page_no)  # type: ignore
+            if self.keep_images:
+                page._default_image_scale = self.pipeline_options.images_scale
+                page.get_image(scale=self.pipeline_options.images_scale)
+            if not self.keep_backend and page._backend is not None:
+                page._backend.unload()
+
+    def _determine_status(self, conv_res: ConversionResult) -> ConversionStatus:
+        # Pages are validated by the workers, a shard with an invalid page fails
+        # and _build_document set the status accordingly
+        if conv_res.status in [ConversionStatus.PENDING, ConversionStatus.STARTED]:
+            return ConversionStatus.SUCCESS
+        return conv_res.status
+
+    @classmethod
+    def get_default_options(cls) -> DistributedPdfPipelineOptions:
+        return DistributedPdfPipelineOptions()
+
+
+def _document_bytes(backend: PdfDocumentBackend) -> bytes:
+    if isinstance(backend.path_or_stream, Path):
+        return backend.path_or_stream.read_bytes()
+    assert isinstance(backend.path_or_stream, BytesIO)
+    return backend.path_or_stream.getvalue()
+
+
+class DistributedPageWorker:
+    """Run the page stages of the shards queued for a pipeline configuration."""
+
+    def __init__(
+        self,
+        pipeline_options: DistributedPdfPipelineOptions,
+        backend: Type[PdfDocumentBackend] = DoclingParseV4DocumentBackend,
+        broker: Optional[WorkBroker] = None,
+        worker_id: Optional[str] = None,
+    ):
+        self.broker = broker or _create_broker(pipeline_options)
+        self.backend = backend
+        self.pipeline = StandardPdfPipeline(pipeline_options)
+        self.options_hash = _shard_options_hash(pipeline_options)
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self._document: Optional[Tuple[str, bytes]] = None  # last one, by hash
+
+    def run(
+        self, stop: Optional[threading.Event] = None, idle_interval: float = 1.0
+    ) -> None:
+        """Process shards until ``stop`` is set."""
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            if not self.run_once():
+                stop.wait(idle_interval)
+
+    def run_once(self) -> bool:
+        """Process the next queued shard, False if there was none."""
+        shard = self.broker.claim(self.options_hash, self.worker_id)
+        if shard is None:
+            return False
+
+        try:
+            result = self.process(shard)
+        except Exception as e:
+            _log.exception(
+                f"Pages {shard.start}-{shard.end - 1} of {shard.document_hash} failed"
+            )
+            self.broker.fail(shard, f"{type(e).__name__}: {e}")
+        else:
+            self.broker.complete(shard, result)
+        return True
+
+    def process(self, shard: PageShard) -> bytes:
+        if self._document is None or self._document[0] != shard.document_hash:
+            self._document = (
+                shard.document_hash,
+                self.broker.get_document(shard.document_hash),
+            )
+        in_doc = InputDocument(
+            path_or_stream=BytesIO(self._document[1]),
+            format=InputFormat.PDF,
+            backend=self.backend,
+            filename=f"{shard.document_hash}.pdf",
+            limits=DocumentLimits(page_range=(shard.start + 1, shard.end)),
+        )
+        if not in_doc.valid:
+            raise RuntimeError(f"Document {shard.document_hash} could not be opened")
+
+        def renew_lease(pages_done: int, page_count: int) -> None:
+            # Between page batches: keep the shard, or stop once it was handed out
+            if not self.broker.heartbeat(shard):
+                raise RuntimeError(
+                    f"Lost the lease of pages {shard.start}-{shard.end - 1} "
+                    f"after {pages_done}/{page_count} pages"
+                )
+
+        in_doc._preemption_point = renew_lease
+
+        conv_res = ConversionResult(input=in_doc)
+        try:
+            conv_res = self.pipeline._build_document(conv_res)
+            return PageShardResult(
+                pages={
+                    page.page_no: PageCacheEntry.from_page(
+                        page, conv_res.confidence.pages[page.page_no]
+                    )
+                    for page in conv_res.pages
+                }
+            ).to_bytes()
+        finally:
+            self.pipeline._unload(conv_res)
@@ -1,7 +1,7 @@
 import logging
 import warnings
 from pathlib import Path
-from typing import Optional, cast
+from typing import Callable, List, Optional, cast
 
 import numpy as np
 from docling_core.types.doc import DocItem, ImageRef, PictureItem, TableItem
@@ -63,33 +63,7 @@ class StandardPdfPipeline(PaginatedPipeline):
 
         self.reading_order_model = ReadingOrderModel(options=ReadingOrderOptions())
 
-        ocr_model = self.get_ocr_model(artifacts_path=artifacts_path)
-
-        self.build_pipe = [
-            # Pre-processing
-            PagePreprocessingModel(
-                options=PagePreprocessingOptions(
-                    images_scale=pipeline_options.images_scale,
-                )
-            ),
-            # OCR
-            ocr_model,
-            # Layout model
-            LayoutModel(
-                artifacts_path=artifacts_path,
-                accelerator_options=pipeline_options.accelerator_options,
-                options=pipeline_options.layout_options,
-            ),
-            # Table structure model
-            TableStructureModel(
-                enabled=pipeline_options.do_table_structure,
-                artifacts_path=artifacts_path,
-                options=pipeline_options.table_structure_options,
-                accelerator_options=pipeline_options.accelerator_options,
-            ),
-            # Page assemble
-            PageAssembleModel(options=PageAssembleOptions()),
-        ]
+        self.build_pipe = self._create_build_pipe(artifacts_path)
 
         # Picture description model
         if (
@@ -147,6 +121,37 @@ class StandardPdfPipeline(PaginatedPipeline):
         output_dir = download_models(output_dir=local_dir, force=force, progress=False)
         return output_dir
 
+    def _create_build_pipe(self, artifacts_path: Optional[Path]) -> List[Callable]:
+        """Models run on the pages, in order."""
+        pipeline_options = self.pipeline_options
+        ocr_model = self.get_ocr_model(artifacts_path=artifacts_path)
+
+        return [
+            # Pre-processing
+            PagePreprocessingModel(
+                options=PagePreprocessingOptions(
+                    images_scale=pipeline_options.images_scale,
+                )
+            ),
+            # OCR
+            ocr_model,
+            # Layout model
+            LayoutModel(
+                artifacts_path=artifacts_path,
+                accelerator_options=pipeline_options.accelerator_options,
+                options=pipeline_options.layout_options,
+            ),
+            # Table structure model
+            TableStructureModel(
+                enabled=pipeline_options.do_table_structure,
+                artifacts_path=artifacts_path,
+                options=pipeline_options.table_structure_options,
+                accelerator_options=pipeline_options.accelerator_options,
+            ),
+            # Page assemble
+            PageAssembleModel(options=PageAssembleOptions()),
+        ]
+
     def get_ocr_model(self, artifacts_path: Optional[Path] = None) -> BaseOcrModel:
         factory = get_ocr_factory(
             allow_external_plugins=self.pipeline_options.allow_external_plugins
@@ -9,6 +9,8 @@ A self-contained, thread-safe PDF conversion pipeline exploiting parallelism bet
   relying on :pyfunc:`id`, which may clash after garbage collection.
 * **Explicit back-pressure & shutdown** - producers block on full queues; queue *close()*
   propagates downstream so stages terminate deterministically without sentinels.
+* **Stage graph** - stages may fan out and join, so layout inference runs concurrently
+  with OCR and only the layout postprocessing waits for both.
 * **Minimal shared state** - heavyweight models are initialised once per pipeline instance
   and only read by worker threads; no runtime mutability is exposed.
 * **Strict typing & clean API usage** - code is fully annotated and respects *coding_rules.md*.
@@ -21,9 +23,9 @@ import logging
 import threading
 import time
 from collections import defaultdict, deque
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Any, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from docling.backend.abstract_backend import AbstractDocumentBackend
 from docling.backend.pdf_backend import PdfDocumentBackend
@@ -31,6 +33,7 @@ from docling.datamodel.base_models import AssembledUnit, ConversionStatus, Page
 from docling.datamodel.document import ConversionResult
 from docling.datamodel.pipeline_options import ThreadedPdfPipelineOptions
 from docling.datamodel.settings import settings
+from docling.exceptions import ConversionCancelled
 from docling.models.code_formula_model import CodeFormulaModel, CodeFormulaModelOptions
 from docling.models.document_picture_classifier import (
     DocumentPictureClassifier,
@@ -47,6 +50,12 @@ from docling.models.picture_description_base_model import PictureDescriptionBase
 from docling.models.readingorder_model import ReadingOrderModel, ReadingOrderOptions
 from docling.models.table_structure_model import TableStructureModel
 from docling.pipeline.base_pipeline import BasePipeline
+from docling.utils.page_cache import (
+    PageCache,
+    PageCacheEntry,
+    page_fingerprint,
+    pipeline_options_hash,
+)
 from docling.utils.profiling import ProfilingScope, TimeRecorder
 from docling.utils.utils import chunkify
 
@@ -97,7 +106,16 @@ class ProcessingResult:
 class ThreadedQueue:
     """Bounded queue with blocking put/ get_batch and explicit *close()* semantics."""
 
-    __slots__ = ("_closed", "_items", "_lock", "_max", "_not_empty", "_not_full")
+    __slots__ = (
+        "_closed",
+        "_items",
+        "_lock",
+        "_max",
+        "_not_empty",
+        "_not_full",
+        "_interrupted",
+        "_producers",
+    )
 
     def __init__(self, max_size: int) -> None:
         self._max: int = max_size
@@ -106,6 +124,8 @@ class ThreadedQueue:
         self._not_full = threading.Condition(self._lock)
         self._not_empty = threading.Condition(self._lock)
         self._closed = False
+        self._producers = 0  # upstream stages which did not finish yet
+        self._interrupted = False  # see interrupt()
 
     # ---------------------------------------------------------------- put()
     def put(self, item: ThreadedItem, timeout: Optional[float] | None = None) -> bool:
@@ -135,7 +155,7 @@ class ThreadedQueue:
         """Return up to *size* items.  Blocks until ≥1 item present or queue closed/timeout."""
         with self._not_empty:
             start = time.monotonic()
-            while not self._items and not self._closed:
+            while not self._items and not self._closed and not self._interrupted:
                 if timeout is not None:
                     remaining = timeout - (time.monotonic() - start)
                     if remaining <= 0:
@@ -150,6 +170,26 @@ class ThreadedQueue:
                 self._not_full.notify_all()
             return batch
 
+    # ------------------------------------------------------------- producers
+    def add_producer(self) -> None:
+        with self._lock:
+            self._producers += 1
+
+    def producer_done(self) -> None:
+        """Close the queue once every registered producer is done."""
+        with self._lock:
+            self._producers -= 1
+            if self._producers > 0:
+                return
+        self.close()
+
+    # ------------------------------------------------------------ interrupt()
+    def interrupt(self) -> None:
+        """Stop *get_batch()* from waiting, it returns the items already there."""
+        with self._lock:
+            self._interrupted = True
+            self._not_empty.notify_all()
+
     # ---------------------------------------------------------------- close()
     def close(self) -> None:
         with self._lock:
@@ -164,67 +204,122 @@ class ThreadedQueue:
 
 
 class ThreadedPipelineStage:
-    """A single pipeline stage backed by one worker thread."""
+    """A pipeline stage backed by one worker thread per model instance.
+
+    The replicas, one per instance in *models*, share the input queue, so a
+    stage waiting on I/O or running a model which releases the GIL processes
+    several batches at once; pages may leave the stage out of order. A stage
+    fed by several upstream stages joins their outputs: a page is passed to its
+    model once it arrived from every upstream stage.
+    """
 
     def __init__(
         self,
         *,
         name: str,
-        model: Any,
+        models: Sequence[Any],
         batch_size: int,
         batch_timeout: float,
         queue_max_size: int,
     ) -> None:
+        if not models:
+            raise ValueError(f"Stage {name} needs at least one model instance")
         self.name = name
-        self.model = model
+        self.models = list(models)
         self.batch_size = batch_size
         self.batch_timeout = batch_timeout
+        self.replicas = len(self.models)
         self.input_queue = ThreadedQueue(queue_max_size)
         self._outputs: list[ThreadedQueue] = []
-        self._thread: Optional[threading.Thread] = None
+        self._num_inputs = 0
+        self._pending: dict[tuple[int, int], list[ThreadedItem]] = {}
+        self._join_lock = threading.Lock()
+        self._threads: list[threading.Thread] = []
         self._running = False
 
     # ---------------------------------------------------------------- wiring
     def add_output_queue(self, q: ThreadedQueue) -> None:
         self._outputs.append(q)
+        for _ in range(self.replicas):  # every replica closes its side
+            q.add_producer()
+
+    def connect_to(self, downstream: ThreadedPipelineStage) -> None:
+        self.add_output_queue(downstream.input_queue)
+        downstream._num_inputs += 1
 
     # -------------------------------------------------------------- lifecycle
     def start(self) -> None:
         if self._running:
             return
         self._running = True
-        self._thread = threading.Thread(
-            target=self._run, name=f"Stage-{self.name}", daemon=False
-        )
-        self._thread.start()
+        self._threads = [
+            threading.Thread(
+                target=self._run,
+                args=(model,),
+                name=f"Stage-{self.name}"
+                if self.replicas == 1
+                else f"Stage-{self.name}-{ix}",
+                daemon=False,
+            )
+            for ix, model in enumerate(self.models)
+        ]
+        for thread in self._threads:
+            thread.start()
 
     def stop(self) -> None:
         if not self._running:
             return
         self._running = False
         self.input_queue.close()
-        if self._thread is not None:
-            self._thread.join(timeout=30.0)
-            if self._thread.is_alive():
-                _log.warning("Stage %s did not terminate cleanly within 30s", self.name)
+        deadline = time.monotonic() + 30.0
+        for thread in self._threads:
+            thread.join(timeout=max(0.0, deadline - time.monotonic()))
+            if thread.is_alive():
+                _log.warning(
+                    "Stage %s did not terminate cleanly within 30s", thread.name
+                )
 
     # ------------------------------------------------------------------ _run
-    def _run(self) -> None:
+    def _run(self, model: Any) -> None:
         try:
             while self._running:
                 batch = self.input_queue.get_batch(self.batch_size, self.batch_timeout)
                 if not batch and self.input_queue.closed:
                     break
-                processed = self._process_batch(batch)
+                if self._num_inputs > 1:
+                    batch = self._join(batch)
+                processed = self._process_batch(batch, model)
                 self._emit(processed)
         except Exception:  # pragma: no cover - top-level guard
             _log.exception("Fatal error in stage %s", self.name)
         finally:
             for q in self._outputs:
-                q.close()
+                q.producer_done()
+
+    # ---------------------------------------------------------------- _join()
+    def _join(self, batch: Sequence[ThreadedItem]) -> list[ThreadedItem]:
+        """Return the items of the pages which arrived from every upstream stage.
+
+        The branches share the page object, so the joined item is the page as
+        completed by all of them, failed if any branch failed.
+        """
+        joined: list[ThreadedItem] = []
+        with self._join_lock:  # shared by the replicas
+            for itm in batch:
+                key = (itm.run_id, itm.page_no)
+                arrived = self._pending.setdefault(key, [])
+                arrived.append(itm)
+                if len(arrived) < self._num_inputs:
+                    continue
+                del self._pending[key]
+                failed = next((i for i in arrived if i.is_failed or i.error), None)
+                joined.append(failed if failed is not None else arrived[0])
+        return joined
 
     # ----------------------------------------------------- _process_batch()
-    def _process_batch(self, batch: Sequence[ThreadedItem]) -> list[ThreadedItem]:
+    def _process_batch(
+        self, batch: Sequence[ThreadedItem], model: Any
+    ) -> list[ThreadedItem]:
         """Run *model* on *batch* grouped by run_id to maximise batching."""
         groups: dict[int, list[ThreadedItem]] = defaultdict(list)
         for itm in batch:
@@ -232,6 +327,14 @@ class ThreadedPipelineStage:
 
         result: list[ThreadedItem] = []
         for rid, items in groups.items():
+            # Pages of a cancelled run are dropped without running the model
+            cancel_token = items[0].conv_res._cancel_token
+            if cancel_token.cancelled:
+                for it in items:
+                    it.is_failed = True
+                    it.error = ConversionCancelled(cancel_token.reason)
+                result.extend(items)
+                continue
             good: list[ThreadedItem] = [i for i in items if not i.is_failed]
             if not good:
                 result.extend(items)
@@ -250,7 +353,7 @@ class ThreadedPipelineStage:
                     continue
 
                 pages: List[Page] = [payload for _, payload in pages_with_payloads]
-                processed_pages = list(self.model(good[0].conv_res, pages))  # type: ignore[arg-type]
+                processed_pages = list(model(good[0].conv_res, pages))  # type: ignore[arg-type]
                 if len(processed_pages) != len(pages):  # strict mismatch guard
                     raise RuntimeError(
                         f"Model {self.name} returned wrong number of pages"
@@ -275,8 +378,9 @@ class ThreadedPipelineStage:
     # -------------------------------------------------------------- _emit()
     def _emit(self, items: Iterable[ThreadedItem]) -> None:
         for item in items:
-            for q in self._outputs:
-                if not q.put(item):
+            for ix, q in enumerate(self._outputs):
+                # Every branch gets its own envelope, failures are marked on it
+                if not q.put(item if ix == 0 else replace(item)):
                     _log.error("Output queue closed while emitting from %s", self.name)
 
 
@@ -302,6 +406,16 @@ class ThreadedStandardPdfPipeline(BasePipeline):
         self.pipeline_options: ThreadedPdfPipelineOptions = pipeline_options
         self._run_seq = itertools.count(1)  # deterministic, monotonic run ids
 
+        self.page_cache: Optional[PageCache] = None
+        if pipeline_options.page_cache_dir is not None:
+            self.page_cache = PageCache(
+                cache_dir=Path(pipeline_options.page_cache_dir),
+                options_hash=pipeline_options_hash(
+                    type(self).__name__, pipeline_options
+                ),
+                max_bytes=pipeline_options.page_cache_max_bytes,
+            )
+
         # initialise heavy models once
         self._init_models()
 
@@ -321,18 +435,32 @@ class ThreadedStandardPdfPipeline(BasePipeline):
                 images_scale=self.pipeline_options.images_scale
             )
         )
-        self.ocr_model = self._make_ocr_model(art_path)
-        self.layout_model = LayoutModel(
-            artifacts_path=art_path,
-            accelerator_options=self.pipeline_options.accelerator_options,
-            options=self.pipeline_options.layout_options,
-        )
-        self.table_model = TableStructureModel(
-            enabled=self.pipeline_options.do_table_structure,
-            artifacts_path=art_path,
-            options=self.pipeline_options.table_structure_options,
-            accelerator_options=self.pipeline_options.accelerator_options,
-        )
+        # The OCR engines, layout and table predictors are not thread-safe,
+        # every replica of their stage gets its own instance.
+        self.ocr_models = [
+            self._make_ocr_model(art_path)
+            for _ in range(max(1, self.pipeline_options.ocr_replicas))
+        ]
+        self.layout_models = [
+            LayoutModel(
+                artifacts_path=art_path,
+                accelerator_options=self.pipeline_options.accelerator_options,
+                options=self.pipeline_options.layout_options,
+            )
+            for _ in range(max(1, self.pipeline_options.layout_replicas))
+        ]
+        self.table_models = [
+            TableStructureModel(
+                enabled=self.pipeline_options.do_table_structure,
+                artifacts_path=art_path,
+                options=self.pipeline_options.table_structure_options,
+                accelerator_options=self.pipeline_options.accelerator_options,
+            )
+            for _ in range(max(1, self.pipeline_options.table_replicas))
+        ]
+        self.ocr_model = self.ocr_models[0]
+        self.layout_model = self.layout_models[0]
+        self.table_model = self.table_models[0]
         self.assemble_model = PageAssembleModel(options=PageAssembleOptions())
         self.reading_order_model = ReadingOrderModel(options=ReadingOrderOptions())
 
@@ -417,53 +545,63 @@ class ThreadedStandardPdfPipeline(BasePipeline):
     # ────────────────────────────────────────────────────────────────────────
 
     def _create_run_ctx(self) -> RunContext:
+        """Wire the stage graph of one run.
+
+        Layout inference only needs the page image, so it runs next to OCR; the
+        layout postprocessing joins both branches, as it matches the predicted
+        clusters with the page cells, OCR cells included::
+
+            preprocess ─┬─ ocr ──────────────┬─ layout_postprocess ─ table ─ assemble
+                        └─ layout_predict ───┘
+        """
         opts = self.pipeline_options
-        preprocess = ThreadedPipelineStage(
-            name="preprocess",
-            model=self.preprocessing_model,
-            batch_size=1,
-            batch_timeout=opts.batch_timeout_seconds,
-            queue_max_size=opts.queue_max_size,
-        )
-        ocr = ThreadedPipelineStage(
-            name="ocr",
-            model=self.ocr_model,
-            batch_size=opts.ocr_batch_size,
-            batch_timeout=opts.batch_timeout_seconds,
-            queue_max_size=opts.queue_max_size,
-        )
-        layout = ThreadedPipelineStage(
-            name="layout",
-            model=self.layout_model,
-            batch_size=opts.layout_batch_size,
-            batch_timeout=opts.batch_timeout_seconds,
-            queue_max_size=opts.queue_max_size,
-        )
-        table = ThreadedPipelineStage(
-            name="table",
-            model=self.table_model,
-            batch_size=opts.table_batch_size,
-            batch_timeout=opts.batch_timeout_seconds,
-            queue_max_size=opts.queue_max_size,
-        )
-        assemble = ThreadedPipelineStage(
-            name="assemble",
-            model=self.assemble_model,
-            batch_size=1,
-            batch_timeout=opts.batch_timeout_seconds,
-            queue_max_size=opts.queue_max_size,
-        )
+        # name, model instances (one per replica), batch size
+        stage_specs: list[tuple[str, list[Any], int]] = [
+            ("preprocess", [self.preprocessing_model], 1),
+            ("ocr", self.ocr_models, opts.ocr_batch_size),
+            (
+                "layout_predict",
+                [model.predict_layout for model in self.layout_models],
+                opts.layout_batch_size,
+            ),
+            (
+                "layout_postprocess",
+                [self.layout_model.postprocess_layout],
+                opts.layout_batch_size,
+            ),
+            ("table", self.table_models, opts.table_batch_size),
+            ("assemble", [self.assemble_model], 1),
+        ]
+        edges: list[tuple[str, str]] = [
+            ("preprocess", "ocr"),
+            ("preprocess", "layout_predict"),
+            ("ocr", "layout_postprocess"),
+            ("layout_predict", "layout_postprocess"),
+            ("layout_postprocess", "table"),
+            ("table", "assemble"),
+        ]
+
+        stages = {
+            name: ThreadedPipelineStage(
+                name=name,
+                models=models,
+                batch_size=batch_size,
+                batch_timeout=opts.batch_timeout_seconds,
+                queue_max_size=opts.queue_max_size,
+            )
+            for name, models, batch_size in stage_specs
+        }
+        for upstream, downstream in edges:
+            stages[upstream].connect_to(stages[downstream])
 
-        # wire stages
         output_q = ThreadedQueue(opts.queue_max_size)
-        preprocess.add_output_queue(ocr.input_queue)
-        ocr.add_output_queue(layout.input_queue)
-        layout.add_output_queue(table.input_queue)
-        table.add_output_queue(assemble.input_queue)
-        assemble.add_output_queue(output_q)
+        stages["assemble"].add_output_queue(output_q)
 
-        stages = [preprocess, ocr, layout, table, assemble]
-        return RunContext(stages=stages, first_stage=preprocess, output_queue=output_q)
+        return RunContext(
+            stages=list(stages.values()),
+            first_stage=stages["preprocess"],
+            output_queue=output_q,
+        )
 
     # --------------------------------------------------------------------- build
     def _build_document(self, conv_res: ConversionResult) -> ConversionResult:
@@ -489,47 +627,162 @@ class ThreadedStandardPdfPipeline(BasePipeline):
             return conv_res
 
         total_pages: int = len(pages)
+        proc = ProcessingResult(total_expected=total_pages)
+
+        # pages done by an interrupted run are restored, not fed again
+        checkpoint = self._open_checkpoint(conv_res)
+        completed = checkpoint.completed_pages() if checkpoint is not None else set()
+        to_feed: list[Page] = []
+        for page in pages:
+            entry = checkpoint.load(page.page_no) if page.page_no in completed else None
+            if entry is None:
+                completed.discard(page.page_no)
+                to_feed.append(page)
+                continue
+            entry.restore(page, conv_res.confidence.pages[page.page_no])
+            proc.pages.append(page)
+        if completed:
+            _log.info(
+                f"Resuming {conv_res.input.file.name} from a checkpoint of {len(completed)} pages"
+            )
+
         ctx: RunContext = self._create_run_ctx()
         for st in ctx.stages:
             st.start()
 
-        proc = ProcessingResult(total_expected=total_pages)
-        fed_idx: int = 0  # number of pages successfully queued
         batch_size: int = 32  # drain chunk
-        try:
-            while proc.success_count + proc.failure_count < total_pages:
-                # 1) feed - try to enqueue until the first queue is full
-                while fed_idx < total_pages:
-                    ok = ctx.first_stage.input_queue.put(
+
+        # feed from a separate thread, blocking on back-pressure, so that the
+        # collector below only wakes up when results are ready
+        cancel_token = conv_res._cancel_token
+        preemption_point = conv_res.input._preemption_point
+        page_batch_size = settings.perf.page_batch_size
+        # fingerprints of the pages which missed the page cache, set by the
+        # feeder before the page enters the stages
+        fingerprints: Dict[int, str] = {}
+        # pages sent by the feeder and pages received by the collector: with a
+        # preemption point, the feeder waits for the pages in flight to finish
+        # at the end of each page batch before giving the scheduler a chance
+        progress = threading.Condition()
+        num_sent = num_collected = 0
+        collecting = True
+
+        def _drained() -> bool:
+            with progress:
+                while num_collected < num_sent:
+                    if not collecting or cancel_token.cancelled:
+                        return False
+                    progress.wait()
+            return True
+
+        # deadline or cancellation -> wake the feeder and the collector
+        def _wake() -> None:
+            ctx.output_queue.interrupt()
+            with progress:
+                progress.notify_all()
+
+        def _feed() -> None:
+            nonlocal num_sent
+            num_fed = 0  # pages fed to the stages
+            for page in to_feed:
+                if cancel_token.cancelled:
+                    break
+                # unchanged pages skip the stages, straight to the collector
+                if self.page_cache is not None and self._restore_cached_page(
+                    conv_res, page, fingerprints
+                ):
+                    ok = ctx.output_queue.put(
                         ThreadedItem(
-                            payload=pages[fed_idx],
+                            payload=page,
                             run_id=run_id,
-                            page_no=pages[fed_idx].page_no,
+                            page_no=page.page_no,
                             conv_res=conv_res,
-                        ),
-                        timeout=0.0,  # non-blocking try-put
+                        )
                     )
-                    if ok:
-                        fed_idx += 1
-                        if fed_idx == total_pages:
-                            ctx.first_stage.input_queue.close()
-                    else:  # queue full - switch to draining
+                    if not ok:  # pipeline stopped
+                        return
+                    with progress:
+                        num_sent += 1
+                    continue
+                # let the scheduler run other jobs between page batches, once
+                # the pages of the batch are done
+                if (
+                    preemption_point is not None
+                    and num_fed > 0
+                    and num_fed % page_batch_size == 0
+                ):
+                    if not _drained():
                         break
-
-                # 2) drain - pull whatever is ready from the output side
-                out_batch = ctx.output_queue.get_batch(batch_size, timeout=0.05)
+                    preemption_point(len(completed) + num_sent, total_pages)
+                ok = ctx.first_stage.input_queue.put(
+                    ThreadedItem(
+                        payload=page,
+                        run_id=run_id,
+                        page_no=page.page_no,
+                        conv_res=conv_res,
+                    )
+                )
+                if not ok:  # pipeline stopped
+                    return
+                num_fed += 1
+                with progress:
+                    num_sent += 1
+            ctx.first_stage.input_queue.close()
+
+        remove_wake = cancel_token.on_cancel(_wake)
+        feeder = threading.Thread(target=_feed, name="Stage-feed", daemon=False)
+        feeder.start()
+        try:
+            while proc.success_count + proc.failure_count < total_pages:
+                # pages arrive in completion order, they are put back in place
+                # by page_no when the results are integrated
+                out_batch = ctx.output_queue.get_batch(batch_size)
                 for itm in out_batch:
                     if itm.run_id != run_id:
                         continue
+                    with progress:
+                        num_collected += 1
+                        progress.notify()
                     if itm.is_failed or itm.error:
                         proc.failed_pages.append(
                             (itm.page_no, itm.error or RuntimeError("unknown error"))
                         )
+                    elif cancel_token.cancelled:
+                        # models skip work once cancelled, such pages are not kept
+                        proc.failed_pages.append(
+                            (itm.page_no, ConversionCancelled(cancel_token.reason))
+                        )
                     else:
                         assert itm.payload is not None
                         proc.pages.append(itm.payload)
+                        scores = conv_res.confidence.pages[itm.page_no]
+                        if checkpoint is not None:
+                            checkpoint.save(itm.payload, scores)
+                        if (
+                            self.page_cache is not None
+                            and itm.page_no in fingerprints
+                        ):
+                            self.page_cache.put(
+                                fingerprints[itm.page_no],
+                                PageCacheEntry.from_page(itm.payload, scores),
+                            )
+
+                # deadline or cancellation -> stop waiting for the pages in flight
+                if cancel_token.cancelled:
+                    done = {p.page_no for p in proc.pages}
+                    done.update(page_no for page_no, _ in proc.failed_pages)
+                    missing = [p.page_no for p in pages if p.page_no not in done]
+                    _log.warning(
+                        f"Document processing stopped with {len(missing)} pages left: {cancel_token.reason} "
+                        f"(document_timeout={self.pipeline_options.document_timeout})"
+                    )
+                    proc.failed_pages.extend(
+                        (page_no, ConversionCancelled(cancel_token.reason))
+                        for page_no in missing
+                    )
+                    break
 
-                # 3) failure safety - downstream closed early -> mark missing pages failed
+                # failure safety - downstream closed early -> mark missing pages failed
                 if not out_batch and ctx.output_queue.closed:
                     missing = total_pages - (proc.success_count + proc.failure_count)
                     if missing > 0:
@@ -538,13 +791,37 @@ class ThreadedStandardPdfPipeline(BasePipeline):
                         )
                     break
         finally:
+            remove_wake()
+            with progress:
+                collecting = False
+                progress.notify()
             for st in ctx.stages:
                 st.stop()
             ctx.output_queue.close()
+            feeder.join()
 
         self._integrate_results(conv_res, proc)
         return conv_res
 
+    def _restore_cached_page(
+        self, conv_res: ConversionResult, page: Page, fingerprints: Dict[int, str]
+    ) -> bool:
+        """Restore the outputs of an unchanged page from the page cache.
+
+        The fingerprint of a page missing from the cache is added to ``fingerprints``.
+        """
+        assert self.page_cache is not None
+        if page._backend is None or not page._backend.is_valid():
+            return False
+        with TimeRecorder(conv_res, "page_fingerprint"):
+            fingerprint = page_fingerprint(page._backend)
+        entry = self.page_cache.get(fingerprint)
+        if entry is None:
+            fingerprints[page.page_no] = fingerprint
+            return False
+        entry.restore(page, conv_res.confidence.pages[page.page_no])
+        return True
+
     # ---------------------------------------------------- integrate_results()
     def _integrate_results(
         self, conv_res: ConversionResult, proc: ProcessingResult
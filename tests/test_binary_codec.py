@@ -0,0 +1,98 @@
+from io import BytesIO
+
+import pytest
+from docling_core.types.doc import DoclingDocument, ImageRef, Size
+from PIL import Image
+
+from docling.backend.json.docling_json_backend import DoclingJSONBackend
+from docling.datamodel.base_models import InputFormat, Page, PagePredictions
+from docling.datamodel.document import InputDocument
+from docling.utils import binary_codec
+
+
+def _document() -> DoclingDocument:
+    doc = DoclingDocument(name="doc")
+    page_image = Image.new("RGB", (60, 80), "orange")
+    doc.add_page(
+        page_no=1,
+        size=Size(width=60, height=80),
+        image=ImageRef.from_pil(page_image, dpi=72),
+    )
+    doc.add_picture(image=ImageRef.from_pil(page_image.crop((0, 0, 20, 20)), dpi=72))
+    doc.add_picture()  # without an image
+    doc.add_text(label="text", text="Hello")
+    return doc
+
+
+def _json(doc: DoclingDocument) -> str:
+    return doc.model_dump_json(by_alias=True, exclude_none=True)
+
+
+def test_document_round_trip():
+    doc = _document()
+    frame = binary_codec.encode(doc)
+    assert binary_codec.is_encoded(frame)
+
+    decoded = binary_codec.decode(frame, DoclingDocument)
+    assert _json(decoded) == _json(doc)
+    assert decoded.pages[1].image.uri == doc.pages[1].image.uri
+    picture = decoded.pictures[0].image.pil_image
+    assert picture.size == (20, 20)
+    assert picture.convert("RGB").getpixel((5, 5)) == (255, 165, 0)
+    assert decoded.pictures[1].image is None
+    # the encoded document is left as it was
+    assert str(doc.pictures[0].image.uri).startswith("data:image/png;base64,")
+
+
+def test_page_round_trip_with_image_cache():
+    page = Page(page_no=3, size=Size(width=10, height=20))
+    page._image_cache[1.0] = Image.new("RGB", (10, 20), "red")
+    page._image_cache[2.0] = Image.new("L", (20, 40), 7)
+    page._default_image_scale = 2.0
+
+    decoded = binary_codec.decode(binary_codec.encode(page), Page)
+    assert decoded.page_no == 3 and decoded.size == page.size
+    assert set(decoded._image_cache) == {1.0, 2.0}
+    assert decoded._image_cache[1.0].getpixel((1, 1)) == (255, 0, 0)
+    assert decoded._image_cache[2.0].mode == "L"
+    assert decoded.image is not None and decoded.image.size == (20, 40)
+
+
+def test_decode_checks_the_frame():
+    frame = binary_codec.encode(PagePredictions())
+    assert binary_codec.decode(frame) == PagePredictions()
+    with pytest.raises(ValueError):
+        binary_codec.decode(frame, DoclingDocument)
+    with pytest.raises(ValueError):
+        binary_codec.decode(frame[:-1])
+    with pytest.raises(ValueError):
+        binary_codec.decode(b"{}")
+    with pytest.raises(TypeError):
+        binary_codec.encode(Size(width=1, height=1))
+
+
+def _load(data: bytes, filename: str) -> InputDocument:
+    return InputDocument(
+        path_or_stream=BytesIO(data),
+        format=InputFormat.JSON_DOCLING,
+        backend=DoclingJSONBackend,
+        filename=filename,
+    )
+
+
+@pytest.mark.parametrize(
+    "encode, filename",
+    [
+        (binary_codec.encode, "doc.dlbin"),
+        (lambda doc: _json(doc).encode(), "doc.json"),
+    ],
+)
+def test_json_backend_reads_both_encodings(encode, filename):
+    doc = _document()
+    in_doc = _load(encode(doc), filename)
+    assert in_doc.valid
+    assert _json(in_doc._backend.convert()) == _json(doc)
+
+
+def test_json_backend_rejects_other_data():
+    assert not _load(b"not a document", "doc.json").valid
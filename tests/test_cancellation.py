@@ -0,0 +1,75 @@
+import threading
+
+import pytest
+
+from docling.exceptions import ConversionCancelled
+from docling.utils.cancellation import CancellationGroup, CancellationToken
+
+
+def test_cancel_runs_callbacks_once():
+    token = CancellationToken()
+    calls = []
+    token.on_cancel(lambda: calls.append(1))
+    token.cancel("stop")
+    token.cancel("again")
+    assert calls == [1]
+    assert token.reason == "stop"
+    # registered after the cancellation: called right away
+    token.on_cancel(lambda: calls.append(2))
+    assert calls == [1, 2]
+    with pytest.raises(ConversionCancelled):
+        token.raise_if_cancelled()
+
+
+def test_deadline_runs_callbacks():
+    token = CancellationToken(timeout=0.05)
+    fired = threading.Event()
+    token.on_cancel(fired.set)
+    assert fired.wait(5)
+    assert token.reason == "deadline exceeded"
+
+
+def test_parent_cancellation_runs_child_callbacks():
+    parent = CancellationToken()
+    child = CancellationToken(parent=parent)
+    fired = threading.Event()
+    child.on_cancel(fired.set)
+    parent.cancel("client disconnected")
+    assert fired.is_set()
+    assert child.reason == "client disconnected"
+
+
+def test_removed_callback_is_not_called():
+    token = CancellationToken(timeout=0.05)
+    fired = threading.Event()
+    remove = token.on_cancel(fired.set)
+    remove()
+    assert not fired.wait(0.2)
+    assert token.cancelled  # expiry is still seen by checks
+
+
+def test_timeout_is_bounded_by_the_deadline():
+    token = CancellationToken(timeout=10)
+    assert token.timeout() is not None and token.timeout() <= 10
+    assert token.timeout(1.0) == 1.0
+    assert CancellationToken().timeout(3.0) == 3.0
+
+
+def test_group_token_cancelled_when_all_callers_cancel():
+    group = CancellationGroup()
+    first, second = CancellationToken(), CancellationToken()
+    with group.join("job", first) as job_token, group.join("job", second) as same:
+        assert job_token is same
+        first.cancel("first gone")
+        assert not job_token.cancelled
+        second.cancel("second gone")
+        assert job_token.cancelled
+
+
+def test_group_token_cancelled_when_callers_time_out():
+    group = CancellationGroup()
+    caller = CancellationToken(timeout=0.05)
+    with group.join("job", caller) as job_token:
+        fired = threading.Event()
+        job_token.on_cancel(fired.set)
+        assert fired.wait(5)
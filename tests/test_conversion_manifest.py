@@ -0,0 +1,68 @@
+from pathlib import Path
+
+from docling.datamodel.base_models import ConversionStatus
+from docling.utils.conversion_manifest import ConversionManifest, ManifestEntry
+
+
+def _entry(status: ConversionStatus, **kwargs) -> ManifestEntry:
+    values = dict(
+        source="in/doc.pdf",
+        output_stem="doc",
+        file_hash="hash",
+        size=10,
+        mtime=1.0,
+        fingerprint="fp",
+        status=status,
+    )
+    values.update(kwargs)
+    return ManifestEntry(**values)
+
+
+def test_last_entry_wins_after_reload(tmp_path: Path):
+    path = tmp_path / "manifest.jsonl"
+    with ConversionManifest(path) as manifest:
+        manifest.append(_entry(ConversionStatus.FAILURE))
+        manifest.append(_entry(ConversionStatus.SUCCESS))
+
+    with ConversionManifest(path) as manifest:
+        assert len(manifest) == 1
+        assert manifest.is_unchanged_success(Path("in/doc.pdf"), 10, 1.0, "fp")
+        assert not manifest.is_unchanged_success(Path("in/doc.pdf"), 10, 2.0, "fp")
+        assert not manifest.is_unchanged_success(Path("in/doc.pdf"), 10, 1.0, "other")
+        assert manifest.completed("fp") == {("hash", "doc")}
+
+
+def test_skipped_entry_does_not_replace_success(tmp_path: Path):
+    path = tmp_path / "manifest.jsonl"
+    with ConversionManifest(path) as manifest:
+        manifest.append(_entry(ConversionStatus.SUCCESS))
+        manifest.append(_entry(ConversionStatus.SKIPPED, mtime=2.0))
+
+    with ConversionManifest(path) as manifest:
+        entry = manifest.get(Path("in/doc.pdf"))
+        assert entry is not None
+        assert entry.status == ConversionStatus.SUCCESS
+        assert manifest.completed("fp") == {("hash", "doc")}
+
+
+def test_touched_file_recorded_as_skipped_success(tmp_path: Path):
+    path = tmp_path / "manifest.jsonl"
+    with ConversionManifest(path) as manifest:
+        manifest.append(_entry(ConversionStatus.SUCCESS))
+        # same content, touched since the previous run
+        manifest.append(_entry(ConversionStatus.SUCCESS, mtime=2.0, skipped=True))
+
+    with ConversionManifest(path) as manifest:
+        assert manifest.is_unchanged_success(Path("in/doc.pdf"), 10, 2.0, "fp")
+        assert manifest.completed("fp") == {("hash", "doc")}
+
+
+def test_truncated_line_is_ignored(tmp_path: Path):
+    path = tmp_path / "manifest.jsonl"
+    with ConversionManifest(path) as manifest:
+        manifest.append(_entry(ConversionStatus.SUCCESS))
+    with path.open("a", encoding="utf-8") as f:
+        f.write('{"source": "in/other.pdf", "outp')
+
+    with ConversionManifest(path) as manifest:
+        assert len(manifest) == 1
@@ -0,0 +1,59 @@
+import threading
+from io import BytesIO
+from types import SimpleNamespace
+
+import pytest
+
+from docling.datamodel import document
+from docling.datamodel.base_models import DocumentStream
+from docling.datamodel.document import _DocumentConversionInput
+
+
+def _streams(sizes):
+    return [
+        DocumentStream(name=f"doc{ix}.md", stream=BytesIO(b"x" * size))
+        for ix, size in enumerate(sizes)
+    ]
+
+
+def _prefetch(monkeypatch, streams, prefetch, max_bytes):
+    """Submitted items after each consumed document."""
+    submitted = []
+    release = threading.Event()
+
+    def input_size(item):  # called when the item is submitted
+        submitted.append(item.name)
+        return item.stream.getbuffer().nbytes
+
+    def create(self, item, format_options):
+        release.wait(5)  # keep the documents in flight
+        return SimpleNamespace(filesize=item.stream.getbuffer().nbytes)
+
+    monkeypatch.setattr(document, "_input_size", input_size)
+    monkeypatch.setattr(_DocumentConversionInput, "_create_input_document", create)
+    conv_input = _DocumentConversionInput(path_or_stream_iterator=streams)
+    docs = conv_input._prefetched_docs({}, prefetch=prefetch, max_bytes=max_bytes)
+
+    seen = []
+    # the first document is only returned once released, submissions are
+    # decided before that
+    timer = threading.Timer(0.2, release.set)
+    timer.start()
+    for _ in docs:
+        seen.append(len(submitted))
+    timer.join()
+    return seen
+
+
+def test_prefetch_count_bound(monkeypatch: pytest.MonkeyPatch):
+    seen = _prefetch(monkeypatch, _streams([1] * 6), prefetch=2, max_bytes=1 << 20)
+    # at most `prefetch` documents submitted ahead of the consumer
+    assert seen[0] == 2
+    assert seen == [2, 3, 4, 5, 6, 6]
+
+
+def test_prefetch_byte_bound_counts_in_flight(monkeypatch: pytest.MonkeyPatch):
+    # in-flight documents count with their input size, so only one is
+    # submitted while it is larger than max_bytes
+    seen = _prefetch(monkeypatch, _streams([100] * 3), prefetch=3, max_bytes=50)
+    assert seen[0] == 1
@@ -0,0 +1,139 @@
+import threading
+import time
+from typing import List
+
+from docling.exceptions import ConversionCancelled
+from docling.utils.cancellation import CancellationToken
+from docling.utils.job_scheduler import JobScheduler
+
+
+def _wait_for(condition, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+
+def _submit(scheduler: JobScheduler, started: List[str], name: str, **kwargs):
+    """Queue a job behind the running ones, it records its name once started."""
+    waiting = scheduler.stats()["waiting"]
+
+    def job():
+        with scheduler.run(**kwargs):
+            started.append(name)
+
+    thread = threading.Thread(target=job)
+    thread.start()
+    _wait_for(lambda: scheduler.stats()["waiting"] == waiting + 1)
+    return thread
+
+
+def _run_queued(scheduler: JobScheduler, jobs) -> List[str]:
+    started: List[str] = []
+    with scheduler.run(cost=1, tenant="blocker"):
+        threads = [
+            _submit(scheduler, started, name, **kwargs) for name, kwargs in jobs
+        ]
+    for thread in threads:
+        thread.join(5)
+    return started
+
+
+def test_small_jobs_overtake_a_large_one():
+    started = _run_queued(
+        JobScheduler(max_running=1),
+        [
+            ("large", dict(cost=100, tenant="a")),
+            ("small-1", dict(cost=1, tenant="b")),
+            ("small-2", dict(cost=1, tenant="c")),
+        ],
+    )
+    assert started == ["small-1", "small-2", "large"]
+
+
+def test_tenant_backlog_does_not_starve_others():
+    started = _run_queued(
+        JobScheduler(max_running=1),
+        [(f"busy-{ix}", dict(cost=10, tenant="busy")) for ix in range(5)]
+        + [("other", dict(cost=10, tenant="other"))],
+    )
+    # the busy tenant keeps the first slot, its backlog waits behind "other"
+    assert started == ["busy-0", "other", "busy-1", "busy-2", "busy-3", "busy-4"]
+
+
+def test_preempted_job_resumes():
+    scheduler = JobScheduler(max_running=1, preempt_min_cost=10)
+    events: List[str] = []
+    large_started = threading.Event()
+    next_page = threading.Event()
+
+    def large():
+        with scheduler.run(cost=100, tenant="a") as job:
+            events.append("large")
+            large_started.set()
+            next_page.wait(5)
+            job.preemption_point(1, 10)
+            events.append("large resumed")
+
+    thread = threading.Thread(target=large)
+    thread.start()
+    assert large_started.wait(5)
+    small = _submit(scheduler, events, "small", cost=1, tenant="b")
+    next_page.set()
+    thread.join(5)
+    small.join(5)
+    assert events == ["large", "small", "large resumed"]
+    assert scheduler.stats()["running"] == 0
+
+
+def test_cancelled_job_stops_waiting():
+    scheduler = JobScheduler(max_running=1)
+    token = CancellationToken()
+    errors: List[Exception] = []
+
+    def waiting():
+        try:
+            with scheduler.run(cost=1, cancel_token=token):
+                pass
+        except ConversionCancelled as e:
+            errors.append(e)
+
+    with scheduler.run(cost=1):
+        thread = threading.Thread(target=waiting)
+        thread.start()
+        _wait_for(lambda: scheduler.stats()["waiting"] == 1)
+        token.cancel("client gone")
+        thread.join(1)
+        assert not thread.is_alive()
+    assert len(errors) == 1
+    assert scheduler.stats()["waiting"] == 0
+
+
+def test_cancelled_preempted_job_resumes_at_once():
+    scheduler = JobScheduler(max_running=1, preempt_min_cost=10)
+    token = CancellationToken()
+    small_started = threading.Event()
+    release_small = threading.Event()
+
+    def small():
+        with scheduler.run(cost=1, tenant="b"):
+            small_started.set()
+            release_small.wait(5)
+
+    with scheduler.run(cost=100, tenant="a", cancel_token=token) as job:
+        thread = threading.Thread(target=small)
+        thread.start()
+        _wait_for(lambda: scheduler.stats()["waiting"] == 1)
+
+
+        def cancel_once_small_runs():
+            small_started.wait(5)
+            token.cancel("client gone")
+
+        threading.Thread(target=cancel_once_small_runs).start()
+        job.preemption_point(1, 10)  # returns once cancelled, small still runs
+        assert small_started.is_set()
+        assert scheduler.stats()["running"] == 2
+    release_small.set()
+    thread.join(5)
+    assert scheduler.stats()["running"] == 0
@@ -0,0 +1,117 @@
+from docling_core.types.doc import BoundingBox
+from PIL import Image, ImageDraw
+
+from docling.utils.ocr_region_planner import (
+    VlmRegion,
+    VlmRequest,
+    assign_texts,
+    plan_vlm_requests,
+    split_at_blank_rows,
+)
+
+
+def _render(bbox: BoundingBox) -> Image.Image:
+    # one pixel per point, white
+    return Image.new("RGB", (int(bbox.width), int(bbox.height)), "white")
+
+
+def _plan(regions, merge_max_pixels=1_000_000, split_max_pixels=4_000_000):
+    return plan_vlm_requests(
+        regions,
+        render=_render,
+        token_budget=lambda area: 256,
+        whole_labels=["table"],
+        merge_max_region_area=6000.0,
+        merge_max_pixels=merge_max_pixels,
+        merge_max_gap=20.0,
+        split_max_pixels=split_max_pixels,
+    )
+
+
+def _region(l, t, r, b, label="text"):
+    return VlmRegion(bbox=BoundingBox(l=l, t=t, r=r, b=b), label=label)
+
+
+def _text_image(lines):
+    """A 200 px wide image with black bars as text lines, at the given rows."""
+    image = Image.new("RGB", (200, 300), "white")
+    draw = ImageDraw.Draw(image)
+    for top, bottom in lines:
+        draw.rectangle((10, top, 190, bottom - 1), fill="black")
+    return image
+
+
+def test_split_at_blank_rows():
+    image = _text_image([(0, 40), (60, 100), (120, 160), (200, 280)])
+    parts = split_at_blank_rows(image, max_height=110)
+    # cut in the middle of the last blank band within reach
+    assert parts == [(0, 105), (105, 180), (180, 285), (285, 300)]
+    # no blank rows: kept whole rather than cutting through text
+    assert split_at_blank_rows(_text_image([(0, 300)]), max_height=100) == [(0, 300)]
+
+
+def test_merge_stacks_regions_of_a_column():
+    regions = [
+        _region(10, 10, 110, 30),
+        _region(10, 40, 110, 60),
+        _region(10, 70, 110, 90),
+    ]
+    requests = _plan(regions)
+    assert [r.region_ixs for r in requests] == [[0, 1, 2]]
+    assert requests[0].region_heights == [20, 20, 20]
+
+
+def test_merge_respects_pixel_budget():
+    regions = [_region(10, 10 + 30 * ix, 110, 30 + 30 * ix) for ix in range(4)]
+    # two stacked regions: 100 * (20 + 24 + 20) pixels
+    requests = _plan(regions, merge_max_pixels=100 * 64)
+    assert [r.region_ixs for r in requests] == [[0, 1], [2, 3]]
+
+
+def test_merge_skips_other_columns_and_distant_regions():
+    regions = [
+        _region(10, 10, 110, 30),
+        _region(300, 12, 400, 32),  # next column
+        _region(10, 200, 110, 220),  # far below
+        _region(10, 230, 110, 250, label="table"),
+    ]
+    requests = _plan(regions)
+    assert [r.region_ixs for r in requests] == [[0], [1], [2], [3]]
+
+
+def test_assign_texts_by_paragraph():
+    request = VlmRequest(
+        image=Image.new("RGB", (1, 1)),
+        max_tokens=256,
+        region_ixs=[3, 5],
+        region_heights=[20, 20],
+    )
+    assert assign_texts([request], ["Title\n\nFirst line\nsecond line"]) == [
+        (3, "Title"),
+        (5, "First line\nsecond line"),
+    ]
+
+
+def test_assign_texts_by_line_position():
+    request = VlmRequest(
+        image=Image.new("RGB", (1, 1)),
+        max_tokens=256,
+        region_ixs=[0, 1],
+        region_heights=[20, 60],
+    )
+    # paragraphs do not match the regions, lines are shared by height
+    assert assign_texts([request], ["a\nb\nc\nd"]) == [(0, "a"), (1, "b\nc\nd")]
+
+
+def test_assign_texts_joins_split_parts():
+    parts = [
+        VlmRequest(
+            image=Image.new("RGB", (1, 1)),
+            max_tokens=256,
+            region_ixs=[2],
+            region_heights=[100],
+            split=True,
+        )
+        for _ in range(2)
+    ]
+    assert assign_texts(parts, ["first", "second"]) == [(2, "first\n\nsecond")]
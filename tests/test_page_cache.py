@@ -0,0 +1,85 @@
+import os
+from pathlib import Path
+from typing import List
+
+from docling_core.types.doc import BoundingBox
+from docling_core.types.doc.page import BoundingRectangle, TextCell
+from PIL import Image
+
+from docling.datamodel.base_models import Size
+from docling.utils.page_cache import PageCache, PageCacheEntry, page_fingerprint
+
+
+class _FakePageBackend:
+    def __init__(self, texts: List[str]):
+        self.cells = [
+            TextCell(
+                rect=BoundingRectangle.from_bounding_box(
+                    BoundingBox(l=10, t=20 * ix, r=100, b=20 * ix + 10)
+                ),
+                text=text,
+                orig=text,
+                from_ocr=False,
+            )
+            for ix, text in enumerate(texts)
+        ]
+
+    def get_size(self) -> Size:
+        return Size(width=200, height=300)
+
+    def get_page_image(self, scale: float = 1, cropbox=None) -> Image.Image:
+        # the same raster for every revision, e.g. a scan with a text layer
+        return Image.new("RGB", (int(200 * scale), int(300 * scale)), "white")
+
+    def get_text_cells(self) -> List[TextCell]:
+        return self.cells
+
+
+def _fingerprint(texts: List[str]) -> str:
+    return page_fingerprint(_FakePageBackend(texts))  # type: ignore[arg-type]
+
+
+def test_fingerprint_changes_with_text_layer():
+    original = _fingerprint(["Total: 1,234.56"])
+    assert original == _fingerprint(["Total: 1,234.56"])
+    assert original != _fingerprint(["Total: 1,234.58"])
+    assert original != _fingerprint(["Total:", "1,234.56"])
+
+
+def _entry() -> PageCacheEntry:
+    return PageCacheEntry(size=Size(width=200, height=300))
+
+
+def _cache_bytes(cache_dir: Path) -> int:
+    return sum(p.stat().st_size for p in cache_dir.glob("*/*.json.gz"))
+
+
+def test_cache_round_trip(tmp_path: Path):
+    cache = PageCache(tmp_path, options_hash="options")
+    assert cache.get("page") is None
+    cache.put("page", _entry())
+    assert cache.get("page") == _entry()
+    # entries of other options are not served
+    assert PageCache(tmp_path, options_hash="other").get("page") is None
+
+
+def test_cache_prunes_least_recently_used(tmp_path: Path):
+    cache = PageCache(tmp_path, options_hash="options")
+    cache.put("entry", _entry())
+    entry_size = _cache_bytes(tmp_path)
+
+    os.utime(cache._entry_path("entry"), (900, 900))
+
+    cache = PageCache(tmp_path, options_hash="options", max_bytes=5 * entry_size)
+    for ix in range(4):
+        cache.put(f"page-{ix}", _entry())
+        os.utime(cache._entry_path(f"page-{ix}"), (1000 + ix, 1000 + ix))
+    assert _cache_bytes(tmp_path) == 5 * entry_size  # at the bound, nothing pruned
+    assert cache.get("page-0") is not None  # now the most recently used
+
+    cache.put("page-5", _entry())
+    assert _cache_bytes(tmp_path) <= 0.9 * 5 * entry_size
+    assert cache.get("entry") is None
+    assert cache.get("page-1") is None
+    assert cache.get("page-0") is not None
+    assert cache.get("page-5") is not None
@@ -0,0 +1,105 @@
+import threading
+import time
+
+import pytest
+
+from docling.utils import singleflight
+from docling.utils.singleflight import KeyedLocks, ResultCache, SingleFlight
+
+
+def _run_concurrently(num_callers, target):
+    threads = [threading.Thread(target=target) for _ in range(num_callers)]
+    for thread in threads:
+        thread.start()
+    return threads
+
+
+def test_singleflight_coalesces_concurrent_calls():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+    results = []
+
+    def fn():
+        calls.append(1)
+        release.wait(5)
+        return "result"
+
+    threads = _run_concurrently(5, lambda: results.append(flight.do("key", fn)))
+    time.sleep(0.2)  # let every caller reach the flight
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert sorted(results) == [("result", False)] + [("result", True)] * 4
+    assert flight.in_flight() == 0
+
+
+def test_singleflight_propagates_leader_exception():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    errors = []
+
+    def fn():
+        started.set()
+        release.wait(5)
+        raise ValueError("boom")
+
+    def call():
+        try:
+            flight.do("key", fn)
+        except ValueError as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait(5)
+    waiters = _run_concurrently(3, call)
+    release.set()
+    for thread in [leader, *waiters]:
+        thread.join(5)
+
+    assert len(errors) == 4
+    assert all(str(e) == "boom" for e in errors)
+    # the failed call is not kept, the next caller runs fn again
+    assert flight.do("key", lambda: "retried") == ("retried", False)
+
+
+def test_keyed_locks_drop_unused_locks():
+    locks = KeyedLocks()
+    with locks.lock("a"):
+        with locks.lock("b"):
+            assert len(locks) == 2
+    assert len(locks) == 0
+
+
+def test_result_cache_lru():
+    cache: ResultCache[int] = ResultCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" is now the least recently used
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_result_cache_ttl(monkeypatch: pytest.MonkeyPatch):
+    now = [100.0]
+    monkeypatch.setattr(singleflight.time, "monotonic", lambda: now[0])
+    cache: ResultCache[str] = ResultCache(ttl=10)
+    cache.put("key", "value")
+
+    now[0] += 10
+    assert cache.get("key") == "value"
+    now[0] += 0.5
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_result_cache_disabled():
+    cache: ResultCache[str] = ResultCache(max_entries=0)
+    cache.put("key", "value")
+    assert cache.get("key") is None
@@ -0,0 +1,90 @@
+import time
+from pathlib import Path
+from typing import List
+
+from docling.utils.work_broker import PageShard, SqliteWorkBroker
+
+
+def _shards(job_id: str, n: int) -> List[PageShard]:
+    return [
+        PageShard(
+            job_id=job_id,
+            document_hash="doc",
+            options_hash="options",
+            start=4 * ix,
+            end=4 * (ix + 1),
+        )
+        for ix in range(n)
+    ]
+
+
+def test_claim_and_collect(tmp_path: Path):
+    broker = SqliteWorkBroker(tmp_path / "broker.db")
+    broker.submit(b"%PDF", _shards("job", 2))
+    assert broker.get_document("doc") == b"%PDF"
+    assert broker.claim("other options", "worker") is None
+
+    first = broker.claim("options", "worker-1")
+    second = broker.claim("options", "worker-2")
+    assert first is not None and second is not None
+    assert (first.start, first.worker_id) == (0, "worker-1")
+    assert (second.start, second.worker_id) == (4, "worker-2")
+    assert broker.claim("options", "worker-3") is None
+
+    broker.complete(first, b"result")
+    outcomes = broker.collect("job")
+    assert [(o.shard.start, o.result, o.error) for o in outcomes] == [
+        (0, b"result", None)
+    ]
+    assert broker.collect("job") == []  # taken once
+
+    broker.close_job("job")
+    assert broker.claim("options", "worker-1") is None
+
+
+def test_expired_lease_is_handed_out_again(tmp_path: Path):
+    broker = SqliteWorkBroker(tmp_path / "broker.db", lease=0.05)
+    broker.submit(b"%PDF", _shards("job", 1))
+    stale = broker.claim("options", "worker-1")
+    assert stale is not None
+    time.sleep(0.1)
+
+    fresh = broker.claim("options", "worker-2")
+    assert fresh is not None and fresh.shard_id == stale.shard_id
+    # the first worker lost the shard, its calls are fenced off
+    assert not broker.heartbeat(stale)
+    broker.complete(stale, b"stale")
+    broker.fail(stale, "stale")
+    assert broker.collect("job") == []
+
+    assert broker.heartbeat(fresh)
+    broker.complete(fresh, b"fresh")
+    assert [o.result for o in broker.collect("job")] == [b"fresh"]
+
+
+def test_heartbeat_keeps_the_lease(tmp_path: Path):
+    broker = SqliteWorkBroker(tmp_path / "broker.db", lease=0.2)
+    broker.submit(b"%PDF", _shards("job", 1))
+    shard = broker.claim("options", "worker-1")
+    assert shard is not None
+    for _ in range(4):
+        time.sleep(0.1)
+        assert broker.heartbeat(shard)
+    assert broker.claim("options", "worker-2") is None
+
+
+def test_failed_shard_is_retried_until_out_of_attempts(tmp_path: Path):
+    broker = SqliteWorkBroker(tmp_path / "broker.db", max_attempts=2)
+    broker.submit(b"%PDF", _shards("job", 1))
+
+    shard = broker.claim("options", "worker-1")
+    assert shard is not None
+    broker.fail(shard, "RuntimeError: first")
+    assert broker.collect("job") == []  # queued again
+
+    shard = broker.claim("options", "worker-2")
+    assert shard is not None
+    broker.fail(shard, "RuntimeError: second")
+    outcomes = broker.collect("job")
+    assert [(o.result, o.error) for o in outcomes] == [(None, "RuntimeError: second")]
+    assert broker.claim("options", "worker-3") is None
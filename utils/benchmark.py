@@ -0,0 +1,685 @@
+"""Reproducible conversion benchmarks.
+
+Provides a synthetic corpus generator, a runner collecting throughput, per-stage
+latency percentiles, peak memory and CPU utilisation, and a comparison against a
+stored JSON baseline with regression thresholds. ``run_codec_benchmark`` times
+the JSON and binary round trips of a converted document.
+"""
+
+import logging
+import random
+import resource
+import sys
+import time
+from collections import defaultdict
+from enum import Enum
+from io import BytesIO
+from pathlib import Path
+from typing import Callable, Dict, List, Literal, Optional
+
+import numpy as np
+from docling_core.types.doc import (
+    BoundingBox,
+    DocItemLabel,
+    DoclingDocument,
+    ImageRef,
+    ProvenanceItem,
+    Size,
+)
+from PIL import Image, ImageDraw, ImageFont
+from pydantic import BaseModel
+
+from docling.datamodel.base_models import ConversionStatus, InputFormat
+from docling.datamodel.pipeline_options import (
+    EasyOcrOptions,
+    MyOcrOptions,
+    OcrOptions,
+    PdfPipelineOptions,
+    ThreadedPdfPipelineOptions,
+)
+from docling.datamodel.settings import settings
+from docling.document_converter import DocumentConverter, PdfFormatOption
+from docling.models.factories import get_ocr_factory
+from docling.utils import binary_codec
+from docling.utils.serialization import write_document_json
+
+_log = logging.getLogger(__name__)
+
+_WORDS = (
+    "the of and to in is that for on with as by this are be from at an which "
+    "document model page table layout text figure section result analysis data "
+    "conversion pipeline value report contract revenue quarter total amount "
+    "method approach sample average number system process period summary"
+).split()
+
+_FORMULAS = [
+    "E = m c^2",
+    "f(x) = a x^2 + b x + c",
+    "x = (-b +/- sqrt(b^2 - 4 a c)) / (2 a)",
+    "sum_{i=1}^{n} i = n (n + 1) / 2",
+    "int_0^1 x^2 dx = 1/3",
+    "P(A|B) = P(B|A) P(A) / P(B)",
+    "d/dx sin(x) = cos(x)",
+    "lim_{n -> inf} (1 + 1/n)^n = e",
+]
+
+
+class CorpusKind(str, Enum):
+    BORN_DIGITAL = "born_digital"
+    SCANNED = "scanned"
+    TABLES = "tables"
+    FORMULAS = "formulas"
+    DOCX = "docx"
+    XLSX = "xlsx"
+    HTML = "html"
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Synthetic corpus
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+def _sentence(rng: random.Random, min_words: int = 6, max_words: int = 14) -> str:
+    words = [rng.choice(_WORDS) for _ in range(rng.randint(min_words, max_words))]
+    return " ".join(words).capitalize() + "."
+
+
+def _pdf_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+class _PdfPage:
+    """Minimal content-stream builder for a single US-Letter page."""
+
+    width = 612
+    height = 792
+
+    def __init__(self):
+        self.ops: List[str] = []
+
+    def text(self, x: float, y: float, text: str, size: float = 11) -> None:
+        self.ops.append(
+            f"BT /F1 {size:g} Tf {x:.2f} {y:.2f} Td ({_pdf_escape(text)}) Tj ET"
+        )
+
+    def line(self, x0: float, y0: float, x1: float, y1: float) -> None:
+        self.ops.append(f"0.5 w {x0:.2f} {y0:.2f} m {x1:.2f} {y1:.2f} l S")
+
+    def content(self) -> bytes:
+        return "\n".join(self.ops).encode("latin-1", errors="replace")
+
+
+def _write_pdf(path: Path, pages: List[_PdfPage]) -> None:
+    """Write a born-digital PDF using the standard Helvetica font."""
+    n_pages = len(pages)
+    font_id = 3
+    first_page_id = 4
+    objects: Dict[int, bytes] = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        2: (
+            "<< /Type /Pages /Kids ["
+            + " ".join(f"{first_page_id + 2 * i} 0 R" for i in range(n_pages))
+            + f"] /Count {n_pages} >>"
+        ).encode(),
+        font_id: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    }
+    for i, page in enumerate(pages):
+        page_id = first_page_id + 2 * i
+        content_id = page_id + 1
+        objects[page_id] = (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {page.width} {page.height}] "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> /Contents {content_id} 0 R >>"
+        ).encode()
+        stream = page.content()
+        objects[content_id] = (
+            f"<< /Length {len(stream)} >>\nstream\n".encode()
+            + stream
+            + b"\nendstream"
+        )
+
+    buf = BytesIO()
+    buf.write(b"%PDF-1.4\n")
+    offsets = {}
+    for obj_id in sorted(objects):
+        offsets[obj_id] = buf.tell()
+        buf.write(f"{obj_id} 0 obj\n".encode() + objects[obj_id] + b"\nendobj\n")
+
+    xref_offset = buf.tell()
+    size = max(objects) + 1
+    buf.write(f"xref\n0 {size}\n0000000000 65535 f \n".encode())
+    for obj_id in range(1, size):
+        buf.write(f"{offsets[obj_id]:010d} 00000 n \n".encode())
+    buf.write(
+        f"trailer\n<< /Size {size} /Root 1 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n".encode()
+    )
+    path.write_bytes(buf.getvalue())
+
+
+def _text_pages(rng: random.Random, num_pages: int) -> List[_PdfPage]:
+    pages = []
+    for page_no in range(num_pages):
+        page = _PdfPage()
+        y = page.height - 72
+        page.text(72, y, f"Section {page_no + 1}: {_sentence(rng, 3, 6)}", size=16)
+        y -= 30
+        while y > 90:
+            page.text(72, y, _sentence(rng))
+            y -= 16 if rng.random() > 0.15 else 30
+        page.text(page.width / 2, 40, str(page_no + 1), size=9)
+        pages.append(page)
+    return pages
+
+
+def _table_pages(rng: random.Random, num_pages: int) -> List[_PdfPage]:
+    pages = []
+    for page_no in range(num_pages):
+        page = _PdfPage()
+        y = page.height - 72
+        page.text(72, y, f"Table {page_no + 1}. {_sentence(rng, 4, 8)}", size=12)
+        y -= 24
+        for _ in range(2):
+            n_rows, n_cols = rng.randint(6, 12), rng.randint(3, 6)
+            col_w = (page.width - 144) / n_cols
+            row_h = 18
+            top = y
+            for r in range(n_rows + 1):
+                page.line(72, top - r * row_h, page.width - 72, top - r * row_h)
+            for c in range(n_cols + 1):
+                x = 72 + c * col_w
+                page.line(x, top, x, top - n_rows * row_h)
+            for r in range(n_rows):
+                for c in range(n_cols):
+                    cell = (
+                        rng.choice(_WORDS).capitalize()
+                        if r == 0
+                        else f"{rng.uniform(0, 10000):.2f}"
+                    )
+                    page.text(72 + c * col_w + 4, top - (r + 1) * row_h + 5, cell, 9)
+            y = top - n_rows * row_h - 40
+            if y < 300:
+                break
+        pages.append(page)
+    return pages
+
+
+def _formula_pages(rng: random.Random, num_pages: int) -> List[_PdfPage]:
+    pages = []
+    for _ in range(num_pages):
+        page = _PdfPage()
+        y = page.height - 72
+        while y > 100:
+            page.text(72, y, _sentence(rng))
+            y -= 28
+            formula = rng.choice(_FORMULAS)
+            page.text(160, y, formula, size=12)
+            page.text(page.width - 110, y, f"({rng.randint(1, 99)})", size=11)
+            y -= 32
+        pages.append(page)
+    return pages
+
+
+def _write_scanned_pdf(path: Path, rng: random.Random, num_pages: int) -> None:
+    dpi = 150
+    width, height = int(8.5 * dpi), int(11 * dpi)
+    try:
+        font = ImageFont.load_default(size=22)
+    except TypeError:  # Pillow < 10.1
+        font = ImageFont.load_default()
+
+    frames = []
+    for _ in range(num_pages):
+        img = Image.new("L", (width, height), color=255)
+        draw = ImageDraw.Draw(img)
+        y = 120
+        while y < height - 150:
+            draw.text((120, y), _sentence(rng), fill=rng.randint(0, 60), font=font)
+            y += 36
+        noise = np.random.default_rng(rng.randint(0, 2**31)).normal(0, 12, (height, width))
+        arr = np.clip(np.asarray(img, dtype=np.float32) + noise, 0, 255)
+        img = Image.fromarray(arr.astype(np.uint8)).rotate(
+            rng.uniform(-1.0, 1.0), fillcolor=255
+        )
+        frames.append(img.convert("RGB"))
+
+    frames[0].save(
+        path, "PDF", resolution=float(dpi), save_all=True, append_images=frames[1:]
+    )
+
+
+def _write_docx(path: Path, rng: random.Random, num_pages: int) -> None:
+    from docx import Document
+
+    doc = Document()
+    for page_no in range(num_pages):
+        doc.add_heading(f"Section {page_no + 1}", level=1)
+        for _ in range(8):
+            doc.add_paragraph(" ".join(_sentence(rng) for _ in range(4)))
+        table = doc.add_table(rows=6, cols=4)
+        for row in table.rows:
+            for cell in row.cells:
+                cell.text = f"{rng.uniform(0, 1000):.1f}"
+        for _ in range(4):
+            doc.add_paragraph(_sentence(rng), style="List Bullet")
+    doc.save(str(path))
+
+
+def _write_xlsx(path: Path, rng: random.Random, num_pages: int) -> None:
+    from openpyxl import Workbook
+
+    wb = Workbook()
+    for sheet_no in range(num_pages):
+        ws = wb.active if sheet_no == 0 else wb.create_sheet()
+        ws.title = f"Sheet{sheet_no + 1}"
+        ws.append([w.capitalize() for w in rng.sample(_WORDS, 6)])
+        for _ in range(rng.randint(40, 120)):
+            ws.append([round(rng.uniform(0, 1000), 2) for _ in range(6)])
+    wb.save(str(path))
+
+
+def _write_html(path: Path, rng: random.Random, num_pages: int) -> None:
+    parts = ["<!DOCTYPE html>", "<html><head><title>Synthetic</title></head><body>"]
+    for page_no in range(num_pages):
+        parts.append(f"<h1>Section {page_no + 1}</h1>")
+        for _ in range(6):
+            parts.append(f"<p>{' '.join(_sentence(rng) for _ in range(3))}</p>")
+        parts.append("<table>")
+        for r in range(8):
+            tag = "th" if r == 0 else "td"
+            cells = "".join(
+                f"<{tag}>{rng.uniform(0, 100):.2f}</{tag}>" for _ in range(4)
+            )
+            parts.append(f"<tr>{cells}</tr>")
+        parts.append("</table>")
+        parts.append(
+            "<ul>" + "".join(f"<li>{_sentence(rng)}</li>" for _ in range(4)) + "</ul>"
+        )
+    parts.append("</body></html>")
+    path.write_text("\n".join(parts), encoding="utf-8")
+
+
+_CORPUS_EXTENSIONS = {
+    CorpusKind.BORN_DIGITAL: "pdf",
+    CorpusKind.SCANNED: "pdf",
+    CorpusKind.TABLES: "pdf",
+    CorpusKind.FORMULAS: "pdf",
+    CorpusKind.DOCX: "docx",
+    CorpusKind.XLSX: "xlsx",
+    CorpusKind.HTML: "html",
+}
+
+
+def generate_corpus(
+    output_dir: Path,
+    kinds: Optional[List[CorpusKind]] = None,
+    docs_per_kind: int = 2,
+    pages_per_doc: int = 3,
+    seed: int = 42,
+) -> List[Path]:
+    """Generate a deterministic synthetic corpus and return the written files."""
+    kinds = kinds or list(CorpusKind)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    paths: List[Path] = []
+    for kind in kinds:
+        for doc_no in range(docs_per_kind):
+            # Seed per document, so that subsets of the corpus stay reproducible.
+            rng = random.Random(f"{seed}-{kind.value}-{doc_no}")
+            path = output_dir / f"{kind.value}_{doc_no:03d}.{_CORPUS_EXTENSIONS[kind]}"
+            if kind == CorpusKind.BORN_DIGITAL:
+                _write_pdf(path, _text_pages(rng, pages_per_doc))
+            elif kind == CorpusKind.TABLES:
+                _write_pdf(path, _table_pages(rng, pages_per_doc))
+            elif kind == CorpusKind.FORMULAS:
+                _write_pdf(path, _formula_pages(rng, pages_per_doc))
+            elif kind == CorpusKind.SCANNED:
+                _write_scanned_pdf(path, rng, pages_per_doc)
+            elif kind == CorpusKind.DOCX:
+                _write_docx(path, rng, pages_per_doc)
+            elif kind == CorpusKind.XLSX:
+                _write_xlsx(path, rng, pages_per_doc)
+            elif kind == CorpusKind.HTML:
+                _write_html(path, rng, pages_per_doc)
+            paths.append(path)
+
+    _log.info(f"Generated {len(paths)} synthetic documents in {output_dir}")
+    return paths
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Benchmark configuration & results
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+class BenchmarkConfig(BaseModel):
+    """A named pipeline configuration to benchmark."""
+
+    name: str
+    pipeline: Literal["standard", "threaded"] = "standard"
+    do_ocr: bool = True
+    ocr_engine: str = EasyOcrOptions.kind
+    force_full_page_ocr: bool = False
+    use_ocr_stub: bool = False  # Route network OCR engines to a local stub server
+    ocr_stub_latency: float = 0.0
+    do_table_structure: bool = True
+    images_scale: float = 1.0
+    document_timeout: Optional[float] = None
+
+    # Threaded pipeline settings
+    ocr_batch_size: int = 4
+    layout_batch_size: int = 4
+    table_batch_size: int = 4
+    ocr_replicas: int = 1
+    layout_replicas: int = 1
+    table_replicas: int = 1
+    batch_timeout_seconds: float = 2.0
+    queue_max_size: int = 100
+
+    # Document-level concurrency, see BatchConcurrencySettings
+    doc_batch_size: int = 1
+    doc_batch_concurrency: int = 1
+    page_batch_size: int = 4
+
+
+DEFAULT_CONFIGS: Dict[str, BenchmarkConfig] = {
+    "standard": BenchmarkConfig(name="standard"),
+    "standard_no_ocr": BenchmarkConfig(name="standard_no_ocr", do_ocr=False),
+    "threaded": BenchmarkConfig(name="threaded", pipeline="threaded"),
+    "myocr_stub": BenchmarkConfig(
+        name="myocr_stub",
+        ocr_engine=MyOcrOptions.kind,
+        force_full_page_ocr=True,
+        use_ocr_stub=True,
+        ocr_stub_latency=0.2,
+    ),
+}
+
+
+class StageStats(BaseModel):
+    count: int
+    total: float
+    p50: float
+    p95: float
+
+
+class BenchmarkResult(BaseModel):
+    name: str
+    num_docs: int = 0
+    num_failed: int = 0
+    num_pages: int = 0
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    pages_per_second: float = 0.0
+    docs_per_second: float = 0.0
+    cpu_utilization: float = 0.0  # average number of busy cores
+    peak_rss_mb: float = 0.0
+    stages: Dict[str, StageStats] = {}
+
+
+class RegressionThresholds(BaseModel):
+    """Maximum relative degradation tolerated against the baseline."""
+
+    throughput: float = 0.10
+    stage_p95: float = 0.25
+    peak_rss: float = 0.15
+    min_stage_seconds: float = 0.005  # ignore stages too fast to measure reliably
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _build_converter(config: BenchmarkConfig, ocr_url: Optional[str]) -> DocumentConverter:
+    ocr_factory = get_ocr_factory(allow_external_plugins=False)
+    ocr_options: OcrOptions = ocr_factory.create_options(  # type: ignore
+        kind=config.ocr_engine,
+        force_full_page_ocr=config.force_full_page_ocr,
+    )
+    if ocr_url is not None and hasattr(ocr_options, "url"):
+        ocr_options.url = ocr_url  # type: ignore[attr-defined]
+
+    pipeline_options: PdfPipelineOptions
+    if config.pipeline == "threaded":
+        from docling.pipeline.threaded_standard_pdf_pipeline import (
+            ThreadedStandardPdfPipeline,
+        )
+
+        pipeline_cls = ThreadedStandardPdfPipeline
+        pipeline_options = ThreadedPdfPipelineOptions(
+            ocr_batch_size=config.ocr_batch_size,
+            layout_batch_size=config.layout_batch_size,
+            table_batch_size=config.table_batch_size,
+            ocr_replicas=config.ocr_replicas,
+            layout_replicas=config.layout_replicas,
+            table_replicas=config.table_replicas,
+            batch_timeout_seconds=config.batch_timeout_seconds,
+            queue_max_size=config.queue_max_size,
+        )
+    else:
+        from docling.pipeline.standard_pdf_pipeline import StandardPdfPipeline
+
+        pipeline_cls = StandardPdfPipeline
+        pipeline_options = PdfPipelineOptions()
+
+    pipeline_options.do_ocr = config.do_ocr
+    pipeline_options.ocr_options = ocr_options
+    pipeline_options.do_table_structure = config.do_table_structure
+    pipeline_options.images_scale = config.images_scale
+    pipeline_options.document_timeout = config.document_timeout
+
+    pdf_format_option = PdfFormatOption(
+        pipeline_cls=pipeline_cls, pipeline_options=pipeline_options
+    )
+    return DocumentConverter(
+        format_options={
+            InputFormat.PDF: pdf_format_option,
+            InputFormat.IMAGE: pdf_format_option,
+        }
+    )
+
+
+def run_benchmark(config: BenchmarkConfig, sources: List[Path]) -> BenchmarkResult:
+    """Convert *sources* with *config* and collect performance metrics.
+
+    Peak RSS is measured for the whole process; run each configuration in a fresh
+    process (as ``docling-bench`` does) to get comparable memory figures.
+    """
+    settings.debug.profile_pipeline_timings = True
+    settings.perf.doc_batch_size = config.doc_batch_size
+    settings.perf.doc_batch_concurrency = config.doc_batch_concurrency
+    settings.perf.page_batch_size = config.page_batch_size
+
+    stub = None
+    ocr_url = None
+    if config.use_ocr_stub and config.do_ocr:
+        from docling.utils.openai_stub_server import (
+            LatencyModel,
+            OpenAiStubOptions,
+            OpenAiStubServer,
+        )
+
+        stub = OpenAiStubServer(
+            OpenAiStubOptions(latency=LatencyModel(mean=config.ocr_stub_latency))
+        ).start()
+        ocr_url = stub.url
+
+    try:
+        converter = _build_converter(config, ocr_url)
+        # Keep model loading out of the measured section.
+        for fmt in (InputFormat.PDF, InputFormat.IMAGE):
+            converter.initialize_pipeline(fmt)
+
+        result = BenchmarkResult(name=config.name)
+        stage_times: Dict[str, List[float]] = defaultdict(list)
+
+        start_wall = time.monotonic()
+        start_cpu = time.process_time()
+        for conv_res in converter.convert_all(sources, raises_on_error=False):
+            result.num_docs += 1
+            result.num_pages += len(conv_res.pages)
+            if conv_res.status not in {
+                ConversionStatus.SUCCESS,
+                ConversionStatus.PARTIAL_SUCCESS,
+            }:
+                result.num_failed += 1
+            for key, item in conv_res.timings.items():
+                stage_times[key].extend(item.times)
+        result.wall_time = time.monotonic() - start_wall
+        result.cpu_time = time.process_time() - start_cpu
+    finally:
+        if stub is not None:
+            stub.stop()
+
+    if result.wall_time > 0:
+        result.pages_per_second = result.num_pages / result.wall_time
+        result.docs_per_second = result.num_docs / result.wall_time
+        result.cpu_utilization = result.cpu_time / result.wall_time
+    result.peak_rss_mb = _peak_rss_mb()
+    result.stages = {
+        key: StageStats(
+            count=len(times),
+            total=float(np.sum(times)),
+            p50=float(np.percentile(times, 50)),
+            p95=float(np.percentile(times, 95)),
+        )
+        for key, times in sorted(stage_times.items())
+        if times
+    }
+    return result
+
+
+def compare_to_baseline(
+    result: BenchmarkResult,
+    baseline: BenchmarkResult,
+    thresholds: RegressionThresholds,
+) -> List[str]:
+    """Return human-readable descriptions of all regressions beyond the thresholds."""
+    regressions: List[str] = []
+
+    def _rel(current: float, reference: float) -> float:
+        return (current - reference) / reference if reference > 0 else 0.0
+
+    if _rel(result.pages_per_second, baseline.pages_per_second) < -thresholds.throughput:
+        regressions.append(
+            f"[{result.name}] throughput {result.pages_per_second:.2f} pages/s "
+            f"vs baseline {baseline.pages_per_second:.2f} pages/s"
+        )
+    if _rel(result.docs_per_second, baseline.docs_per_second) < -thresholds.throughput:
+        regressions.append(
+            f"[{result.name}] throughput {result.docs_per_second:.2f} docs/s "
+            f"vs baseline {baseline.docs_per_second:.2f} docs/s"
+        )
+    if _rel(result.peak_rss_mb, baseline.peak_rss_mb) > thresholds.peak_rss:
+        regressions.append(
+            f"[{result.name}] peak RSS {result.peak_rss_mb:.0f} MB "
+            f"vs baseline {baseline.peak_rss_mb:.0f} MB"
+        )
+    for key, stats in result.stages.items():
+        ref = baseline.stages.get(key)
+        if ref is None or max(ref.p95, stats.p95) < thresholds.min_stage_seconds:
+            continue
+        if _rel(stats.p95, ref.p95) > thresholds.stage_p95:
+            regressions.append(
+                f"[{result.name}] stage '{key}' p95 {stats.p95 * 1000:.1f} ms "
+                f"vs baseline {ref.p95 * 1000:.1f} ms"
+            )
+    return regressions
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Serialization round trips
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+class CodecBenchmarkResult(BaseModel):
+    codec: str
+    size_mb: float
+    encode_seconds: float  # best of the repetitions
+    decode_seconds: float
+
+
+def synthetic_document(
+    num_pages: int = 20,
+    pictures_per_page: int = 3,
+    texts_per_page: int = 200,
+    seed: int = 42,
+) -> DoclingDocument:
+    """Converted-like document with page images, picture crops and text items."""
+    rng = random.Random(seed)
+    np_rng = np.random.default_rng(seed)
+    doc = DoclingDocument(name="synthetic")
+    for page_no in range(1, num_pages + 1):
+        pixels = np_rng.integers(200, 240, size=(792, 612, 3), dtype=np.uint8)
+        page_image = Image.fromarray(pixels)
+        doc.add_page(
+            page_no=page_no,
+            size=Size(width=612, height=792),
+            image=ImageRef.from_pil(page_image, dpi=72),
+        )
+        for i in range(pictures_per_page):
+            top = 50 + i * 240
+            doc.add_picture(
+                image=ImageRef.from_pil(
+                    page_image.crop((50, top, 350, top + 200)), dpi=72
+                ),
+                prov=ProvenanceItem(
+                    page_no=page_no,
+                    bbox=BoundingBox(l=50, t=792 - top, r=350, b=592 - top),
+                    charspan=(0, 0),
+                ),
+            )
+        for i in range(texts_per_page):
+            text = _sentence(rng)
+            y = 760 - (i % 60) * 12
+            doc.add_text(
+                label=DocItemLabel.TEXT,
+                text=text,
+                prov=ProvenanceItem(
+                    page_no=page_no,
+                    bbox=BoundingBox(l=40, t=y, r=570, b=y - 10),
+                    charspan=(0, len(text)),
+                ),
+            )
+    return doc
+
+
+def _best_time(fn: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_codec_benchmark(
+    doc: DoclingDocument, repeat: int = 3
+) -> List[CodecBenchmarkResult]:
+    """Round-trip ``doc`` through its JSON and its binary encoding."""
+
+    def _json_encode() -> bytes:
+        buf = BytesIO()
+        write_document_json(doc, buf)
+        return buf.getvalue()
+
+    json_data = _json_encode()
+    binary_data = binary_codec.encode(doc)
+    return [
+        CodecBenchmarkResult(
+            codec="json",
+            size_mb=len(json_data) / (1024 * 1024),
+            encode_seconds=_best_time(_json_encode, repeat),
+            decode_seconds=_best_time(
+                lambda: DoclingDocument.model_validate_json(json_data), repeat
+            ),
+        ),
+        CodecBenchmarkResult(
+            codec="binary",
+            size_mb=len(binary_data) / (1024 * 1024),
+            encode_seconds=_best_time(lambda: binary_codec.encode(doc), repeat),
+            decode_seconds=_best_time(
+                lambda: binary_codec.decode(binary_data, DoclingDocument), repeat
+            ),
+        ),
+    ]
@@ -0,0 +1,219 @@
+"""Binary frames of pages, page predictions and documents, for IPC and caches.
+
+A frame is::
+
+    MAGIC | header length (u32) | header (JSON) | body | blob 0 | blob 1 | ...
+
+The body is the model encoded by pydantic's compiled JSON serializer (item by
+item for documents, as ``iter_document_json`` does), which for pydantic models
+is faster than going through Python dicts to msgpack or pickle. Images are
+moved out of the body into blobs:
+
+- the image URIs of a ``DoclingDocument`` (pages, pictures, tables, ...) are
+  stored as their base64 payload, and come back as plain ``AnyUrl`` values.
+  Parsing them back costs about as much as reading them from JSON, so
+  documents decode about as fast as from JSON;
+- the rendered images of a ``Page``, which its JSON leaves out, are stored as
+  raw pixels, and restored into its image cache without re-rendering or PNG
+  decoding.
+
+``encode`` and ``decode`` handle the types of ``MODEL_TYPES``, ``decode``
+checks the type of the frame against ``expected_type`` when given.
+"""
+
+import json
+import logging
+import struct
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar, Union
+
+import pydantic_core
+from docling_core.types.doc import DoclingDocument, ImageRef
+from PIL import Image
+from pydantic import AnyUrl, BaseModel
+
+from docling.datamodel.base_models import AssembledUnit, Page, PagePredictions
+from docling.utils.page_cache import PageCacheEntry
+from docling.utils.serialization import iter_document_json
+
+_log = logging.getLogger(__name__)
+
+MAGIC = b"DLBIN\x01"
+
+_HEADER_LENGTH = struct.Struct("<I")
+
+MODEL_TYPES: Dict[str, Type[BaseModel]] = {
+    cls.__name__: cls
+    for cls in (DoclingDocument, Page, PagePredictions, AssembledUnit, PageCacheEntry)
+}
+
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
+_Blob = Tuple[Dict[str, Any], Union[bytes, memoryview]]
+
+
+def is_encoded(data: Union[bytes, memoryview]) -> bool:
+    return bytes(data[: len(MAGIC)]) == MAGIC
+
+
+def _split_image(image: Optional[ImageRef]) -> Optional[Tuple[ImageRef, _Blob]]:
+    """The image with an empty data URI and its payload, if it has one."""
+    if (
+        image is None
+        or not isinstance(image.uri, AnyUrl)
+        or image.uri.scheme != "data"
+    ):
+        return None
+    prefix, sep, payload = str(image.uri).partition(",")
+    if not sep:
+        return None
+    return (
+        image.model_copy(update={"uri": AnyUrl("data:,")}),
+        ({"prefix": prefix + ","}, payload.encode("ascii")),
+    )
+
+
+def _encode_document(doc: DoclingDocument) -> Tuple[bytes, List[_Blob]]:
+    blobs: List[_Blob] = []
+    update: Dict[str, Any] = {}
+
+    for name, field in type(doc).model_fields.items():
+        if field.deprecated:  # e.g. furniture, without images
+            continue
+        value = getattr(doc, name)
+        if isinstance(value, dict) and not isinstance(value, BaseModel):
+            items = list(value.items())
+        elif isinstance(value, list):
+            items = list(enumerate(value))
+        else:
+            continue
+
+        replaced: Dict[Any, Any] = {}
+        for key, item in items:
+            split = _split_image(getattr(item, "image", None))
+            if split is None:
+                continue
+            image, (meta, payload) = split
+            replaced[key] = item.model_copy(update={"image": image})
+            blobs.append(({**meta, "field": name, "key": key}, payload))
+        if replaced:
+            if isinstance(value, dict):
+                update[name] = {**value, **replaced}
+            else:
+                update[name] = [replaced.get(i, item) for i, item in enumerate(value)]
+
+    if update:
+        doc = doc.model_copy(update=update)
+    return b"".join(iter_document_json(doc)), blobs
+
+
+def _decode_document(body: bytes, blobs: List[_Blob]) -> DoclingDocument:
+    doc = DoclingDocument.model_validate_json(body)
+    for meta, payload in blobs:
+        container = getattr(doc, meta["field"])
+        key = meta["key"]
+        item = container[int(key) if isinstance(container, dict) else key]
+        item.image.uri = AnyUrl(meta["prefix"] + str(payload, "ascii"))
+    return doc
+
+
+def _encode_page(page: Page) -> Tuple[bytes, List[_Blob]]:
+    blobs: List[_Blob] = [
+        (
+            {
+                "scale": scale,
+                "mode": image.mode,
+                "size": list(image.size),
+                "default": scale == page._default_image_scale,
+            },
+            image.tobytes(),
+        )
+        for scale, image in page._image_cache.items()
+    ]
+    return pydantic_core.to_json(page), blobs
+
+
+def _decode_page(body: bytes, blobs: List[_Blob]) -> Page:
+    page = Page.model_validate_json(body)
+    for meta, pixels in blobs:
+        if meta["default"]:
+            page._default_image_scale = meta["scale"]
+        page._image_cache[meta["scale"]] = Image.frombytes(
+            meta["mode"], tuple(meta["size"]), bytes(pixels)
+        )
+    return page
+
+
+def encode(obj: BaseModel) -> bytes:
+    """Frame of a model of one of the ``MODEL_TYPES``."""
+    type_name = type(obj).__name__
+    if MODEL_TYPES.get(type_name) is not type(obj):
+        raise TypeError(
+            f"Can not encode {type_name}, expected one of: {', '.join(MODEL_TYPES)}"
+        )
+
+    blobs: List[_Blob] = []
+    if isinstance(obj, DoclingDocument):
+        body, blobs = _encode_document(obj)
+    elif isinstance(obj, Page):
+        body, blobs = _encode_page(obj)
+    else:
+        body = pydantic_core.to_json(obj)
+
+    header = pydantic_core.to_json(
+        {
+            "type": type_name,
+            "body": len(body),
+            "blobs": [{**meta, "length": len(payload)} for meta, payload in blobs],
+        }
+    )
+    parts: List[Union[bytes, memoryview]] = [
+        MAGIC,
+        _HEADER_LENGTH.pack(len(header)),
+        header,
+        body,
+    ]
+    parts.extend(payload for _, payload in blobs)
+    return b"".join(parts)
+
+
+def decode(
+    data: Union[bytes, memoryview], expected_type: Optional[Type[_ModelT]] = None
+) -> _ModelT:
+    """Model of a frame. Raises ``ValueError`` if it is not a (valid) frame."""
+    view = memoryview(data)
+    if not is_encoded(view):
+        raise ValueError("Not a docling binary frame")
+    offset = len(MAGIC)
+    (header_length,) = _HEADER_LENGTH.unpack_from(view, offset)
+    offset += _HEADER_LENGTH.size
+    header = json.loads(bytes(view[offset : offset + header_length]))
+    offset += header_length
+
+    model_type = MODEL_TYPES.get(header["type"])
+    if model_type is None:
+        raise ValueError(f"Unknown type {header['type']!r} in docling binary frame")
+    if expected_type is not None and model_type is not expected_type:
+        raise ValueError(
+            f"Expected a {expected_type.__name__} frame, got a {header['type']} frame"
+        )
+
+    body = bytes(view[offset : offset + header["body"]])
+    offset += header["body"]
+    blobs: List[_Blob] = []
+    for meta in header["blobs"]:
+        length = meta.pop("length")
+        blobs.append((meta, view[offset : offset + length]))
+        offset += length
+    if offset != len(view):
+        raise ValueError(
+            f"Truncated or corrupted docling binary frame ({len(view)} bytes, expected {offset})"
+        )
+
+    obj: BaseModel
+    if model_type is DoclingDocument:
+        obj = _decode_document(body, blobs)
+    elif model_type is Page:
+        obj = _decode_page(body, blobs)
+    else:
+        obj = model_type.model_validate_json(body)
+    return obj  # type: ignore[return-value]
@@ -0,0 +1,177 @@
+"""Deadlines and cancellation of conversions.
+
+A ``CancellationToken`` is carried by each ``ConversionResult``. The pipelines
+check it between pages, the models between regions and remote requests, and
+remote calls bound their timeouts by its deadline. A token can follow a parent
+token, e.g. the one of a service request, which is cancelled when the client
+goes away.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Hashable, Iterator, List, Optional
+
+from docling.exceptions import ConversionCancelled
+
+
+class CancellationToken:
+    def __init__(
+        self,
+        timeout: Optional[float] = None,
+        parent: Optional["CancellationToken"] = None,
+    ):
+        self.deadline = None if timeout is None else time.monotonic() + timeout
+        self.parent = parent
+        self._lock = threading.Lock()
+        self._reason: Optional[str] = None
+        self._callbacks: List[Callable[[], None]] = []
+        self._timer: Optional[threading.Timer] = None
+        self._follows_parent = False
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        """Cancel the token, and run the callbacks registered with ``on_cancel``."""
+        with self._lock:
+            if self._reason is not None:
+                return
+            self._reason = reason
+            callbacks, self._callbacks = self._callbacks, []
+            timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+        for callback in callbacks:
+            callback()
+
+    def on_cancel(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """Call ``callback`` when the token is cancelled, now if it already is.
+
+        ``cancel()``, reaching the deadline and the cancellation of the parent
+        call it: the first callback arms a timer for the deadline and follows
+        the parent. Returns a function which removes the callback again.
+        """
+        with self._lock:
+            cancelled = self._reason is not None
+            if not cancelled:
+                self._callbacks.append(callback)
+                if self.deadline is not None and self._timer is None:
+                    self._timer = threading.Timer(
+                        max(0.0, self.deadline - time.monotonic()),
+                        self.cancel,
+                        args=("deadline exceeded",),
+                    )
+                    self._timer.daemon = True
+                    self._timer.start()
+            follow_parent = (
+                not cancelled and self.parent is not None and not self._follows_parent
+            )
+            self._follows_parent = self._follows_parent or follow_parent
+        if follow_parent:
+            assert self.parent is not None
+            self.parent.on_cancel(self._cancel_with_parent)
+        if cancelled:
+            callback()
+        return lambda: self._remove_callback(callback)
+
+    def _cancel_with_parent(self) -> None:
+        assert self.parent is not None
+        self.cancel(self.parent.reason or "cancelled")
+
+    def _remove_callback(self, callback: Callable[[], None]) -> None:
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+            timer = None
+            if not self._callbacks:
+                timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+
+    @property
+    def reason(self) -> Optional[str]:
+        """Why the token is cancelled, None while it is not."""
+        if self._reason is not None:
+            return self._reason
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            return "deadline exceeded"
+        if self.parent is not None:
+            return self.parent.reason
+        return None
+
+    @property
+    def cancelled(self) -> bool:
+        return self.reason is not None
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left before the nearest deadline of the chain, None if none."""
+        remaining = None
+        if self.deadline is not None:
+            remaining = max(0.0, self.deadline - time.monotonic())
+        if self.parent is not None:
+            parent_remaining = self.parent.remaining()
+            if parent_remaining is not None:
+                remaining = (
+                    parent_remaining
+                    if remaining is None
+                    else min(remaining, parent_remaining)
+                )
+        return remaining
+
+    def timeout(self, default: Optional[float] = None) -> Optional[float]:
+        """Timeout of a blocking call: ``default``, shortened to the deadline.
+
+        Raises ``ConversionCancelled`` if the token is cancelled already, so no
+        call is started without time left for it.
+        """
+        self.raise_if_cancelled()
+        remaining = self.remaining()
+        if remaining is None:
+            return default
+        return remaining if default is None else min(default, remaining)
+
+    def raise_if_cancelled(self) -> None:
+        reason = self.reason
+        if reason is not None:
+            raise ConversionCancelled(reason)
+
+
+class CancellationGroup:
+    """Tokens of jobs shared by several callers, e.g. coalesced service requests.
+
+    The token of a job is cancelled once every caller waiting for it has
+    cancelled its own token.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._jobs: Dict[Hashable, List] = {}  # key -> [token, waiting callers]
+
+    @contextmanager
+    def join(
+        self, key: Hashable, caller: CancellationToken
+    ) -> Iterator[CancellationToken]:
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is None:
+                job = self._jobs[key] = [CancellationToken(), 0]
+            job[1] += 1
+        waiting = True
+
+        def _leave(cancel: bool) -> None:
+            nonlocal waiting
+            with self._lock:
+                if not waiting:
+                    return
+                waiting = False
+                job[1] -= 1
+                if job[1] > 0:
+                    return
+                if self._jobs.get(key) is job:
+                    del self._jobs[key]
+            if cancel:
+                job[0].cancel(f"all callers cancelled: {caller.reason}")
+
+        caller.on_cancel(lambda: _leave(cancel=True))
+        try:
+            yield job[0]
+        finally:
+            _leave(cancel=False)
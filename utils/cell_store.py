@@ -0,0 +1,187 @@
+"""Columnar view of the text cells of a page, for bulk geometric queries.
+
+Layout post-processing, OCR cell filtering, table token extraction and
+``get_text_in_rect`` compare every cell with one or more boxes. Doing that
+through ``TextCell.to_bounding_box()`` builds and validates pydantic objects for
+each pair; the ``CellStore`` extracts the coordinates once into NumPy arrays and
+answers the same questions with vectorized operations. The cells themselves are
+kept as they are, so the stages still exchange ``TextCell`` objects.
+"""
+
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from docling_core.types.doc import BoundingBox, CoordOrigin
+from docling_core.types.doc.page import TextCell
+
+
+def bbox_bounds(bboxes: Sequence[BoundingBox]) -> np.ndarray:
+    """``(m, 4)`` array of ``(x0, y0, x1, y1)`` spans of boxes sharing one origin.
+
+    The vertical span follows the box origin (``t..b`` for top-left, ``b..t`` for
+    bottom-left), so inverted boxes intersect nothing, as with ``BoundingBox``.
+    """
+    bounds = np.empty((len(bboxes), 4), dtype=np.float64)
+    for i, bbox in enumerate(bboxes):
+        if bbox.coord_origin == CoordOrigin.TOPLEFT:
+            bounds[i] = (bbox.l, bbox.t, bbox.r, bbox.b)
+        else:
+            bounds[i] = (bbox.l, bbox.b, bbox.r, bbox.t)
+    return bounds
+
+
+class CellStore:
+    def __init__(self, cells: Sequence[TextCell]):
+        self.source = cells
+        self.cells: List[TextCell] = list(cells)
+        self.coord_origin = (
+            self.cells[0].rect.coord_origin if self.cells else CoordOrigin.TOPLEFT
+        )
+
+        n = len(self.cells)
+        # Spans (min x, min y, max x, max y) of the cell rectangles, exactly what
+        # BoundingRectangle.to_bounding_box() computes, in the cells' own origin.
+        self._spans = np.empty((n, 4), dtype=np.float64)
+        self.indices = np.empty(n, dtype=np.int64)
+        self.has_text = np.empty(n, dtype=bool)
+        self._same_origin = True
+        for i, cell in enumerate(self.cells):
+            rect = cell.rect
+            if rect.coord_origin != self.coord_origin:
+                self._same_origin = False
+            xs = (rect.r_x0, rect.r_x1, rect.r_x2, rect.r_x3)
+            ys = (rect.r_y0, rect.r_y1, rect.r_y2, rect.r_y3)
+            self._spans[i] = (min(xs), min(ys), max(xs), max(ys))
+            self.indices[i] = cell.index
+            self.has_text[i] = bool(cell.text.strip())
+
+        self.areas = (self._spans[:, 2] - self._spans[:, 0]) * (
+            self._spans[:, 3] - self._spans[:, 1]
+        )
+        self._rows: Optional[Dict[int, int]] = None
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def _check_same_origin(self) -> None:
+        if not self._same_origin:
+            raise ValueError("Text cells have different CoordOrigin")
+
+    def is_view_of(self, cells: Sequence[TextCell]) -> bool:
+        """True if the store still reflects ``cells`` (same list, same length)."""
+        return self.source is cells and len(self.cells) == len(cells)
+
+    def spans(
+        self,
+        coord_origin: Optional[CoordOrigin] = None,
+        page_height: Optional[float] = None,
+    ) -> np.ndarray:
+        """Cell spans, flipped vertically if another origin is requested."""
+        self._check_same_origin()
+        if coord_origin is None or coord_origin == self.coord_origin:
+            return self._spans
+        if page_height is None:
+            raise ValueError("page_height is required to change the CoordOrigin")
+        spans = self._spans.copy()
+        spans[:, 1] = page_height - self._spans[:, 3]
+        spans[:, 3] = page_height - self._spans[:, 1]
+        return spans
+
+    def ltrb(self) -> np.ndarray:
+        """``(n, 4)`` array of the ``l, t, r, b`` values of the cell bounding boxes."""
+        self._check_same_origin()
+        if self.coord_origin == CoordOrigin.TOPLEFT:
+            return self._spans
+        return self._spans[:, [0, 3, 2, 1]]
+
+    def intersection_areas(
+        self,
+        bboxes: Sequence[BoundingBox],
+        page_height: Optional[float] = None,
+    ) -> np.ndarray:
+        """``(n, m)`` intersection areas of every cell with every box."""
+        if len(bboxes) == 0 or len(self.cells) == 0:
+            return np.zeros((len(self.cells), len(bboxes)), dtype=np.float64)
+        cells = self.spans(bboxes[0].coord_origin, page_height)
+        boxes = bbox_bounds(bboxes)
+
+        width = np.minimum(cells[:, None, 2], boxes[None, :, 2]) - np.maximum(
+            cells[:, None, 0], boxes[None, :, 0]
+        )
+        height = np.minimum(cells[:, None, 3], boxes[None, :, 3]) - np.maximum(
+            cells[:, None, 1], boxes[None, :, 1]
+        )
+        return np.where((width > 0) & (height > 0), width * height, 0.0)
+
+    def intersection_over_self(
+        self,
+        bboxes: Sequence[BoundingBox],
+        page_height: Optional[float] = None,
+    ) -> np.ndarray:
+        """``(n, m)`` share of each cell covered by each box, 0 for empty cells."""
+        inter = self.intersection_areas(bboxes, page_height)
+        areas = self.areas[:, None]
+        return np.divide(
+            inter, areas, out=np.zeros_like(inter), where=areas > 0
+        )
+
+    def touched_by(self, other: "CellStore", chunk_size: int = 1024) -> np.ndarray:
+        """Mask of the cells of ``other`` which intersect or touch any cell of this store.
+
+        Coordinates are compared as they are, like an R-tree query would.
+        """
+        touched = np.zeros(len(other), dtype=bool)
+        if len(self.cells) == 0:
+            return touched
+        cells = self._spans
+        for start in range(0, len(other), chunk_size):
+            spans = other._spans[start : start + chunk_size]
+            touched[start : start + chunk_size] = (
+                (cells[:, None, 0] <= spans[None, :, 2])
+                & (cells[:, None, 2] >= spans[None, :, 0])
+                & (cells[:, None, 1] <= spans[None, :, 3])
+                & (cells[:, None, 3] >= spans[None, :, 1])
+            ).any(axis=0)
+        return touched
+
+    def cells_in_bbox(
+        self,
+        bbox: BoundingBox,
+        min_overlap: float,
+        page_height: Optional[float] = None,
+    ) -> List[TextCell]:
+        """Cells covered by ``bbox`` by more than ``min_overlap``, in page order."""
+        ios = self.intersection_over_self([bbox], page_height)[:, 0]
+        return [self.cells[i] for i in np.flatnonzero(ios > min_overlap)]
+
+    def text_in_bbox(
+        self,
+        bbox: BoundingBox,
+        min_overlap: float = 0.5,
+        page_height: Optional[float] = None,
+    ) -> str:
+        text_piece = ""
+        for cell in self.cells_in_bbox(bbox, min_overlap, page_height):
+            if len(text_piece) > 0:
+                text_piece += " "
+            text_piece += cell.text
+        return text_piece
+
+    def rows(self, cells: Sequence[TextCell]) -> Optional[np.ndarray]:
+        """Rows of ``cells`` in this store, or None if any of them is not stored."""
+        if self._rows is None:
+            self._rows = {id(cell): i for i, cell in enumerate(self.cells)}
+        rows = [self._rows.get(id(cell)) for cell in cells]
+        if any(row is None for row in rows):
+            return None
+        return np.fromiter(rows, dtype=np.int64, count=len(rows))
+
+    def enclosing_bbox(self, rows: np.ndarray) -> BoundingBox:
+        """Box from the smallest ``l, t`` to the largest ``r, b`` of the given cells."""
+        ltrb = self.ltrb()[rows]
+        return BoundingBox(
+            l=float(ltrb[:, 0].min()),
+            t=float(ltrb[:, 1].min()),
+            r=float(ltrb[:, 2].max()),
+            b=float(ltrb[:, 3].max()),
+        )
@@ -0,0 +1,51 @@
+"""Checkpoints of the page stage of a conversion, to resume it after a crash.
+
+The outputs of every page (parsed cells, OCR cells, layout clusters, table
+structures, assembled elements) are written as soon as the page is done, in
+one directory per document and pipeline configuration. Converting the same
+document with the same options again restores the checkpointed pages and only
+runs the models on the others, before the reading order and the enrichment.
+
+Pages are stored as page cache entries. The directory is removed once the
+document is converted, and kept when the conversion fails, is cancelled or
+runs out of time.
+"""
+
+import hashlib
+import logging
+import shutil
+from pathlib import Path
+from typing import Optional, Set
+
+from docling.datamodel.base_models import Page, PageConfidenceScores
+from docling.utils.page_cache import PageCacheEntry, read_entry, write_entry
+
+_log = logging.getLogger(__name__)
+
+
+class DocumentCheckpoint:
+    def __init__(self, checkpoint_dir: Path, document_hash: str, options_hash: str):
+        key = hashlib.sha256(
+            f"{options_hash}:{document_hash}".encode(), usedforsecurity=False
+        ).hexdigest()
+        self.path = Path(checkpoint_dir).expanduser() / key
+
+    def _page_path(self, page_no: int) -> Path:
+        return self.path / f"page_{page_no:06d}.json.gz"
+
+    def completed_pages(self) -> Set[int]:
+        if not self.path.is_dir():
+            return set()
+        return {
+            int(path.name[len("page_") :].split(".", 1)[0])
+            for path in self.path.glob("page_*.json.gz")
+        }
+
+    def load(self, page_no: int) -> Optional[PageCacheEntry]:
+        return read_entry(self._page_path(page_no))
+
+    def save(self, page: Page, scores: PageConfidenceScores) -> None:
+        write_entry(self._page_path(page.page_no), PageCacheEntry.from_page(page, scores))
+
+    def clear(self) -> None:
+        shutil.rmtree(self.path, ignore_errors=True)
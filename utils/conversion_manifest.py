@@ -0,0 +1,119 @@
+"""Append-only record of converted inputs, used to resume bulk conversions.
+
+Each line of the manifest is a JSON ``ManifestEntry``. Entries are appended and
+flushed as soon as a document finishes, so an interrupted run loses at most the
+documents which were in flight. When the same source appears more than once,
+the last entry wins, except that a ``SKIPPED`` entry never replaces a
+``SUCCESS`` one.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+
+from pydantic import BaseModel, ValidationError
+
+from docling.datamodel.base_models import ConversionStatus
+
+_log = logging.getLogger(__name__)
+
+
+class ManifestEntry(BaseModel):
+    source: str
+    output_stem: str
+    file_hash: Optional[str] = None
+    size: int = 0
+    mtime: float = 0.0
+    fingerprint: str = ""  # conversion and export settings used
+    status: ConversionStatus
+    skipped: bool = False  # outputs of the same content were already there
+    num_pages: int = 0
+    elapsed: float = 0.0  # seconds
+
+
+def settings_fingerprint(*parts: str) -> str:
+    """Fingerprint of the settings which determine the produced outputs."""
+    hasher = hashlib.sha256(usedforsecurity=False)
+    for part in parts:
+        hasher.update(part.encode("utf-8"))
+        hasher.update(b"\0")
+    return hasher.hexdigest()
+
+
+class ConversionManifest:
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: Dict[str, ManifestEntry] = {}
+
+        if path.exists():
+            with path.open("r", encoding="utf-8") as f:
+                for lineno, line in enumerate(f, start=1):
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = ManifestEntry.model_validate_json(line)
+                    except ValidationError:
+                        # Typically a line truncated by an interrupted run.
+                        _log.warning(f"Ignoring invalid manifest line {path}:{lineno}")
+                        continue
+                    self._entries[entry.source] = entry
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._file = path.open("a", encoding="utf-8")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, source: Path) -> Optional[ManifestEntry]:
+        return self._entries.get(str(source))
+
+    def is_unchanged_success(
+        self, source: Path, size: int, mtime: float, fingerprint: str
+    ) -> bool:
+        """True if ``source`` was converted successfully and was not modified since."""
+        entry = self.get(source)
+        return (
+            entry is not None
+            and entry.status == ConversionStatus.SUCCESS
+            and entry.fingerprint == fingerprint
+            and entry.size == size
+            and entry.mtime == mtime
+        )
+
+    def completed(self, fingerprint: str) -> Set[Tuple[str, str]]:
+        """``(file_hash, output_stem)`` of all successful conversions with these settings."""
+        return {
+            (entry.file_hash, entry.output_stem)
+            for entry in self._entries.values()
+            if entry.status == ConversionStatus.SUCCESS
+            and entry.fingerprint == fingerprint
+            and entry.file_hash is not None
+        }
+
+    def append(self, entry: ManifestEntry) -> None:
+        with self._lock:
+            previous = self._entries.get(entry.source)
+            if (
+                entry.status == ConversionStatus.SKIPPED
+                and previous is not None
+                and previous.status == ConversionStatus.SUCCESS
+            ):
+                return
+            self._entries[entry.source] = entry
+            self._file.write(entry.model_dump_json() + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "ConversionManifest":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
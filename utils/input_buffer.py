@@ -0,0 +1,79 @@
+"""Single-read, zero-copy access to the bytes of an input document.
+
+File inputs are memory-mapped (copy-on-write, so nothing is ever written back),
+stream inputs are exposed through the ``BytesIO`` buffer itself. The content is
+hashed in one pass over the mapping, and the same memory is handed to pypdfium2
+as a ctypes array instead of letting it read the file or the stream again.
+"""
+
+import ctypes
+import hashlib
+import logging
+import mmap
+from io import BytesIO
+from pathlib import Path
+from typing import Literal, Optional, Union
+
+_log = logging.getLogger(__name__)
+
+HashAlgorithm = Literal["sha256", "blake2b", "xxh3_128"]
+
+
+class InputBuffer:
+    def __init__(self, path_or_stream: Union[BytesIO, Path]):
+        self._mmap: Optional[mmap.mmap] = None
+        self._view: Optional[memoryview] = None
+
+        if isinstance(path_or_stream, Path):
+            with path_or_stream.open("rb") as f:
+                size = f.seek(0, 2)
+                if size > 0:
+                    self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+            self._view = memoryview(self._mmap) if self._mmap else memoryview(b"")
+        elif isinstance(path_or_stream, BytesIO):
+            self._view = path_or_stream.getbuffer()
+        else:
+            raise RuntimeError(
+                f"Unexpected type path_or_stream: {type(path_or_stream)}"
+            )
+
+    @property
+    def size(self) -> int:
+        assert self._view is not None
+        return self._view.nbytes
+
+    def hexdigest(self, algorithm: HashAlgorithm = "sha256") -> str:
+        assert self._view is not None
+        if algorithm == "xxh3_128":
+            try:
+                import xxhash
+            except ImportError:
+                raise ImportError(
+                    "xxhash is not installed. Please install it via `pip install xxhash` "
+                    "to use the xxh3_128 input hash."
+                )
+            return xxhash.xxh3_128_hexdigest(self._view)
+        elif algorithm == "blake2b":
+            return hashlib.blake2b(self._view, usedforsecurity=False).hexdigest()
+        return hashlib.sha256(self._view, usedforsecurity=False).hexdigest()
+
+    def ctypes_array(self) -> Optional[ctypes.Array]:
+        """The content as a ctypes array sharing this buffer, for pypdfium2."""
+        if self._view is None or self._view.nbytes == 0 or self._view.readonly:
+            return None
+        return (ctypes.c_char * self._view.nbytes).from_buffer(self._view)
+
+    def close(self) -> None:
+        """Release the buffer. Views still held elsewhere keep the memory alive."""
+        if self._view is not None:
+            try:
+                self._view.release()
+            except BufferError:
+                pass  # exported to a ctypes array which is still referenced
+            self._view = None
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                pass  # unmapped once the last export is garbage collected
+            self._mmap = None
@@ -0,0 +1,189 @@
+"""Size-aware, weighted fair scheduling of conversions sharing a few workers.
+
+Running conversions in arrival order lets a 1000-page upload hold a worker
+while hundreds of one-page requests wait behind it. ``JobScheduler`` hands its
+slots to the waiting job with the smallest tag::
+
+    tag = virtual time at arrival + (cost of the tenant's jobs + job cost) / weight
+
+so that short jobs go first, a tenant with a large backlog does not starve the
+others, and ``priority`` raises the weight of a job (``2 ** priority``). The
+virtual time follows the tags of the jobs started, which ages the jobs left
+waiting. A large running job can give its slot back at a preemption point, the
+pipelines offer one between page batches.
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from docling.utils.cancellation import CancellationToken
+
+_log = logging.getLogger(__name__)
+
+def estimate_cost(page_count: int, file_size: int) -> float:
+    """Cost of a conversion in pages, a MiB of input counting as one more page."""
+    return max(1, page_count) + file_size / (1024 * 1024)
+
+
+@dataclass
+class ScheduledJob:
+    scheduler: "JobScheduler"
+    cost: float
+    tenant: str
+    weight: float
+    cancel_token: Optional[CancellationToken] = None
+    remaining: float = 0.0
+    tag: float = 0.0
+    running: bool = False
+    _granted: threading.Event = field(default_factory=threading.Event)
+
+    def preemption_point(self, pages_done: int, page_count: int) -> None:
+        """Called between page batches, may block to let shorter jobs run first."""
+        self.scheduler._preempt(self, pages_done, page_count)
+
+
+class JobScheduler:
+    def __init__(self, max_running: int, preempt_min_cost: Optional[float] = None):
+        """
+        :param max_running: number of jobs running at the same time.
+        :param preempt_min_cost: jobs of at least this cost give their slot back
+            at preemption points when a job with a smaller tag waits. None
+            disables preemption.
+        """
+        self.max_running = max_running
+        self.preempt_min_cost = preempt_min_cost
+        self._lock = threading.Lock()
+        self._queue: List[Tuple[float, int, ScheduledJob]] = []
+        self._seq = itertools.count()
+        self._running = 0
+        self._vtime = 0.0
+        self._tenant_backlog: Dict[str, float] = {}
+
+    @contextmanager
+    def run(
+        self,
+        cost: float,
+        tenant: str = "default",
+        priority: int = 0,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> Iterator[ScheduledJob]:
+        """Wait for a slot, hold it for the duration of the ``with`` block.
+
+        Raises ``ConversionCancelled`` if ``cancel_token`` is cancelled before
+        the job gets a slot.
+        """
+        job = ScheduledJob(
+            scheduler=self,
+            cost=cost,
+            tenant=tenant,
+            weight=2.0**priority,
+            cancel_token=cancel_token,
+            remaining=cost,
+        )
+        with self._lock:
+            self._tenant_backlog[tenant] = self._tenant_backlog.get(tenant, 0.0) + cost
+            self._enqueue(job)
+            self._dispatch()
+        try:
+            self._wait(job, give_up_when_cancelled=True)
+            yield job
+        finally:
+            with self._lock:
+                self._leave(job)
+                self._dispatch()
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "running": self._running,
+                "waiting": len(self._queue),
+                "virtual_time": self._vtime,
+            }
+
+    def _enqueue(self, job: ScheduledJob) -> None:
+        backlog = self._tenant_backlog.get(job.tenant, 0.0)
+        job.tag = self._vtime + backlog / job.weight
+        job._granted.clear()
+        heapq.heappush(self._queue, (job.tag, next(self._seq), job))
+
+    def _dispatch(self) -> None:
+        while self._queue and self._running < self.max_running:
+            _, _, job = heapq.heappop(self._queue)
+            self._vtime = max(self._vtime, job.tag)
+            self._running += 1
+            job.running = True
+            job._granted.set()
+
+    def _leave(self, job: ScheduledJob) -> None:
+        if job.running:
+            self._running -= 1
+            job.running = False
+        else:
+            self._queue = [entry for entry in self._queue if entry[2] is not job]
+            heapq.heapify(self._queue)
+        backlog = self._tenant_backlog.get(job.tenant, 0.0) - job.remaining
+        if backlog > 1e-9:
+            self._tenant_backlog[job.tenant] = backlog
+        else:
+            self._tenant_backlog.pop(job.tenant, None)
+
+    def _wait(self, job: ScheduledJob, give_up_when_cancelled: bool) -> None:
+        remove_wake = (
+            job.cancel_token.on_cancel(job._granted.set)
+            if job.cancel_token is not None
+            else None
+        )
+        try:
+            job._granted.wait()
+        finally:
+            if remove_wake is not None:
+                remove_wake()
+
+        with self._lock:
+            if job.running:
+                return
+            # Woken by the cancellation
+            if not give_up_when_cancelled:
+                # A preempted job resumes at once to finish its cancellation
+                self._queue = [e for e in self._queue if e[2] is not job]
+                heapq.heapify(self._queue)
+                self._running += 1
+                job.running = True
+                return
+        assert job.cancel_token is not None
+        job.cancel_token.raise_if_cancelled()
+
+    def _preempt(self, job: ScheduledJob, pages_done: int, page_count: int) -> None:
+        with self._lock:
+            done = min(1.0, pages_done / page_count) if page_count else 0.0
+            remaining = job.cost * (1.0 - done)
+            self._tenant_backlog[job.tenant] = self._tenant_backlog.get(
+                job.tenant, 0.0
+            ) - (job.remaining - remaining)
+            job.remaining = remaining
+
+            if (
+                self.preempt_min_cost is None
+                or job.cost < self.preempt_min_cost
+                or not self._queue
+                or self._running < self.max_running
+            ):
+                return
+            own_tag = self._vtime + self._tenant_backlog[job.tenant] / job.weight
+            if self._queue[0][0] >= own_tag:
+                return
+
+            _log.info(
+                f"Preempting job of cost {job.cost:.1f} after {pages_done}/{page_count} pages "
+                f"for {len(self._queue)} waiting jobs"
+            )
+            self._running -= 1
+            job.running = False
+            self._enqueue(job)
+            self._dispatch()
+        self._wait(job, give_up_when_cancelled=False)
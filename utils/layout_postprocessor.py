@@ -4,12 +4,14 @@ import sys
 from collections import defaultdict
 from typing import Dict, List, Set, Tuple
 
+import numpy as np
 from docling_core.types.doc import DocItemLabel, Size
 from docling_core.types.doc.page import TextCell
 from rtree import index
 
 from docling.datamodel.base_models import BoundingBox, Cluster, Page
 from docling.datamodel.pipeline_options import LayoutOptions
+from docling.utils.cell_store import CellStore
 
 _log = logging.getLogger(__name__)
 
@@ -201,6 +203,7 @@ class LayoutPostprocessor:
         """Initialize processor with page and clusters."""
 
         self.cells = page.cells
+        self.cell_store = CellStore(self.cells)
         self.page = page
         self.page_size = page.size
         self.all_clusters = clusters
@@ -581,26 +584,18 @@ class LayoutPostprocessor:
         for cluster in clusters:
             cluster.cells = []
 
-        for cell in self.cells:
-            if not cell.text.strip():
-                continue
-
-            best_overlap = min_overlap
-            best_cluster = None
-
-            for cluster in clusters:
-                if cell.rect.to_bounding_box().area() <= 0:
-                    continue
-
-                overlap_ratio = cell.rect.to_bounding_box().intersection_over_self(
-                    cluster.bbox
-                )
-                if overlap_ratio > best_overlap:
-                    best_overlap = overlap_ratio
-                    best_cluster = cluster
+        if clusters and len(self.cell_store) > 0:
+            # Overlap of every cell with every cluster; the first cluster with the
+            # largest overlap above min_overlap wins.
+            overlaps = self.cell_store.intersection_over_self(
+                [cluster.bbox for cluster in clusters]
+            )
+            best = overlaps.argmax(axis=1)
+            best_overlap = overlaps[np.arange(len(best)), best]
+            assigned = self.cell_store.has_text & (best_overlap > min_overlap)
 
-            if best_cluster is not None:
-                best_cluster.cells.append(cell)
+            for row in np.flatnonzero(assigned):
+                clusters[best[row]].cells.append(self.cell_store.cells[row])
 
         # Deduplicate cells in each cluster after assignment
         for cluster in clusters:
@@ -623,12 +618,12 @@ class LayoutPostprocessor:
             if not cluster.cells:
                 continue
 
-            cells_bbox = BoundingBox(
-                l=min(cell.rect.to_bounding_box().l for cell in cluster.cells),
-                t=min(cell.rect.to_bounding_box().t for cell in cluster.cells),
-                r=max(cell.rect.to_bounding_box().r for cell in cluster.cells),
-                b=max(cell.rect.to_bounding_box().b for cell in cluster.cells),
-            )
+            rows = self.cell_store.rows(cluster.cells)
+            if rows is not None:
+                cells_bbox = self.cell_store.enclosing_bbox(rows)
+            else:
+                store = CellStore(cluster.cells)
+                cells_bbox = store.enclosing_bbox(np.arange(len(store)))
 
             if cluster.label == DocItemLabel.TABLE:
                 # For tables, take union of current bbox and cells bbox
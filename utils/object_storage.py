@@ -0,0 +1,168 @@
+"""In-memory transfers between S3-compatible object stores and the converter.
+
+Objects are streamed into a ``BytesIO`` which can be handed to the converter as
+a ``DocumentStream``, hashing the content while it is received. Outputs are
+uploaded straight from memory buffers, with multipart uploads running in
+parallel and several objects uploaded concurrently. Nothing touches the disk.
+"""
+
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from io import BytesIO
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+
+from docling_core.types.io import DocumentStream
+from pydantic import BaseModel
+
+_log = logging.getLogger(__name__)
+
+
+class TransferSettings(BaseModel):
+    multipart_threshold: int = 8 * 1024 * 1024
+    multipart_chunksize: int = 8 * 1024 * 1024
+    max_concurrency: int = 8  # parts of one object transferred in parallel
+    max_parallel_objects: int = 4  # objects uploaded concurrently
+    read_chunk_size: int = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ObjectLocation:
+    scheme: str
+    bucket: str
+    key: str
+
+    @classmethod
+    def parse(cls, url: str) -> "ObjectLocation":
+        scheme, sep, path = url.partition("://")
+        if not sep or not path:
+            raise ValueError(f"Not an object store URL: {url!r}")
+        bucket, _, key = path.partition("/")
+        return cls(scheme=scheme, bucket=bucket, key=key)
+
+    def with_key(self, key: str) -> "ObjectLocation":
+        return ObjectLocation(scheme=self.scheme, bucket=self.bucket, key=key)
+
+    def __str__(self) -> str:
+        return f"{self.scheme}://{self.bucket}/{self.key}"
+
+
+@dataclass
+class DownloadedObject:
+    location: ObjectLocation
+    stream: BytesIO
+    size: int
+    sha256: str
+    etag: Optional[str] = None
+
+    def as_document_stream(self) -> DocumentStream:
+        name = self.location.key.rsplit("/", 1)[-1] or self.location.bucket
+        self.stream.seek(0)
+        return DocumentStream(name=name, stream=self.stream)
+
+
+class ObjectStore:
+    """Transfer objects through the boto3 client registered for a URL scheme."""
+
+    def __init__(
+        self,
+        clients: Dict[str, Any],
+        settings: Optional[TransferSettings] = None,
+    ):
+        try:
+            from boto3.s3.transfer import TransferConfig
+        except ImportError:
+            raise ImportError(
+                "boto3 is not installed. Please install it via `pip install boto3` "
+                "to transfer documents from and to object stores."
+            )
+
+        self.clients = clients
+        self.settings = settings or TransferSettings()
+        self._transfer_config = TransferConfig(
+            multipart_threshold=self.settings.multipart_threshold,
+            multipart_chunksize=self.settings.multipart_chunksize,
+            max_concurrency=self.settings.max_concurrency,
+            use_threads=True,
+        )
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.settings.max_parallel_objects,
+            thread_name_prefix="object-upload",
+        )
+
+    def _client(self, location: ObjectLocation):
+        try:
+            return self.clients[location.scheme]
+        except KeyError:
+            raise ValueError(
+                f"Unsupported object store scheme {location.scheme!r}, "
+                f"expected one of: {', '.join(self.clients)}"
+            )
+
+    def download(self, location: ObjectLocation) -> DownloadedObject:
+        """Read an object into memory, computing its sha256 on the way."""
+        client = self._client(location)
+        response = client.get_object(Bucket=location.bucket, Key=location.key)
+        body = response["Body"]
+
+        hasher = hashlib.sha256(usedforsecurity=False)
+        buf = BytesIO()
+        try:
+            for chunk in body.iter_chunks(chunk_size=self.settings.read_chunk_size):
+                hasher.update(chunk)
+                buf.write(chunk)
+        finally:
+            body.close()
+        buf.seek(0)
+
+        return DownloadedObject(
+            location=location,
+            stream=buf,
+            size=buf.getbuffer().nbytes,
+            sha256=hasher.hexdigest(),
+            etag=response.get("ETag"),
+        )
+
+    def head(self, location: ObjectLocation) -> Dict[str, Any]:
+        client = self._client(location)
+        return client.head_object(Bucket=location.bucket, Key=location.key)
+
+    def upload(
+        self,
+        location: ObjectLocation,
+        data: BinaryIO,
+        content_type: Optional[str] = None,
+    ) -> None:
+        """Upload a binary stream, using parallel multipart uploads for large ones."""
+        client = self._client(location)
+        extra_args = {"ContentType": content_type} if content_type else None
+        data.seek(0)
+        client.upload_fileobj(
+            data,
+            location.bucket,
+            location.key,
+            ExtraArgs=extra_args,
+            Config=self._transfer_config,
+        )
+        _log.debug(f"Uploaded {location}")
+
+    def upload_many(
+        self, uploads: List[Tuple[ObjectLocation, BinaryIO, Optional[str]]]
+    ) -> None:
+        """Upload several objects concurrently; raises the first failure."""
+        futures = [
+            self._pool.submit(self.upload, location, data, content_type)
+            for location, data, content_type in uploads
+        ]
+        errors = []
+        for fut in futures:
+            try:
+                fut.result()
+            except Exception as e:
+                errors.append(e)
+        if errors:
+            raise errors[0]
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=True)
@@ -0,0 +1,242 @@
+"""Plan the VLM requests which read the OCR regions of a page.
+
+Sending every layout region as its own request pays the prompt and image
+overhead once per region, even for a page number. The planner stacks runs of
+small regions which follow each other in a column into one image per request,
+and cuts text regions too large for one request at blank rows. ``assign_texts``
+maps the texts returned for the requests back to the regions.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Sequence, Tuple
+
+import numpy as np
+from docling_core.types.doc import BoundingBox
+from PIL import Image
+
+# White space between the regions stacked in one image, in pixels
+STACK_GAP = 24
+
+
+@dataclass
+class VlmRegion:
+    bbox: BoundingBox
+    label: str
+
+
+@dataclass
+class VlmRequest:
+    image: Image.Image
+    max_tokens: int
+    region_ixs: List[int]  # regions stacked in the image, top to bottom
+    region_heights: List[int]  # their heights in the image, in pixels
+    split: bool = False  # the image is a part of one region
+
+
+def _compatible(a: str, b: str, whole_labels: Sequence[str]) -> bool:
+    # Regions of classes read whole (tables, formulas, ...) only go with their kind
+    return a == b or (a not in whole_labels and b not in whole_labels)
+
+
+def _adjacent(above: BoundingBox, below: BoundingBox, max_gap: float) -> bool:
+    # The next region of the same column: overlapping columns, a small gap
+    return (
+        min(above.r, below.r) > max(above.l, below.l)
+        and below.t - above.b <= max_gap
+    )
+
+
+def _stack(images: Sequence[Image.Image]) -> Image.Image:
+    width = max(im.width for im in images)
+    height = sum(im.height for im in images) + STACK_GAP * (len(images) - 1)
+    stacked = Image.new("RGB", (width, height), "white")
+    top = 0
+    for im in images:
+        stacked.paste(im, (0, top))
+        top += im.height + STACK_GAP
+    return stacked
+
+
+def _stacked_pixels(images: Sequence[Image.Image]) -> int:
+    width = max(im.width for im in images)
+    return width * (sum(im.height for im in images) + STACK_GAP * (len(images) - 1))
+
+
+def split_at_blank_rows(
+    image: Image.Image, max_height: int, min_gap: int = 8
+) -> List[Tuple[int, int]]:
+    """Row ranges of ``image`` of at most ``max_height``, cut in blank bands.
+
+    A cut goes in the middle of the last run of at least ``min_gap`` blank rows
+    that keeps the part within ``max_height``. Without such a run the rest of the
+    image is kept whole rather than cutting through a line of text.
+    """
+    gray = np.asarray(image.convert("L"))
+    ink = (gray < 160).sum(axis=1)
+    blank = ink <= max(1, gray.shape[1] // 1000)
+
+    parts = []
+    start = 0
+    height = gray.shape[0]
+    while height - start > max_height:
+        # Middle of the last long enough blank run among the rows start..start+max_height
+        cut = None
+        run_start = None
+        window = blank[start : start + max_height + 1]
+        for row, is_blank in enumerate(window):
+            if is_blank and run_start is None:
+                run_start = row
+            if run_start is not None and (not is_blank or row == len(window) - 1):
+                run_end = row + 1 if is_blank else row
+                if run_end - run_start >= min_gap:
+                    cut = start + (run_start + run_end) // 2
+                run_start = None
+        if cut is None or cut <= start:
+            break
+        parts.append((start, cut))
+        start = cut
+    parts.append((start, height))
+    return parts
+
+
+def plan_vlm_requests(
+    regions: Sequence[VlmRegion],
+    render: Callable[[BoundingBox], Image.Image],
+    token_budget: Callable[[float], int],
+    whole_labels: Sequence[str],
+    merge_max_region_area: float,
+    merge_max_pixels: int,
+    merge_max_gap: float,
+    split_max_pixels: int,
+) -> List[VlmRequest]:
+    """Group the regions, in reading order, into the requests sent to the VLM.
+
+    - regions of at most ``merge_max_region_area`` (square points) which follow
+      each other in a column, at most ``merge_max_gap`` points apart, and have
+      compatible classes are stacked into one image of at most
+      ``merge_max_pixels``,
+    - regions rendered larger than ``split_max_pixels`` are cut at blank rows,
+      except the ``whole_labels`` classes, whose markup must be read whole,
+    - the other regions are sent as they are.
+
+    ``token_budget`` gives the completion budget of an area in square points.
+    """
+    order = sorted(
+        range(len(regions)), key=lambda ix: (regions[ix].bbox.t, regions[ix].bbox.l)
+    )
+    requests: List[VlmRequest] = []
+    group: List[Tuple[int, Image.Image]] = []
+
+    def flush():
+        if group:
+            ixs = [ix for ix, _ in group]
+            area = sum(regions[ix].bbox.area() for ix in ixs)
+            requests.append(
+                VlmRequest(
+                    image=(
+                        group[0][1]
+                        if len(group) == 1
+                        else _stack([im for _, im in group])
+                    ),
+                    max_tokens=token_budget(area),
+                    region_ixs=ixs,
+                    region_heights=[im.height for _, im in group],
+                )
+            )
+            group.clear()
+
+    for ix in order:
+        region = regions[ix]
+        image = render(region.bbox)
+        area = region.bbox.area()
+
+        if area <= merge_max_region_area:
+            previous = regions[group[-1][0]] if group else None
+            if previous is not None and not (
+                _adjacent(previous.bbox, region.bbox, merge_max_gap)
+                and _compatible(previous.label, region.label, whole_labels)
+                and _stacked_pixels([im for _, im in group] + [image])
+                <= merge_max_pixels
+            ):
+                flush()
+            group.append((ix, image))
+            continue
+
+        flush()
+        n_pixels = image.width * image.height
+        if region.label in whole_labels or n_pixels <= split_max_pixels:
+            requests.append(
+                VlmRequest(
+                    image=image,
+                    max_tokens=token_budget(area),
+                    region_ixs=[ix],
+                    region_heights=[image.height],
+                )
+            )
+            continue
+
+        max_height = max(1, split_max_pixels // image.width)
+        parts = split_at_blank_rows(image, max_height)
+        for top, bottom in parts:
+            requests.append(
+                VlmRequest(
+                    image=image.crop((0, top, image.width, bottom)),
+                    max_tokens=token_budget(area * (bottom - top) / image.height),
+                    region_ixs=[ix],
+                    region_heights=[bottom - top],
+                    split=len(parts) > 1,
+                )
+            )
+    flush()
+
+    return requests
+
+
+def _share_lines(text: str, heights: Sequence[int]) -> List[str]:
+    # Each line goes to the region at its relative height in the stacked image
+    lines = [line for line in text.splitlines() if line.strip()]
+    bounds = np.cumsum(heights) / sum(heights)
+    shares: List[List[str]] = [[] for _ in heights]
+    for row, line in enumerate(lines):
+        position = (row + 0.5) / len(lines)
+        region = min(int(np.searchsorted(bounds, position)), len(heights) - 1)
+        shares[region].append(line)
+    return ["\n".join(share) for share in shares]
+
+
+def assign_texts(
+    requests: Sequence[VlmRequest], texts: Sequence[str]
+) -> List[Tuple[int, str]]:
+    """Texts of the regions, from the texts returned for every request.
+
+    The parts of a split region are joined in order. The text of stacked regions
+    is shared by paragraph when there is one paragraph per region, otherwise its
+    lines are shared by their position against the heights of the regions.
+    """
+    assigned: List[Tuple[int, str]] = []
+    split_parts: Dict[int, List[str]] = {}
+    for request, text in zip(requests, texts):
+        text = text.strip()
+        if request.split:
+            split_parts.setdefault(request.region_ixs[0], []).append(text)
+        elif not text:
+            continue
+        elif len(request.region_ixs) == 1:
+            assigned.append((request.region_ixs[0], text))
+        else:
+            paragraphs = [p.strip() for p in re.split(r"\n\s*\n", text) if p.strip()]
+            if len(paragraphs) != len(request.region_ixs):
+                paragraphs = _share_lines(text, request.region_heights)
+            assigned.extend(
+                (ix, paragraph)
+                for ix, paragraph in zip(request.region_ixs, paragraphs)
+                if paragraph
+            )
+
+    for ix, parts in split_parts.items():
+        text = "\n\n".join(part for part in parts if part)
+        if text:
+            assigned.append((ix, text))
+
+    return assigned
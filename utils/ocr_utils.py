@@ -1,4 +1,4 @@
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from docling_core.types.doc import BoundingBox, CoordOrigin
 from docling_core.types.doc.page import BoundingRectangle
@@ -17,6 +17,50 @@ def map_tesseract_script(script: str) -> str:
     return script
 
 
+def parse_tesseract_tsv(data: str) -> List[List[Dict[str, str]]]:
+    r"""
+    Split the TSV output of tesseract into the rows of every image
+
+    Images are told apart by the ``page_num`` column, so the output of a run on a
+    list of images gives one list of rows per image, in input order.
+    """
+    lines = data.splitlines()
+    if len(lines) == 0:
+        return []
+    header = lines[0].split("\t")
+    images: List[List[Dict[str, str]]] = []
+    page_num: Optional[str] = None
+    for line in lines[1:]:
+        row = dict(zip(header, line.split("\t")))
+        if "page_num" not in row:
+            continue
+        if row["page_num"] != page_num:
+            page_num = row["page_num"]
+            images.append([])
+        images[-1].append(row)
+    return images
+
+
+def parse_tesseract_osd(data: str) -> List[Dict[str, str]]:
+    r"""
+    Split the OSD output of tesseract (``--psm 0``) into the fields of every image
+
+    Each image starts with a ``Page number`` line, followed by ``key: value`` lines.
+    """
+    images: List[Dict[str, str]] = []
+    for line in data.splitlines():
+        key, sep, value = line.partition(":")
+        if not sep:
+            continue
+        key = key.strip()
+        if key == "Page number":
+            images.append({})
+        elif len(images) == 0:
+            continue
+        images[-1][key] = value.strip()
+    return images
+
+
 def parse_tesseract_orientation(orientation: str) -> int:
     # Tesseract orientation is [0, 90, 180, 270] clockwise, bounding rectangle angles
     # are [0, 360[ counterclockwise
@@ -0,0 +1,349 @@
+"""Local stand-in for an OpenAI-compatible chat-completions endpoint.
+
+Used to run network-backed OCR / VLM models (e.g. ``MyOcrModel``, ``ApiVlmModel``)
+without a GPU server, for benchmarks and load tests. The server supports
+configurable latency distributions, a concurrency limit, error and timeout
+injection, canned responses and a record/replay mode against a real endpoint.
+"""
+
+import hashlib
+import itertools
+import json
+import logging
+import math
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from enum import Enum
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Literal, Optional, Tuple
+
+from pydantic import BaseModel
+
+_log = logging.getLogger(__name__)
+
+
+class LatencyModel(BaseModel):
+    """Distribution of the simulated service time of a request, in seconds."""
+
+    distribution: Literal["fixed", "uniform", "normal", "lognormal", "exponential"] = (
+        "fixed"
+    )
+    mean: float = 0.0
+    stddev: float = 0.0  # normal/lognormal spread; uniform draws in mean ± stddev
+    min: float = 0.0
+    max: Optional[float] = None
+    per_token: float = 0.0  # additional decode time per completion token
+
+    def sample(self, rng: random.Random, num_tokens: int = 0) -> float:
+        if self.distribution == "fixed":
+            value = self.mean
+        elif self.distribution == "uniform":
+            value = rng.uniform(self.mean - self.stddev, self.mean + self.stddev)
+        elif self.distribution == "normal":
+            value = rng.gauss(self.mean, self.stddev)
+        elif self.distribution == "lognormal":
+            # Parametrised by the mean and stddev of the resulting distribution.
+            if self.mean <= 0:
+                value = 0.0
+            else:
+                sigma2 = math.log1p((self.stddev / self.mean) ** 2)
+                mu = math.log(self.mean) - sigma2 / 2
+                value = rng.lognormvariate(mu, math.sqrt(sigma2))
+        else:  # exponential
+            value = rng.expovariate(1.0 / self.mean) if self.mean > 0 else 0.0
+
+        value += self.per_token * num_tokens
+        value = max(value, self.min)
+        if self.max is not None:
+            value = min(value, self.max)
+        return value
+
+
+class StubMode(str, Enum):
+    CANNED = "canned"  # answer from the configured canned responses
+    RECORD = "record"  # forward to the upstream endpoint and store its responses
+    REPLAY = "replay"  # answer from previously recorded responses
+
+
+class OpenAiStubOptions(BaseModel):
+    host: str = "127.0.0.1"
+    port: int = 0  # 0 picks a free port
+    mode: StubMode = StubMode.CANNED
+
+    responses: List[str] = ["Lorem ipsum dolor sit amet."]  # used in turn
+    latency: LatencyModel = LatencyModel()
+
+    max_concurrency: Optional[int] = None  # requests served in parallel
+    reject_when_busy: bool = False  # True: answer 429 instead of queueing
+
+    error_rate: float = 0.0  # fraction of requests answered with error_status
+    error_status: int = 500
+    timeout_rate: float = 0.0  # fraction of requests that hang and drop the connection
+    timeout_seconds: float = 30.0
+
+    upstream_url: Optional[str] = None  # required in record mode
+    upstream_timeout: float = 300.0
+    recordings_path: Optional[Path] = None  # required in record and replay mode
+
+    seed: int = 42
+
+
+class OpenAiStubServer:
+    """Serve chat-completions responses on a background thread."""
+
+    def __init__(self, options: Optional[OpenAiStubOptions] = None):
+        self.options = options or OpenAiStubOptions()
+
+        if self.options.mode != StubMode.CANNED and self.options.recordings_path is None:
+            raise ValueError(f"recordings_path is required in {self.options.mode} mode.")
+        if self.options.mode == StubMode.RECORD and self.options.upstream_url is None:
+            raise ValueError("upstream_url is required in record mode.")
+
+        self._rng = random.Random(self.options.seed)
+        self._rng_lock = threading.Lock()
+        self._responses = itertools.cycle(self.options.responses or [""])
+        self._slots = (
+            threading.BoundedSemaphore(self.options.max_concurrency)
+            if self.options.max_concurrency
+            else None
+        )
+
+        self._recordings: Dict[str, dict] = {}
+        self._recordings_lock = threading.Lock()
+        if (
+            self.options.recordings_path is not None
+            and self.options.recordings_path.exists()
+        ):
+            with self.options.recordings_path.open("r", encoding="utf-8") as f:
+                self._recordings = json.load(f)
+
+        self._stats_lock = threading.Lock()
+        self._stats: Dict[str, int] = {
+            "requests": 0,
+            "completed": 0,
+            "errors": 0,
+            "timeouts": 0,
+            "rejected": 0,
+            "replay_misses": 0,
+            "in_flight": 0,
+            "max_in_flight": 0,
+        }
+
+        self._httpd = ThreadingHTTPServer(
+            (self.options.host, self.options.port), self._make_handler()
+        )
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1/chat/completions"
+
+    def stats(self) -> Dict[str, int]:
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def start(self) -> "OpenAiStubServer":
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="openai-stub", daemon=True
+        )
+        self._thread.start()
+        _log.info(f"OpenAI stub server ({self.options.mode.value}) listening on {self.url}")
+        return self
+
+    def serve_forever(self) -> None:
+        _log.info(f"OpenAI stub server ({self.options.mode.value}) listening on {self.url}")
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._httpd.server_close()
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "OpenAiStubServer":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    # ---------------------------------------------------------------- helpers
+    def _count(self, key: str, delta: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[key] += delta
+            if key == "in_flight":
+                self._stats["max_in_flight"] = max(
+                    self._stats["max_in_flight"], self._stats["in_flight"]
+                )
+
+    def _draw(self) -> float:
+        with self._rng_lock:
+            return self._rng.random()
+
+    def _sample_latency(self, num_tokens: int) -> float:
+        with self._rng_lock:
+            return self.options.latency.sample(self._rng, num_tokens=num_tokens)
+
+    @staticmethod
+    def _request_key(body: bytes) -> str:
+        try:
+            canonical = json.dumps(json.loads(body), sort_keys=True).encode("utf-8")
+        except json.JSONDecodeError:
+            canonical = body
+        return hashlib.sha256(canonical).hexdigest()
+
+    def _completion(self, model: Optional[str], content: str) -> dict:
+        num_tokens = len(content.split())
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex}",
+            "object": "chat.completion",
+            "model": model,
+            "created": int(time.time()),
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {
+                "prompt_tokens": 0,
+                "completion_tokens": num_tokens,
+                "total_tokens": num_tokens,
+            },
+        }
+
+    def _forward(self, body: bytes, headers: Dict[str, str]) -> Tuple[int, Dict]:
+        """Status and response of the upstream, 502 if it can not be reached."""
+        assert self.options.upstream_url is not None
+        req = urllib.request.Request(
+            self.options.upstream_url, data=body, headers=headers, method="POST"
+        )
+        try:
+            with urllib.request.urlopen(
+                req, timeout=self.options.upstream_timeout
+            ) as resp:
+                return resp.status, json.loads(resp.read())
+        except urllib.error.HTTPError as e:
+            return e.code, {"error": e.read().decode("utf-8", errors="replace")}
+        except (urllib.error.URLError, OSError) as e:  # refused, unreachable, timeout
+            _log.warning(f"Upstream request to {self.options.upstream_url} failed: {e}")
+            return 502, {"error": f"upstream unreachable: {e}"}
+        except json.JSONDecodeError as e:
+            return 502, {"error": f"invalid upstream response: {e}"}
+
+    def _record(self, key: str, response: dict) -> None:
+        assert self.options.recordings_path is not None
+        with self._recordings_lock:
+            self._recordings[key] = response
+            tmp_path = self.options.recordings_path.with_suffix(".tmp")
+            with tmp_path.open("w", encoding="utf-8") as f:
+                json.dump(self._recordings, f)
+            tmp_path.replace(self.options.recordings_path)
+
+    def _make_handler(self):
+        server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                server._count("requests")
+                length = int(self.headers.get("Content-Length", 0))
+                body = self.rfile.read(length)
+
+                if server._slots is not None:
+                    if not server._slots.acquire(
+                        blocking=not server.options.reject_when_busy
+                    ):
+                        server._count("rejected")
+                        self._reply(429, {"error": "server busy"})
+                        return
+                server._count("in_flight")
+                try:
+                    self._handle(body)
+                finally:
+                    server._count("in_flight", -1)
+                    if server._slots is not None:
+                        server._slots.release()
+
+            def _handle(self, body: bytes):
+                try:
+                    request = json.loads(body or b"{}")
+                except json.JSONDecodeError:
+                    self._reply(400, {"error": "invalid JSON body"})
+                    return
+
+                opts = server.options
+                if opts.timeout_rate > 0 and server._draw() < opts.timeout_rate:
+                    server._count("timeouts")
+                    time.sleep(opts.timeout_seconds)
+                    self.close_connection = True
+                    return
+                if opts.error_rate > 0 and server._draw() < opts.error_rate:
+                    server._count("errors")
+                    time.sleep(server._sample_latency(0))
+                    self._reply(opts.error_status, {"error": "injected error"})
+                    return
+
+                key = server._request_key(body)
+                if opts.mode == StubMode.RECORD:
+                    headers = {
+                        k: v
+                        for k, v in self.headers.items()
+                        if k.lower() in ("content-type", "authorization")
+                    }
+                    status, response = server._forward(body, headers)
+                    if status == 200:
+                        server._record(key, response)
+                    self._reply(status, response)
+                    server._count("completed")
+                    return
+
+                if opts.mode == StubMode.REPLAY:
+                    response = server._recordings.get(key)
+                    if response is None:
+                        server._count("replay_misses")
+                        self._reply(404, {"error": f"no recording for request {key}"})
+                        return
+                else:
+                    response = server._completion(
+                        request.get("model"), next(server._responses)
+                    )
+
+                num_tokens = response.get("usage", {}).get("completion_tokens", 0)
+                time.sleep(server._sample_latency(num_tokens))
+                self._reply(200, response)
+                server._count("completed")
+
+            def do_GET(self):
+                path = self.path.rstrip("/")
+                if path == "/health":
+                    self._reply(200, {"status": "ok"})
+                elif path == "/stats":
+                    self._reply(200, server.stats())
+                else:
+                    self._reply(404, {"error": "not found"})
+
+            def _reply(self, status: int, body: dict):
+                data = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                _log.debug(format, *args)
+
+        return _Handler
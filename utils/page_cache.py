@@ -0,0 +1,235 @@
+"""Page-level cache of pipeline outputs, for incremental re-conversion.
+
+A page is identified by a fingerprint of its rendered content and of its text
+cells, independent of its position in the document. When a revised document is
+converted again, the pages whose fingerprint is found in the cache reuse their
+parsed cells, layout clusters, table structures, OCR cells and assembled
+elements, and only the changed or new pages run through the models.
+
+Entries are stored as gzipped JSON files below the cache directory, keyed by
+the page fingerprint and a hash of the pipeline and its options, so changing
+the pipeline configuration never serves stale predictions. When the cache grows
+beyond ``max_bytes``, the least recently used entries are removed.
+"""
+
+import gzip
+import hashlib
+import logging
+import math
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from docling_core.types.doc.page import SegmentedPdfPage
+from pydantic import BaseModel, ValidationError
+
+from docling.backend.pdf_backend import PdfPageBackend
+from docling.datamodel.base_models import (
+    AssembledUnit,
+    Page,
+    PageConfidenceScores,
+    PagePredictions,
+    Size,
+)
+from docling.datamodel.pipeline_options import PipelineOptions
+
+_log = logging.getLogger(__name__)
+
+# Resolution of the raster used to fingerprint a page (36 dpi). It catches
+# changes of lines and images; changes of the text, small glyphs and invisible
+# text layers of scans included, are caught by hashing the text cells.
+FINGERPRINT_SCALE = 0.5
+
+# Options which change where or how long the conversion runs, but not its outputs.
+_NON_OUTPUT_OPTIONS = {
+    "page_cache_dir",
+    "page_cache_max_bytes",
+    "checkpoint_dir",
+    "broker_url",
+    "shard_size",
+    "shard_lease",
+    "shard_max_attempts",
+    "poll_interval",
+    "document_timeout",
+    "accelerator_options",
+}
+
+
+def page_fingerprint(page_backend: PdfPageBackend) -> str:
+    """Hash of the page size, of its text cells and of its low-resolution rendering."""
+    size = page_backend.get_size()
+    image = page_backend.get_page_image(scale=FINGERPRINT_SCALE)
+
+    hasher = hashlib.sha256(usedforsecurity=False)
+    hasher.update(f"{size.width:.2f}x{size.height:.2f};".encode())
+    for cell in page_backend.get_text_cells():
+        rect = cell.rect
+        hasher.update(
+            f"{rect.r_x0:.2f},{rect.r_y0:.2f},{rect.r_x2:.2f},{rect.r_y2:.2f}"
+            f"|{getattr(cell, 'font_name', '')}"
+            f"|{getattr(cell, 'rendering_mode', '')}|".encode()
+        )
+        hasher.update(cell.text.encode("utf-8", errors="surrogatepass"))
+        hasher.update(b"\0")
+    hasher.update(f"{image.mode}{image.size};".encode())
+    hasher.update(image.tobytes())
+    return hasher.hexdigest()
+
+
+def pipeline_options_hash(pipeline_name: str, pipeline_options: PipelineOptions) -> str:
+    options_json = pipeline_options.model_dump_json(
+        exclude=_NON_OUTPUT_OPTIONS & set(type(pipeline_options).model_fields)
+    )
+    hasher = hashlib.sha256(usedforsecurity=False)
+    hasher.update(pipeline_name.encode())
+    hasher.update(b"\0")
+    hasher.update(options_json.encode())
+    return hasher.hexdigest()
+
+
+class PageCacheEntry(BaseModel):
+    size: Size
+    parsed_page: Optional[SegmentedPdfPage] = None
+    predictions: PagePredictions = PagePredictions()
+    assembled: Optional[AssembledUnit] = None
+    # NaN scores are stored as null, which the float fields do not accept back.
+    confidence: Dict[str, Optional[float]] = {}
+
+    @classmethod
+    def from_page(cls, page: Page, scores: PageConfidenceScores) -> "PageCacheEntry":
+        assert page.size is not None
+        return cls(
+            size=page.size,
+            parsed_page=page.parsed_page,
+            predictions=page.predictions,
+            assembled=page.assembled,
+            confidence={
+                name: None if math.isnan(value) else value
+                for name, value in scores.model_dump(
+                    include=set(PageConfidenceScores.model_fields)
+                ).items()
+            },
+        )
+
+    def restore(self, page: Page, scores: PageConfidenceScores) -> None:
+        """Copy the cached outputs onto ``page``, renumbered to its position."""
+        page.size = self.size
+        page.parsed_page = self.parsed_page
+        page.predictions = self.predictions
+        page.assembled = self.assembled
+        page.renumber(page.page_no)
+
+        for name, value in self.confidence.items():
+            setattr(scores, name, math.nan if value is None else value)
+
+
+class PageCache:
+    """Directory of ``PageCacheEntry`` files, safe to share between processes.
+
+    Reading an entry marks it as used. Once ``max_bytes / 10`` were written
+    since the last check, the least recently used entries are removed until the
+    cache is below 90% of ``max_bytes``.
+    """
+
+    def __init__(
+        self, cache_dir: Path, options_hash: str, max_bytes: Optional[int] = None
+    ):
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.options_hash = options_hash
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._written = 0  # bytes since the last prune
+        self._pruned = False
+
+    def _entry_path(self, fingerprint: str) -> Path:
+        key = hashlib.sha256(
+            f"{self.options_hash}:{fingerprint}".encode(), usedforsecurity=False
+        ).hexdigest()
+        return self.cache_dir / key[:2] / f"{key}.json.gz"
+
+    def get(self, fingerprint: str) -> Optional[PageCacheEntry]:
+        path = self._entry_path(fingerprint)
+        entry = read_entry(path)
+        if entry is not None and self.max_bytes is not None:
+            try:
+                os.utime(path)  # most recently used
+            except OSError:
+                pass
+        return entry
+
+    def put(self, fingerprint: str, entry: PageCacheEntry) -> None:
+        path = self._entry_path(fingerprint)
+        write_entry(path, entry)
+        if self.max_bytes is None:
+            return
+        with self._lock:
+            try:
+                self._written += path.stat().st_size
+            except OSError:
+                pass
+            due = not self._pruned or self._written >= self.max_bytes // 10
+            if due:
+                self._written = 0
+                self._pruned = True
+        if due:
+            self.prune()
+
+    def prune(self) -> int:
+        """Remove the least recently used entries above the size bound.
+
+        Returns the number of bytes removed.
+        """
+        if self.max_bytes is None:
+            return 0
+        files: List[Tuple[float, int, Path]] = []
+        total = 0
+        for path in self.cache_dir.glob("*/*.json.gz"):
+            try:
+                stat = path.stat()
+            except OSError:  # removed by another process
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        if total <= self.max_bytes:
+            return 0
+
+        target = int(self.max_bytes * 0.9)
+        removed = 0
+        for _, size, path in sorted(files):
+            if total - removed <= target:
+                break
+            path.unlink(missing_ok=True)
+            removed += size
+        _log.info(f"Pruned {removed} bytes from the page cache {self.cache_dir}")
+        return removed
+
+
+def read_entry(path: Path) -> Optional[PageCacheEntry]:
+    """Read an entry file, None if it is missing or unreadable."""
+    try:
+        with gzip.open(path, "rb") as f:
+            entry = PageCacheEntry.model_validate_json(f.read())
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, ValidationError) as e:
+        _log.warning(f"Ignoring unreadable page cache entry {path}: {e}")
+        return None
+    return entry
+
+
+def write_entry(path: Path, entry: PageCacheEntry) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Write to a temporary file first, concurrent readers never see partial entries.
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as raw, gzip.GzipFile(
+            fileobj=raw, mode="wb", compresslevel=3
+        ) as f:
+            f.write(entry.model_dump_json().encode("utf-8"))
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
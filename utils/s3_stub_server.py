@@ -0,0 +1,293 @@
+"""Local, in-memory stand-in for an S3-compatible object store.
+
+Implements the subset of the S3 REST API used by ``ObjectStore`` and the OCR
+service (path-style addressing): GetObject, HeadObject, PutObject, DeleteObject
+and multipart uploads. Use it with any boto3 client by passing ``endpoint_url``
+and dummy credentials.
+"""
+
+import hashlib
+import logging
+import threading
+import uuid
+from dataclasses import dataclass, field
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape
+
+_log = logging.getLogger(__name__)
+
+_S3_NS = "http://s3.amazonaws.com/doc/2006-03-01/"
+
+
+@dataclass
+class _StoredObject:
+    data: bytes
+    etag: str
+    content_type: str
+    last_modified: str = field(default_factory=lambda: formatdate(usegmt=True))
+
+
+@dataclass
+class _MultipartUpload:
+    bucket: str
+    key: str
+    content_type: str
+    parts: Dict[int, Tuple[bytes, str]] = field(default_factory=dict)
+
+
+def _decode_aws_chunked(body: bytes) -> bytes:
+    """Strip the aws-chunked framing (``<hex-size>[;chunk-signature=..]\\r\\n``)."""
+    out = bytearray()
+    pos = 0
+    while pos < len(body):
+        eol = body.index(b"\r\n", pos)
+        size = int(body[pos:eol].split(b";", 1)[0], 16)
+        pos = eol + 2
+        if size == 0:
+            break
+        out += body[pos : pos + size]
+        pos += size + 2
+    return bytes(out)
+
+
+class S3StubServer:
+    """Serve an in-memory object store on a background thread."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self._objects: Dict[Tuple[str, str], _StoredObject] = {}
+        self._uploads: Dict[str, _MultipartUpload] = {}
+        self._lock = threading.Lock()
+        self._stats: Dict[str, int] = {"get": 0, "put": 0, "parts": 0}
+
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def endpoint_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def client(self):
+        """Return a boto3 S3 client pointed at this server."""
+        import boto3
+        from botocore.config import Config
+
+        return boto3.client(
+            "s3",
+            endpoint_url=self.endpoint_url,
+            aws_access_key_id="stub",
+            aws_secret_access_key="stub",
+            region_name="us-east-1",
+            config=Config(s3={"addressing_style": "path"}),
+        )
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def put_object(self, bucket: str, key: str, data: bytes) -> str:
+        etag = f'"{hashlib.md5(data, usedforsecurity=False).hexdigest()}"'
+        with self._lock:
+            self._objects[(bucket, key)] = _StoredObject(
+                data=data, etag=etag, content_type="application/octet-stream"
+            )
+        return etag
+
+    def get_object(self, bucket: str, key: str) -> Optional[bytes]:
+        with self._lock:
+            obj = self._objects.get((bucket, key))
+        return obj.data if obj is not None else None
+
+    def start(self) -> "S3StubServer":
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="s3-stub", daemon=True
+        )
+        self._thread.start()
+        _log.info(f"S3 stub server listening on {self.endpoint_url}")
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "S3StubServer":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def _make_handler(self):
+        server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _target(self) -> Tuple[str, str, Dict[str, list]]:
+                url = urlsplit(self.path)
+                bucket, _, key = unquote(url.path).lstrip("/").partition("/")
+                return bucket, key, parse_qs(url.query, keep_blank_values=True)
+
+            def _read_body(self) -> bytes:
+                length = int(self.headers.get("Content-Length", 0))
+                body = self.rfile.read(length)
+                if "aws-chunked" in self.headers.get("Content-Encoding", ""):
+                    body = _decode_aws_chunked(body)
+                return body
+
+            def do_GET(self):
+                self._send_object(head=False)
+
+            def do_HEAD(self):
+                self._send_object(head=True)
+
+            def _send_object(self, head: bool):
+                bucket, key, _ = self._target()
+                with server._lock:
+                    obj = server._objects.get((bucket, key))
+                    server._stats["get"] += 1
+                if obj is None:
+                    self._error(404, "NoSuchKey", f"{bucket}/{key}", head=head)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", obj.content_type)
+                self.send_header("Content-Length", str(len(obj.data)))
+                self.send_header("ETag", obj.etag)
+                self.send_header("Last-Modified", obj.last_modified)
+                self.end_headers()
+                if not head:
+                    self.wfile.write(obj.data)
+
+            def do_PUT(self):
+                bucket, key, query = self._target()
+                body = self._read_body()
+                etag = f'"{hashlib.md5(body, usedforsecurity=False).hexdigest()}"'
+
+                if "uploadId" in query:
+                    upload_id = query["uploadId"][0]
+                    part_number = int(query["partNumber"][0])
+                    with server._lock:
+                        upload = server._uploads.get(upload_id)
+                        if upload is not None:
+                            upload.parts[part_number] = (body, etag)
+                            server._stats["parts"] += 1
+                    if upload is None:
+                        self._error(404, "NoSuchUpload", upload_id)
+                        return
+                else:
+                    content_type = self.headers.get(
+                        "Content-Type", "application/octet-stream"
+                    )
+                    with server._lock:
+                        server._objects[(bucket, key)] = _StoredObject(
+                            data=body, etag=etag, content_type=content_type
+                        )
+                        server._stats["put"] += 1
+                self._reply(200, b"", extra_headers={"ETag": etag})
+
+            def do_POST(self):
+                bucket, key, query = self._target()
+                body = self._read_body()
+
+                if "uploads" in query:
+                    upload_id = uuid.uuid4().hex
+                    with server._lock:
+                        server._uploads[upload_id] = _MultipartUpload(
+                            bucket=bucket,
+                            key=key,
+                            content_type=self.headers.get(
+                                "Content-Type", "application/octet-stream"
+                            ),
+                        )
+                    self._reply_xml(
+                        "InitiateMultipartUploadResult",
+                        {"Bucket": bucket, "Key": key, "UploadId": upload_id},
+                    )
+                elif "uploadId" in query:
+                    upload_id = query["uploadId"][0]
+                    with server._lock:
+                        upload = server._uploads.pop(upload_id, None)
+                    if upload is None:
+                        self._error(404, "NoSuchUpload", upload_id)
+                        return
+                    root = ElementTree.fromstring(body)
+                    numbers = sorted(
+                        int(el.text or 0)
+                        for el in root.iter()
+                        if el.tag.rsplit("}", 1)[-1] == "PartNumber"
+                    )
+                    parts = [upload.parts[n] for n in numbers]
+                    digest = hashlib.md5(usedforsecurity=False)
+                    for _, part_etag in parts:
+                        digest.update(bytes.fromhex(part_etag.strip('"')))
+                    etag = f'"{digest.hexdigest()}-{len(parts)}"'
+                    with server._lock:
+                        server._objects[(bucket, key)] = _StoredObject(
+                            data=b"".join(data for data, _ in parts),
+                            etag=etag,
+                            content_type=upload.content_type,
+                        )
+                        server._stats["put"] += 1
+                    self._reply_xml(
+                        "CompleteMultipartUploadResult",
+                        {"Bucket": bucket, "Key": key, "ETag": etag},
+                    )
+                else:
+                    self._error(400, "InvalidRequest", self.path)
+
+            def do_DELETE(self):
+                bucket, key, query = self._target()
+                with server._lock:
+                    if "uploadId" in query:
+                        server._uploads.pop(query["uploadId"][0], None)
+                    else:
+                        server._objects.pop((bucket, key), None)
+                self._reply(204, b"")
+
+            def _reply_xml(self, root: str, values: Dict[str, str]):
+                inner = "".join(
+                    f"<{k}>{escape(str(v))}</{k}>" for k, v in values.items()
+                )
+                body = (
+                    f'<?xml version="1.0" encoding="UTF-8"?>'
+                    f'<{root} xmlns="{_S3_NS}">{inner}</{root}>'
+                ).encode("utf-8")
+                self._reply(200, body, content_type="application/xml")
+
+            def _error(self, status: int, code: str, resource: str, head=False):
+                body = (
+                    f'<?xml version="1.0" encoding="UTF-8"?><Error><Code>{code}</Code>'
+                    f"<Resource>{escape(resource)}</Resource></Error>"
+                ).encode("utf-8")
+                self._reply(
+                    status, b"" if head else body, content_type="application/xml"
+                )
+
+            def _reply(
+                self,
+                status: int,
+                body: bytes,
+                content_type: Optional[str] = None,
+                extra_headers: Optional[Dict[str, str]] = None,
+            ):
+                self.send_response(status)
+                if content_type:
+                    self.send_header("Content-Type", content_type)
+                for k, v in (extra_headers or {}).items():
+                    self.send_header(k, v)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if body:
+                    self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                _log.debug(format, *args)
+
+        return _Handler
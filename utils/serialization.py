@@ -0,0 +1,261 @@
+"""Fast, streaming export of DoclingDocument to JSON and Markdown.
+
+``DoclingDocument.export_to_dict()`` followed by ``json.dump`` keeps the whole
+dict tree and the encoded string alive at the same time, which for documents
+with embedded base64 images is several times the size of the document itself.
+The writers in this module encode the document with pydantic's compiled
+serializer one item at a time and push the bytes directly to a file or any
+binary stream (sockets via ``socket.makefile("wb")``, upload buffers, ...),
+optionally through a gzip or zstd compressor.
+
+The JSON produced is equivalent to ``export_to_dict()`` (by alias, without
+``None`` values), just without indentation unless requested.
+"""
+
+import gzip
+import io
+import logging
+from contextlib import contextmanager
+from enum import Enum
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, Optional, Tuple, Union
+
+import pydantic_core
+from docling_core.types.doc import DoclingDocument
+from docling_core.types.doc.base import PydanticSerCtxKey
+from pydantic import BaseModel
+
+_log = logging.getLogger(__name__)
+
+_CHUNK_SIZE = 1 << 20
+
+
+class Compression(str, Enum):
+    NONE = "none"
+    GZIP = "gzip"
+    ZSTD = "zstd"
+
+    @property
+    def suffix(self) -> str:
+        return {"none": "", "gzip": ".gz", "zstd": ".zst"}[self.value]
+
+
+class _CountingWriter(io.RawIOBase):
+    def __init__(self, raw: BinaryIO):
+        self.raw = raw
+        self.written = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:  # type: ignore[override]
+        n = self.raw.write(b)
+        n = len(b) if n is None else n
+        self.written += n
+        return n
+
+
+@contextmanager
+def _compressed(sink: BinaryIO, compression: Compression) -> Iterator[BinaryIO]:
+    if compression == Compression.GZIP:
+        with gzip.GzipFile(fileobj=sink, mode="wb", compresslevel=6) as gz:
+            yield gz  # type: ignore[misc]
+    elif compression == Compression.ZSTD:
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError(
+                "zstd compression requires the zstandard package. "
+                "Please install it via `pip install zstandard`."
+            )
+        with zstandard.ZstdCompressor(level=3).stream_writer(
+            sink, closefd=False
+        ) as zw:
+            yield zw  # type: ignore[misc]
+    else:
+        yield sink
+
+
+@contextmanager
+def _open_sink(
+    sink: Union[Path, str, BinaryIO], compression: Compression
+) -> Iterator[Tuple[BinaryIO, _CountingWriter]]:
+    if isinstance(sink, (str, Path)):
+        with open(sink, "wb") as f:
+            with _open_sink(f, compression) as res:
+                yield res
+        return
+
+    counter = _CountingWriter(sink)
+    with _compressed(counter, compression) as out:  # type: ignore[arg-type]
+        yield out, counter
+    if hasattr(sink, "flush"):
+        sink.flush()
+
+
+def _ser_context(
+    coord_precision: Optional[int], confid_precision: Optional[int]
+) -> Dict[str, int]:
+    context = {}
+    if coord_precision is not None:
+        context[PydanticSerCtxKey.COORD_PREC.value] = coord_precision
+    if confid_precision is not None:
+        context[PydanticSerCtxKey.CONFID_PREC.value] = confid_precision
+    return context
+
+
+def _encode(value: Any, context: Dict[str, int]) -> bytes:
+    return pydantic_core.to_json(
+        value, by_alias=True, exclude_none=True, context=context or None
+    )
+
+
+def _field_json(
+    doc: DoclingDocument, name: str, value: Any, context: Dict[str, int]
+) -> Optional[bytes]:
+    """``"key":value`` as the document's own serializer writes the field holding
+    ``value``, None if it leaves the field out."""
+    out = pydantic_core.to_json(
+        doc.model_copy(update={name: value}),
+        include={name},
+        by_alias=True,
+        exclude_none=True,
+        context=context or None,
+    )
+    return None if out == b"{}" else out[1:-1]
+
+
+def _iter_field_json(
+    doc: DoclingDocument, name: str, context: Dict[str, int]
+) -> Iterator[bytes]:
+    value = getattr(doc, name)
+    is_list = isinstance(value, list)
+    is_dict = isinstance(value, dict) and not isinstance(value, BaseModel)
+    if not (is_list or is_dict) or len(value) < 2:
+        out = _field_json(doc, name, value, context)
+        if out is not None:
+            yield out
+        return
+
+    # Stream the container item by item if the document encodes its first
+    # item the same way as the item encodes itself, otherwise in one piece.
+    if is_list:
+        first_item = value[0]
+        probe = _field_json(doc, name, value[:1], context)
+        opening, closing = b"[", b"]"
+        items: Iterator[bytes] = (_encode(item, context) for item in value)
+    else:
+        first_key, first_item = next(iter(value.items()))
+        probe = _field_json(doc, name, {first_key: first_item}, context)
+        opening, closing = b"{", b"}"
+        items = (
+            _encode(str(k), context) + b":" + _encode(item, context)
+            for k, item in value.items()
+        )
+    if probe is None:
+        out = _field_json(doc, name, value, context)
+        if out is not None:
+            yield out
+        return
+
+    key = probe.partition(b":")[0]
+    first_encoded = next(items)
+    if probe != key + b":" + opening + first_encoded + closing:
+        _log.debug(f"Encoding the {name} field of the document in one piece")
+        out = _field_json(doc, name, value, context)
+        if out is not None:
+            yield out
+        return
+
+    yield key + b":" + opening
+    yield first_encoded
+    for encoded in items:
+        yield b","
+        yield encoded
+    yield closing
+
+
+def iter_document_json(
+    doc: DoclingDocument,
+    coord_precision: Optional[int] = None,
+    confid_precision: Optional[int] = None,
+) -> Iterator[bytes]:
+    """Yield the compact JSON encoding of ``doc`` in item-sized chunks.
+
+    Which fields are written, under which keys and how, is taken from the
+    document's own serializer, the large containers are only split into items.
+    """
+    context = _ser_context(coord_precision, confid_precision)
+
+    yield b"{"
+    first = True
+    for name in type(doc).model_fields:
+        chunks = _iter_field_json(doc, name, context)
+        head = next(chunks, None)
+        if head is None:
+            continue
+        yield head if first else b"," + head
+        first = False
+        yield from chunks
+    yield b"}"
+
+
+def write_document_json(
+    doc: DoclingDocument,
+    sink: Union[Path, str, BinaryIO],
+    compression: Compression = Compression.NONE,
+    indent: Optional[int] = None,
+    coord_precision: Optional[int] = None,
+    confid_precision: Optional[int] = None,
+) -> int:
+    """Stream ``doc`` as JSON to a path or binary stream.
+
+    Returns the number of bytes written to the sink (after compression).
+    With ``indent`` set the document is encoded in one piece instead.
+    """
+    with _open_sink(sink, compression) as (out, counter):
+        if indent is None:
+            buf = bytearray()
+            for chunk in iter_document_json(
+                doc,
+                coord_precision=coord_precision,
+                confid_precision=confid_precision,
+            ):
+                buf += chunk
+                if len(buf) >= _CHUNK_SIZE:
+                    out.write(buf)
+                    buf.clear()
+            if buf:
+                out.write(buf)
+        else:
+            context = _ser_context(coord_precision, confid_precision)
+            out.write(
+                pydantic_core.to_json(
+                    doc,
+                    indent=indent,
+                    by_alias=True,
+                    exclude_none=True,
+                    context=context or None,
+                )
+            )
+    return counter.written
+
+
+def write_document_markdown(
+    doc: DoclingDocument,
+    sink: Union[Path, str, BinaryIO],
+    compression: Compression = Compression.NONE,
+    **export_kwargs: Any,
+) -> int:
+    """Write ``doc.export_to_markdown(**export_kwargs)`` to a path or binary stream.
+
+    Returns the number of bytes written to the sink (after compression).
+    """
+    md = doc.export_to_markdown(**export_kwargs)
+    with _open_sink(sink, compression) as (out, counter):
+        data = md.encode("utf-8")
+        del md
+        view = memoryview(data)
+        for start in range(0, len(view), _CHUNK_SIZE):
+            out.write(view[start : start + _CHUNK_SIZE])
+    return counter.written
@@ -0,0 +1,289 @@
+"""Brokers handing the page shards of distributed conversions to workers.
+
+The coordinator stores the document once, submits one task per shard of
+consecutive pages and collects the serialized results. Workers claim tasks
+for the pipeline configuration they run; a claim is a lease, and the shard of
+a worker which died or went silent is handed out again once the lease
+expires, up to ``max_attempts`` times. Workers renew the lease with
+``heartbeat`` while they process a shard, and only the worker holding the lease
+can complete or fail it.
+
+``SqliteWorkBroker`` keeps everything in one SQLite database, for tests and
+for workers sharing a filesystem. Other brokers implement ``WorkBroker`` and
+are registered with ``register_broker`` under a URL scheme.
+"""
+
+import logging
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+_log = logging.getLogger(__name__)
+
+
+@dataclass
+class PageShard:
+    job_id: str
+    document_hash: str
+    options_hash: str
+    start: int  # first page_no
+    end: int  # page_no after the last page
+    shard_id: Optional[int] = None
+    worker_id: Optional[str] = None  # holder of the lease
+
+
+@dataclass
+class ShardOutcome:
+    shard: PageShard
+    result: Optional[bytes] = None
+    error: Optional[str] = None
+
+
+class WorkBroker(ABC):
+    @abstractmethod
+    def submit(self, document: bytes, shards: List[PageShard]) -> None:
+        """Store the document of the shards, unless it is already, and queue them."""
+
+    @abstractmethod
+    def get_document(self, document_hash: str) -> bytes:
+        pass
+
+    @abstractmethod
+    def claim(self, options_hash: str, worker_id: str) -> Optional[PageShard]:
+        """Lease the next shard for the pipeline configuration, None if none waits."""
+
+    @abstractmethod
+    def heartbeat(self, shard: PageShard) -> bool:
+        """Renew the lease of a claimed shard, False if the worker lost it."""
+
+    @abstractmethod
+    def complete(self, shard: PageShard, result: bytes) -> None:
+        """Store the result of a shard, ignored if the worker lost its lease."""
+
+    @abstractmethod
+    def fail(self, shard: PageShard, error: str) -> None:
+        """Give a shard back, it is retried until it runs out of attempts.
+
+        Ignored if the worker lost its lease.
+        """
+
+    @abstractmethod
+    def collect(self, job_id: str) -> List[ShardOutcome]:
+        """Take the shards of the job which completed or failed since the last call."""
+
+    @abstractmethod
+    def close_job(self, job_id: str) -> None:
+        """Drop the tasks left of the job, and its document once no job uses it."""
+
+
+class SqliteWorkBroker(WorkBroker):
+    def __init__(self, path: Path, lease: float = 600.0, max_attempts: int = 3):
+        self.path = Path(path).expanduser()
+        self.lease = lease
+        self.max_attempts = max_attempts
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS documents (
+                    document_hash TEXT PRIMARY KEY,
+                    data BLOB NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS shards (
+                    shard_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    job_id TEXT NOT NULL,
+                    document_hash TEXT NOT NULL,
+                    options_hash TEXT NOT NULL,
+                    start INTEGER NOT NULL,
+                    end INTEGER NOT NULL,
+                    state TEXT NOT NULL DEFAULT 'queued',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    lease_until REAL,
+                    worker_id TEXT,
+                    result BLOB,
+                    error TEXT
+                );
+                CREATE INDEX IF NOT EXISTS shards_claim
+                    ON shards (options_hash, state, shard_id);
+                CREATE INDEX IF NOT EXISTS shards_job ON shards (job_id, state);
+                """
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        db = sqlite3.connect(self.path, timeout=60.0, isolation_level=None)
+        try:
+            yield db
+        finally:
+            db.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._connect() as db:
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                yield db
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+            db.execute("COMMIT")
+
+    def get_document(self, document_hash: str) -> bytes:
+        with self._connect() as db:
+            row = db.execute(
+                "SELECT data FROM documents WHERE document_hash = ?", (document_hash,)
+            ).fetchone()
+        if row is None:
+            raise KeyError(f"Document {document_hash} is not in the broker")
+        return row[0]
+
+    def submit(self, document: bytes, shards: List[PageShard]) -> None:
+        with self._transaction() as db:
+            for document_hash in {shard.document_hash for shard in shards}:
+                db.execute(
+                    "INSERT OR IGNORE INTO documents (document_hash, data) VALUES (?, ?)",
+                    (document_hash, document),
+                )
+            for shard in shards:
+                cursor = db.execute(
+                    "INSERT INTO shards (job_id, document_hash, options_hash, start, end) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (
+                        shard.job_id,
+                        shard.document_hash,
+                        shard.options_hash,
+                        shard.start,
+                        shard.end,
+                    ),
+                )
+                shard.shard_id = cursor.lastrowid
+
+    def claim(self, options_hash: str, worker_id: str) -> Optional[PageShard]:
+        now = time.time()
+        with self._transaction() as db:
+            self._expire_leases(db, now)
+            row = db.execute(
+                "SELECT shard_id, job_id, document_hash, start, end FROM shards "
+                "WHERE options_hash = ? AND state = 'queued' "
+                "ORDER BY shard_id LIMIT 1",
+                (options_hash,),
+            ).fetchone()
+            if row is None:
+                return None
+            db.execute(
+                "UPDATE shards SET state = 'running', attempts = attempts + 1, "
+                "lease_until = ?, worker_id = ? WHERE shard_id = ?",
+                (now + self.lease, worker_id, row[0]),
+            )
+        shard_id, job_id, document_hash, start, end = row
+        return PageShard(
+            job_id=job_id,
+            document_hash=document_hash,
+            options_hash=options_hash,
+            start=start,
+            end=end,
+            shard_id=shard_id,
+            worker_id=worker_id,
+        )
+
+    def _expire_leases(self, db: sqlite3.Connection, now: float) -> None:
+        # Shards of workers which stopped answering are retried, or fail for good
+        db.execute(
+            "UPDATE shards SET state = CASE WHEN attempts < ? THEN 'queued' ELSE 'failed' END, "
+            "error = 'lease expired on worker ' || worker_id, worker_id = NULL "
+            "WHERE state = 'running' AND lease_until < ?",
+            (self.max_attempts, now),
+        )
+
+    def heartbeat(self, shard: PageShard) -> bool:
+        now = time.time()
+        with self._transaction() as db:
+            self._expire_leases(db, now)
+            cursor = db.execute(
+                "UPDATE shards SET lease_until = ? "
+                "WHERE shard_id = ? AND state = 'running' AND worker_id = ?",
+                (now + self.lease, shard.shard_id, shard.worker_id),
+            )
+        return cursor.rowcount > 0
+
+    def complete(self, shard: PageShard, result: bytes) -> None:
+        with self._transaction() as db:
+            cursor = db.execute(
+                "UPDATE shards SET state = 'done', result = ?, error = NULL "
+                "WHERE shard_id = ? AND state = 'running' AND worker_id = ?",
+                (result, shard.shard_id, shard.worker_id),
+            )
+        if cursor.rowcount == 0:
+            _log.warning(
+                f"Dropped the result of shard {shard.shard_id}, "
+                f"worker {shard.worker_id} lost its lease"
+            )
+
+    def fail(self, shard: PageShard, error: str) -> None:
+        with self._transaction() as db:
+            db.execute(
+                "UPDATE shards SET state = CASE WHEN attempts < ? THEN 'queued' ELSE 'failed' END, "
+                "error = ?, worker_id = NULL "
+                "WHERE shard_id = ? AND state = 'running' AND worker_id = ?",
+                (self.max_attempts, error, shard.shard_id, shard.worker_id),
+            )
+
+    def collect(self, job_id: str) -> List[ShardOutcome]:
+        with self._transaction() as db:
+            self._expire_leases(db, time.time())
+            rows = db.execute(
+                "SELECT shard_id, document_hash, options_hash, start, end, state, result, error "
+                "FROM shards WHERE job_id = ? AND state IN ('done', 'failed')",
+                (job_id,),
+            ).fetchall()
+            db.executemany(
+                "DELETE FROM shards WHERE shard_id = ?", [(row[0],) for row in rows]
+            )
+        return [
+            ShardOutcome(
+                shard=PageShard(
+                    job_id=job_id,
+                    document_hash=document_hash,
+                    options_hash=options_hash,
+                    start=start,
+                    end=end,
+                    shard_id=shard_id,
+                ),
+                result=result if state == "done" else None,
+                error=error if state == "failed" else None,
+            )
+            for shard_id, document_hash, options_hash, start, end, state, result, error in rows
+        ]
+
+    def close_job(self, job_id: str) -> None:
+        with self._transaction() as db:
+            db.execute("DELETE FROM shards WHERE job_id = ?", (job_id,))
+            db.execute(
+                "DELETE FROM documents WHERE document_hash NOT IN "
+                "(SELECT DISTINCT document_hash FROM shards)"
+            )
+
+
+_BROKERS: Dict[str, Callable[..., WorkBroker]] = {
+    "sqlite": lambda path, **kwargs: SqliteWorkBroker(Path(path), **kwargs),
+}
+
+
+def register_broker(scheme: str, factory: Callable[..., WorkBroker]) -> None:
+    """Make ``create_broker`` build ``factory(<rest of the url>, **kwargs)`` for ``scheme://`` URLs."""
+    _BROKERS[scheme] = factory
+
+
+def create_broker(url: str, **kwargs) -> WorkBroker:
+    """Broker of a URL, e.g. ``sqlite:///shared/docling/broker.db``."""
+    scheme, sep, rest = url.partition("://")
+    if not sep or scheme not in _BROKERS:
+        raise ValueError(
+            f"Unsupported broker URL {url!r}, expected one of the schemes: {', '.join(_BROKERS)}"
+        )
+    return _BROKERS[scheme](rest, **kwargs)